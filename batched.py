@@ -0,0 +1,164 @@
+import math
+from typing import List, Literal
+
+import numpy as np
+
+from definitions import InputListScaled, SimulationSummary
+
+# Lockstep engine for many small workloads at once (FCFS and RR only, no LTS/MTS, locks or DVFS).
+## K independent workloads are kept in K x N NumPy arrays (N: the largest workload, shorter ones are padded) and
+## advanced together: every step dispatches one process in every workload that still has work, with masked vector
+## operations instead of a Python loop per tick and per workload.
+## A step covers a whole dispatch (CS_LOAD, the slice, CS_SAVE), the same result the tick loop gets tick by tick:
+### - arrivals (at <= now) join the ready queue before a process that comes back from its CS_SAVE at the same time;
+### - an empty ready queue idles until the next arrival;
+### - every dispatch costs ceil(cs/2) ticks of load and ceil(cs/2) ticks of save, also a process switching to itself.
+## The ready queue of every workload is a ring buffer of N slots (a process is queued at most once).
+
+BatchAlgo = Literal["FCFS", "RR"]
+NEVER = np.iinfo(np.int64).max // 4 # arrival time of the padding
+
+
+def simulate_batch(workloads: List[InputListScaled], q: int, cs: int, algorithm: BatchAlgo = "RR") -> List[SimulationSummary]:
+    """
+    Runs the algorithm on every workload (times in ticks, as scaled for the Scheduler) and returns one summary per
+    workload, the same metrics Scheduler.summarize() gives for a run of that workload.
+    """
+    if algorithm not in ("FCFS", "RR"):
+        raise ValueError(f"The batched engine runs FCFS or RR. Got: {algorithm}")
+    if q <= 0 or cs < 0:
+        raise ValueError(f"Quantum Time (q) must be positive and Context-Switch Time (cs) non-negative. Got: q={q}, cs={cs}")
+    if not workloads or any(len(workload) == 0 for workload in workloads):
+        raise ValueError("Every workload needs at least one process")
+    k = len(workloads)
+    n = np.array([len(workload) for workload in workloads], dtype=np.int64)
+    width = int(n.max())
+    # one extra column of padding, so next_arrival can always be used as an index
+    arrival = np.full((k, width + 1), NEVER, dtype=np.int64)
+    burst = np.zeros((k, width + 1), dtype=np.int64)
+    for w, workload in enumerate(workloads):
+        ordered = sorted(workload, key=lambda item: item[0]) # same (stable) order as the Scheduler, pid = rank
+        arrival[w, :len(ordered)] = [item[0] for item in ordered]
+        burst[w, :len(ordered)] = [item[1] for item in ordered]
+
+    half_cs = math.ceil(cs / 2) # ticks of CS_LOAD and of CS_SAVE
+    remaining = burst.copy()
+    ready_since = np.zeros_like(arrival)
+    wait_time = np.zeros_like(arrival)
+    response_time = np.full_like(arrival, -1)
+    completion_time = np.zeros_like(arrival)
+    context_switches = np.zeros(k, dtype=np.int64)
+    # ready queues
+    ring = np.zeros((k, width), dtype=np.int64)
+    head = np.zeros(k, dtype=np.int64)
+    size = np.zeros(k, dtype=np.int64)
+
+    rows = np.arange(k)
+    now = np.zeros(k, dtype=np.int64)
+    next_arrival = np.zeros(k, dtype=np.int64)
+    active = np.ones(k, dtype=bool)
+
+    def enqueue(r: np.ndarray, pid: np.ndarray, since: np.ndarray) -> None:
+        ring[r, (head[r] + size[r]) % width] = pid
+        size[r] += 1
+        ready_since[r, pid] = since
+
+    def admit() -> None:
+        # arrivals up to now, one per workload and round (the rounds only repeat for workloads with several of them)
+        while True:
+            r = rows[active & (arrival[rows, next_arrival] <= now)]
+            if r.size == 0:
+                return
+            pid = next_arrival[r]
+            enqueue(r, pid, arrival[r, pid])
+            next_arrival[r] += 1
+
+    while True:
+        admit()
+        empty = active & (size == 0)
+        active &= ~(empty & (next_arrival >= n)) # done
+        idle = rows[empty & active]
+        now[idle] = arrival[idle, next_arrival[idle]] # IDLE until the next arrival
+        admit()
+        r = rows[active]
+        if r.size == 0:
+            break
+        # dispatch the head of every ready queue
+        pid = ring[r, head[r]]
+        head[r] = (head[r] + 1) % width
+        size[r] -= 1
+        wait_time[r, pid] += now[r] - ready_since[r, pid]
+        context_switches[r] += 1
+        start = now[r] + half_cs
+        first = response_time[r, pid] < 0
+        response_time[r[first], pid[first]] = start[first] - arrival[r[first], pid[first]]
+        ticks = remaining[r, pid] if algorithm == "FCFS" else np.minimum(q, remaining[r, pid])
+        remaining[r, pid] -= ticks
+        now[r] = start + ticks + half_cs # end of the CS_SAVE
+        admit() # arrivals during the dispatch go first
+        back = remaining[r, pid] > 0
+        enqueue(r[back], pid[back], now[r[back]])
+        completion_time[r[~back], pid[~back]] = now[r[~back]]
+
+    # metrics (padding excluded)
+    valid = np.arange(width + 1)[None, :] < n[:, None]
+    turnaround = np.where(valid, completion_time - arrival, 0)
+    makespan = np.where(valid, completion_time, 0).max(axis=1)
+    busy_time = burst.sum(axis=1)
+    cs_time = 2 * half_cs * context_switches
+    ordered_response = np.sort(np.where(valid, response_time, NEVER), axis=1)
+    rank = np.maximum(1, -(-n * 95 // 100)) # nearest rank, as definitions.percentile
+    p95 = ordered_response[rows, rank - 1]
+
+    summaries: List[SimulationSummary] = []
+    for w in range(k):
+        count, span = int(n[w]), int(makespan[w])
+        summaries.append(SimulationSummary(
+            algorithm=algorithm,
+            n=count,
+            makespan=span,
+            avg_turnaround_time=float(turnaround[w].sum()) / count,
+            avg_wait_time=float(wait_time[w].sum()) / count,
+            avg_response_time=float(np.where(valid[w], response_time[w], 0).sum()) / count,
+            throughput=count / span if span > 0 else 0.0,
+            cpu_utilization=float(busy_time[w]) / span if span > 0 else 0.0,
+            context_switches=int(context_switches[w]),
+            cs_overhead=float(cs_time[w]) / span if span > 0 else 0.0,
+            p95_response_time=int(p95[w]),
+        ))
+    return summaries
+
+
+if __name__ == "__main__":
+    import io
+    import contextlib
+    import random
+    import time
+    from definitions import SchedulerMode
+    from main import Scheduler
+
+    rng = random.Random(5)
+    batch: List[InputListScaled] = []
+    for _ in range(2000):
+        arrival_time = 0
+        workload = []
+        for _ in range(rng.randint(10, 50)):
+            arrival_time += rng.randint(0, 8)
+            workload.append((arrival_time, rng.randint(1, 12)))
+        batch.append(workload)
+    q, cs = 3, 1
+    for algorithm in ("FCFS", "RR"):
+        started = time.perf_counter()
+        batched = simulate_batch(batch, q, cs, algorithm)
+        batched_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        expected = []
+        for workload in batch:
+            scheduler = Scheduler([list(item) for item in workload], cs, q, SchedulerMode.STANDARD)
+            with contextlib.redirect_stdout(io.StringIO()):
+                scheduler.all_algorithms[algorithm]()
+            expected.append(scheduler.summarize())
+        scheduler_seconds = time.perf_counter() - started
+        mismatches = sum(1 for a, b in zip(batched, expected) if a != b)
+        print(f"{algorithm}: {len(batch)} workloads, batched {batched_seconds:.2f}s, Scheduler {scheduler_seconds:.2f}s (x{scheduler_seconds / batched_seconds:.1f}), {mismatches} mismatches")
@@ -0,0 +1,93 @@
+import random
+import time
+from typing import List, Optional, Tuple
+
+from definitions import (
+    InputList, STSAlgo, SimulationSummary, PreemptionConfig,
+    validate_input_and_determine_scheduler_mode, scale_input_time
+)
+from main import Scheduler
+
+# Runs several algorithms on the same input and compares their metrics side by side.
+## Usage: python benchmark.py (random workload), or compare_algorithms(...) from your own script.
+
+
+def compare_algorithms(input_list: InputList, q: float, cs: float, algorithms: List[STSAlgo], **scheduler_options) -> List[Tuple[SimulationSummary, float]]:
+    """
+    Validates, scales and decodes the input once, then runs the algorithms on it one after the other (the scheduler keeps the decoded input between runs).
+    Returns (summary, wall-clock seconds of its run) per algorithm, times in the summary are in ticks.
+    scheduler_options are passed to the Scheduler (lts, mts, cfs, ...).
+    """
+    scheduler_mode = validate_input_and_determine_scheduler_mode(data_list=input_list, q=q, cs=cs)
+    (data_list_scaled, q_scaled, cs_scaled, time_scale) = scale_input_time(data_list=input_list, q=q, cs=cs, scheduler_mode=scheduler_mode, max_precision=4)
+    scheduler = Scheduler(data_list_scaled, cs_scaled, q_scaled, scheduler_mode, time_scale=time_scale, **scheduler_options)
+
+    for algo in algorithms: # all of them before the first run
+        scheduler.check_algorithm(algo)
+    results: List[Tuple[SimulationSummary, float]] = []
+    for algo in algorithms:
+        started = time.perf_counter()
+        scheduler.all_algorithms[algo]()
+        results.append((scheduler.summarize(), time.perf_counter() - started))
+    print_comparison(results, time_scale)
+    return results
+
+
+def compare_preemption_thresholds(input_list: InputList, q: float, cs: float, gain_factors: List[Optional[float]], algorithm: STSAlgo = "SRTF", min_granularity: Optional[int] = None, **scheduler_options) -> List[Tuple[Optional[float], SimulationSummary]]:
+    """
+    Runs the algorithm once per preemption gain factor (None: no hysteresis) and prints context-switch overhead next to
+    throughput and response time, to pick the threshold that keeps the most useful CPU time.
+    min_granularity is in ticks (see PreemptionConfig).
+    """
+    scheduler_mode = validate_input_and_determine_scheduler_mode(data_list=input_list, q=q, cs=cs)
+    (data_list_scaled, q_scaled, cs_scaled, time_scale) = scale_input_time(data_list=input_list, q=q, cs=cs, scheduler_mode=scheduler_mode, max_precision=4)
+
+    results: List[Tuple[Optional[float], SimulationSummary]] = []
+    for gain_factor in gain_factors:
+        preemption = PreemptionConfig(gain_factor=gain_factor, min_granularity=min_granularity) if gain_factor is not None else None
+        scheduler = Scheduler([list(item) for item in data_list_scaled], cs_scaled, q_scaled, scheduler_mode, time_scale=time_scale, preemption=preemption, **scheduler_options)
+        scheduler.all_algorithms[algorithm]()
+        results.append((gain_factor, scheduler.summarize()))
+
+    print(f"\n{'='*25} {algorithm} PREEMPTION THRESHOLDS {'='*25}")
+    print(f"{'K (x CS)':<9} {'CS':<7} {'CS OVH':<8} {'CPU UTIL':<9} {'THROUGHPUT':<11} {'AVG TAT':<9} {'AVG RT':<9}")
+    print("-" * 66)
+    for gain_factor, summary in results:
+        print(f"{'-' if gain_factor is None else gain_factor:<9} {summary.context_switches:<7} {summary.cs_overhead:<8.2%} {summary.cpu_utilization:<9.2%} {summary.throughput * time_scale:<11.4f} {summary.avg_turnaround_time / time_scale:<9.2f} {summary.avg_response_time / time_scale:<9.2f}")
+    return results
+
+
+def print_comparison(results: List[Tuple[SimulationSummary, float]], time_scale: int = 1) -> None:
+    def fmt(t: Optional[float]) -> str:
+        if t is None: # no first dispatch (processor sharing)
+            return "n/a"
+        val = t / time_scale
+        return f"{val:.0f}" if float(val).is_integer() else f"{val:.2f}"
+
+    print(f"\n{'='*30} ALGORITHM COMPARISON {'='*30}")
+    print(f"{'ALGO':<8} {'AVG TAT':<9} {'AVG WT':<9} {'AVG RT':<9} {'P95 RT':<9} {'MAKESPAN':<9} {'THROUGHPUT':<11} {'CPU UTIL':<9} {'CS':<7} {'CS OVH':<8} {'SIM SEC':<8}")
+    print("-" * 101)
+    for summary, elapsed in results:
+        throughput = summary.throughput * time_scale # processes per input time unit
+        print(f"{str(summary.algorithm):<8} {fmt(summary.avg_turnaround_time):<9} {fmt(summary.avg_wait_time):<9} {fmt(summary.avg_response_time):<9} {fmt(summary.p95_response_time):<9} {fmt(summary.makespan):<9} {throughput:<11.4f} {summary.cpu_utilization:<9.2%} {summary.context_switches:<7} {summary.cs_overhead:<8.2%} {elapsed:<8.3f}")
+    if any(summary.energy is not None for summary, _ in results):
+        print(f"\n{'ALGO':<8} {'ENERGY':<10} {'AVG FREQ':<9} {'AVG TAT':<9}")
+        print("-" * 40)
+        for summary, _ in results:
+            print(f"{str(summary.algorithm):<8} {summary.energy / time_scale:<10.2f} {summary.avg_frequency:<9.0f} {fmt(summary.avg_turnaround_time):<9}")
+    if any(summary.with_deadline for summary, _ in results):
+        print(f"\n{'ALGO':<8} {'DEADLINE MISSES':<16} {'MAX TARDINESS':<14}")
+        print("-" * 40)
+        for summary, _ in results:
+            print(f"{str(summary.algorithm):<8} {f'{summary.deadline_misses}/{summary.with_deadline}':<16} {fmt(summary.max_tardiness):<14}")
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    workload: InputList = []
+    arrival = 0
+    for _ in range(200):
+        arrival += rng.randint(0, 6)
+        workload.append([arrival, rng.choice([rng.randint(1, 4), rng.randint(10, 40)])]) # interactive-ish and CPU-bound bursts
+    compare_algorithms(workload, q=4, cs=1, algorithms=["RR", "ARR", "MLFQ", "CFS"])
+    compare_preemption_thresholds(workload, q=4, cs=1, gain_factors=[None, 1, 2, 4, 8])
@@ -1,6 +1,7 @@
 from enum import Enum, auto
 from typing import Literal, Union, List, Dict, Tuple, Set, Any, Union, Optional
 from dataclasses import dataclass, field
+import heapq
 # Enumeration: It is a way to define a fixed set of named values that belong together. (.name, .value)
 # dataclass, field: better syntax, easier to implement types.
 ## field: "The core problem: mutable defaults are dangerous" and dataclasses.field() gives you more control.
@@ -29,6 +30,7 @@ class ProcessState(Enum):
     RUNNING = auto()
     WAITING = auto()
     TERMINATED = auto()
+    SUSPENDED_READY = auto() # swapped out by the medium-term scheduler, READY again once swapped back in
 @dataclass
 class Process:
     # MANDATORY FIELDS (No defaults)
@@ -38,6 +40,16 @@ class Process:
     _process_ready_queue_id: int = field(init=False)
 
     category: ProcessCategory | None = None # If the category isn't None, then we only wanna see the output for MLQ
+    category_name: str | None = None # the category as written in the input (can be an MLQ layout alias), picks the MLQ level
+    memory_size: int = 0 # memory units the process holds from admission until it terminates (only used by the LTS)
+    deadline: int | None = None # absolute deadline in ticks (EDF, deadline metrics), None: no deadline
+    group: str | None = None # owner (user/tenant) from the optional 5th input column (FAIR_SHARE, per-group metrics)
+    critical_sections: List["CriticalSection"] = field(default_factory=list) # in order of offset, see Scheduler.critical_sections
+    priority: int = 0 # static (base) priority, higher runs first (PRIORITY, PRIORITY_P), see BASE_PRIORITY
+    aged_priority: float = 0.0 # PRIORITY_P: effective priority (with aging) it was dispatched with
+    level_time_used: int = 0 # MLFQ: time run at the current level (allotment), valid if boost_epoch is current
+    boost_epoch: int = 0
+    level_epoch: int = 0 # MLFQ: boosts so far when its level was last set, older: it sat out a boost (WAITING, swapped out)
     
     # 3. DYNAMIC / INTERNAL FIELDS (init=False)
     remaining_time: int = field(init=False)  # Will be set to burst_time in __post_init__
@@ -49,10 +61,32 @@ class Process:
     start_time: int = -1  # When first started(state changed to running for the first time), in ticks
     response_time: int = -1  # start_time (First CPU time) - arrival_time, in ticks
     completion_time: int = -1  # When finished
+    admission_time: int = -1  # When the long-term scheduler moved it from the job pool into a ready queue
+    memory_address: int = -1  # Start of its memory block (only if the LTS uses an allocator)
+    swap_count: int = 0  # How many times the medium-term scheduler swapped it out
+    suspended_time: int = 0  # Time spent swapped out (swap-out start -> swap-in done), in ticks
+    suspend_start_time: int = -1
+    ready_since: int = -1  # When it (re)entered a ready queue, wait_time is added when it leaves
+    vruntime: float = 0.0  # CFS: weighted CPU time received, in ticks of a weight-1024 process
+    stride_pass: int = 0  # STRIDE: virtual time, grows by the stride on every tick it runs
+    work_credit: int = 0  # DVFS: work done towards the next tick of remaining_time, in frequency units (see Scheduler._execute)
+    in_ready_queue: bool = False  # queued right now (not loading/running/saving, blocked or swapped out)
+    # Locks
+    section_index: int = 0  # next critical section to enter (or the one being held)
+    holding: str | None = None  # resource it holds right now
+    blocked_since: int = -1
+    lock_wait_time: int = 0  # time spent WAITING on locks, in ticks
+    inherited_from: Tuple[int, float, int] | None = None  # priority inheritance: (priority, aged_priority, level) to restore on release
 
     def __post_init__(self) -> None:
         self.remaining_time = self.burst_time
         self.state = ProcessState.NEW
+
+    def clone(self) -> "Process":
+        """Field by field copy without going through __init__ (fresh processes from a template that hasn't run, see Scheduler._process_templates)."""
+        proc = object.__new__(Process)
+        proc.__dict__.update(self.__dict__)
+        return proc
     
     @property
     def process_ready_queue_id(self) -> int:
@@ -76,10 +110,14 @@ InputProcessCategory = Literal["BATCH", "INTERACTIVE", "SYSTEM", "REAL_TIME"]
 
 InputProcessNoCategory = Tuple[float, float] # at, cbt
 InputProcessWithCategory = Tuple[float, float, InputProcessCategory] # at, cbt, category (MLQ)
+InputProcessWithDeadline = Tuple[float, float, InputProcessCategory | None, float | None] # at, cbt, category (None: STANDARD), absolute deadline (None: no deadline)
+InputProcessWithGroup = Tuple[float, float, InputProcessCategory | None, float | None, str | None] # ..., group (user/tenant, FAIR_SHARE)
 
 InputList = Union[
     List[InputProcessNoCategory],
-    List[InputProcessWithCategory]
+    List[InputProcessWithCategory],
+    List[InputProcessWithDeadline],
+    List[InputProcessWithGroup]
     ]
 
 def validate_input_and_determine_scheduler_mode(
@@ -106,8 +144,15 @@ def validate_input_and_determine_scheduler_mode(
             raise ValueError(f"Unknown input format in 3rd column: {first_item[2]}")
     elif item_len == 2:
         mode = SchedulerMode.STANDARD  # Explicitly set default mode for 2-item case
+    elif item_len in (4, 5): # 4th column: deadline, 5th column: group
+        if isinstance(first_item[2], str):
+            mode = SchedulerMode.MLQ
+        elif first_item[2] is None:
+            mode = SchedulerMode.STANDARD
+        else:
+            raise ValueError(f"Unknown input format in 3rd column: {first_item[2]}")
     else:
-        raise ValueError(f"Invalid input format. Item length must be 2 or 3. Got: {item_len}")
+        raise ValueError(f"Invalid input format. Item length must be 2, 3, 4 or 5. Got: {item_len}")
 
     # 4. Validate All Elements in List
     for i, item in enumerate(data_list):
@@ -118,6 +163,16 @@ def validate_input_and_determine_scheduler_mode(
             raise ValueError(f"Item at index {i}: Arrival Time must be non-negative. Got: {at}")
         if cbt <= 0:
             raise ValueError(f"Item at index {i}: CPU Burst Time must be positive. Got: {cbt}")
+        if len(item) != item_len:
+            raise ValueError(f"Item at index {i}: all items must have the same format. Got length {len(item)}, expected: {item_len}")
+        if item_len >= 4:
+            if (item[2] is None) != (mode is SchedulerMode.STANDARD):
+                raise ValueError(f"Item at index {i}: category must be given for every process or for none. Got: {item[2]}")
+            deadline = item[3]
+            if deadline is not None and deadline <= at:
+                raise ValueError(f"Item at index {i}: Deadline must be after the Arrival Time. Got: {deadline}")
+        if item_len == 5 and item[4] is not None and not isinstance(item[4], str):
+            raise ValueError(f"Item at index {i}: Group must be a name (or None). Got: {item[4]}")
 
     return mode
     
@@ -125,9 +180,13 @@ def validate_input_and_determine_scheduler_mode(
 ## Let's scale the time, so smallest meaningful unit of time becomes 1 tick.
 InputProcessNoCategoryScaled = Tuple[int, int] # at, cbt
 InputProcessWithCategoryScaled = Tuple[int, int, InputProcessCategory] # at, cbt, category (MLQ)
+InputProcessWithDeadlineScaled = Tuple[int, int, InputProcessCategory | None, int | None] # at, cbt, category, deadline
+InputProcessWithGroupScaled = Tuple[int, int, InputProcessCategory | None, int | None, str | None] # at, cbt, category, deadline, group
 InputListScaled = Union[
     List[InputProcessNoCategoryScaled],
-    List[InputProcessWithCategoryScaled]
+    List[InputProcessWithCategoryScaled],
+    List[InputProcessWithDeadlineScaled],
+    List[InputProcessWithGroupScaled]
 ]
 
 # --- Helper to calculate decimals ---
@@ -152,7 +211,8 @@ def scale_input_time(
     q: float, 
     cs: float,
     scheduler_mode: SchedulerMode,
-    max_precision: int = 5
+    max_precision: int = 5,
+    verbose: bool = True # print the chosen scale and the scaled list
 ) -> Tuple[InputListScaled, int, int]: # Returns (scaled_list, scaled_q, scaled_cs)
     
     # 1. Collect all Time-Related values to find max precision
@@ -161,6 +221,8 @@ def scale_input_time(
     for item in data_list:
         time_values.append(item[0]) # at
         time_values.append(item[1]) # cbt
+        if len(item) >= 4 and item[3] is not None:
+            time_values.append(item[3]) # deadline
 
     # 2. Determine Max Decimal Places
     max_decimals = 0
@@ -188,14 +250,19 @@ def scale_input_time(
         cbt_scaled = int(round(item[1] * TIME_SCALE))
         
         # Reconstruct the tuple/list based on Scheduler mode
-        if scheduler_mode is SchedulerMode.STANDARD:
+        if len(item) >= 4:
+            # (at, cbt, category, deadline[, group]) - category stays as is (None in STANDARD mode), so does the group
+            deadline_scaled = int(round(item[3] * TIME_SCALE)) if item[3] is not None else None
+            scaled_list.append((at_scaled, cbt_scaled, item[2], deadline_scaled) + tuple(item[4:]))
+        elif scheduler_mode is SchedulerMode.STANDARD:
             scaled_list.append((at_scaled, cbt_scaled))
         elif scheduler_mode is SchedulerMode.MLQ:
             # MLQ Mode: (at, cbt, category) - Category is string, keep as is
             scaled_list.append((at_scaled, cbt_scaled, item[2]))
 
-    print(f"[DEBUG] Automatic Time Scale: {TIME_SCALE} (Max decimals: {max_decimals})")
-    print(f"[DEBUG] Scaled List: {scaled_list}")
+    if verbose:
+        print(f"[DEBUG] Automatic Time Scale: {TIME_SCALE} (Max decimals: {max_decimals})")
+        print(f"[DEBUG] Scaled List: {scaled_list}")
     
     return scaled_list, q_scaled, cs_scaled, TIME_SCALE
 
@@ -209,10 +276,14 @@ class SystemState(Enum):
     EXECUTING  = "EXECUTING"
 class ProcessEvents(Enum): # start_time  = end_time
     PROCESS_ARRIVAL = "PROCESS_ARRIVAL"
+    PROCESS_ADMITTED = "PROCESS_ADMITTED" # job pool -> ready queue (only logged if a long-term scheduler is configured)
+    PROCESS_SWAPPED_IN = "PROCESS_SWAPPED_IN" # swap area -> ready queue (medium-term scheduler)
+    PROCESS_BLOCKED = "PROCESS_BLOCKED" # running -> WAITING on a held lock
+    PROCESS_UNBLOCKED = "PROCESS_UNBLOCKED" # got the lock handed over, WAITING -> ready queue
 
 
 # --- Logging Data Structure ---
-STSAlgo=Literal["FCFS", "SPN", "HRRN", "SRTF", "RR", "MLQ", "MLFQ"]
+STSAlgo=Literal["FCFS", "SPN", "HRRN", "SRTF", "RR", "ARR", "MLQ", "MLFQ", "CFS", "STRIDE", "LOTTERY", "EDF", "PRIORITY", "PRIORITY_P", "FAIR_SHARE"]
 @dataclass
 class SimulationLog:
     algorithm: STSAlgo | None
@@ -222,11 +293,496 @@ class SimulationLog:
     event_type: Union[ProcessEvents, SystemState]
 
 
+@dataclass
+class SimulationSummary:
+    # times in ticks
+    algorithm: STSAlgo | None
+    n: int
+    makespan: int # completion time of the last process
+    avg_turnaround_time: float
+    avg_wait_time: float
+    avg_response_time: float | None # None: no first dispatch (processor sharing)
+    throughput: float # processes per tick
+    cpu_utilization: float # EXECUTING time / makespan
+    context_switches: int # number of (started) loads
+    cs_overhead: float = 0.0 # CS_LOAD + CS_SAVE time / makespan (aborted loads included)
+    p95_response_time: float | None = 0.0 # tail latency of the first dispatch, None: no first dispatch (processor sharing)
+    p95_response_time_per_category: Dict[str, float] = field(default_factory=dict) # MLQ input only
+    # deadlines (only processes that have one)
+    with_deadline: int = 0
+    deadline_misses: int = 0 # completed after the deadline
+    max_tardiness: int = 0 # max(0, completion - deadline)
+    # groups (only if the input has a group column)
+    cpu_share_per_group: Dict[str, float] = field(default_factory=dict) # EXECUTING time of the group / all EXECUTING time
+    group_fairness: float | None = None # Jain's index of the group shares relative to their weights (1: perfectly fair)
+    # DVFS (only with a frequency model)
+    energy: float | None = None # power x ticks
+    avg_frequency: float | None = None # time-weighted
+    # locks (only with critical sections)
+    avg_lock_wait_time: float = 0.0 # WAITING on locks, per process
+    lock_convoys: int = 0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in [0, 100]) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100)) # ceil(n * pct / 100), at least the first one
+    return ordered[int(rank) - 1]
+
+
+def jain_index(values: List[float]) -> float:
+    """Jain's fairness index of a non-empty list: (sum x)^2 / (n * sum x^2), 1 when all are equal, 1/n when one gets everything."""
+    squares = sum(x * x for x in values)
+    return sum(values) ** 2 / (len(values) * squares) if squares > 0 else 1.0
+
+
 # Ready Queue
 @dataclass
 class QueueLevel():
     algo: STSAlgo
-    queue: List[Process]
-    category: ProcessCategory | None = None
+    queue: List[Process] # or a policy-specific queue (see policies.py)
+    categories: Tuple[str, ...] = () # input category names served by this level (MLQ), see MLQLayout
+    share: int | None = None # CPU share between the levels (MLQ with deficit round robin), None: strict priority
     q: int | None = None # only if algorithm is preemptive
-    new_event_occurred: bool = False
+
+
+# Engine state of a run in progress (the tick loop's own variables), see Scheduler._fork and Scheduler.resume_checkpoint
+## Together with the Scheduler it was taken from, it is everything needed to continue the run from where it was.
+@dataclass
+class EngineState:
+    algorithm: STSAlgo
+    ready_queue: List[QueueLevel]
+    feedback: "MLFQConfig | None"
+    feedback_queues: Any # policies.FeedbackQueues | None
+    category_level: Dict[str, int]
+    system_state: SystemState
+    current_process: Process | None
+    outgoing_process: Process | None
+    cs_progress: float
+    current_quantum_counter: int
+    current_quantum_limit: int | None
+    segment_start_time: int
+    next_arrival_idx: int
+    completed_count: int
+    next_boost_time: int | None
+
+    @classmethod
+    def capture(cls, variables: Dict[str, Any]) -> "EngineState":
+        """From the tick loop's locals()."""
+        return cls(**{name: variables[name] for name in cls.__dataclass_fields__})
+
+## Checkpoints of long runs: the scheduler and its engine state, written to `path` (replaced every time) during the run.
+@dataclass
+class CheckpointConfig:
+    path: str
+    interval: int | None = None # every `interval` ticks of simulated time
+    interval_seconds: float | None = None # and/or every `interval_seconds` of wall-clock time
+
+    def __post_init__(self) -> None:
+        if self.interval is None and self.interval_seconds is None:
+            raise ValueError("A checkpoint needs an interval (ticks) or an interval_seconds (wall-clock)")
+        if (self.interval is not None and self.interval <= 0) or (self.interval_seconds is not None and self.interval_seconds <= 0):
+            raise ValueError(f"Checkpoint intervals must be positive. Got: interval={self.interval}, interval_seconds={self.interval_seconds}")
+
+
+# Long-Term Scheduler (job pool in front of the ready queues)
+LTSAlgo = Literal["FCFS", "SJF", "PRIORITY"]
+## PRIORITY admits by category, higher base priority first (REAL_TIME > SYSTEM > INTERACTIVE > BATCH), then by arrival.
+
+## Memory allocation model behind admission (see memory.py)
+AllocStrategy = Literal["FIRST_FIT", "BEST_FIT", "NEXT_FIT", "BUDDY"]
+
+@dataclass
+class LTSConfig:
+    algo: LTSAlgo = "FCFS"
+    memory_capacity: int | None = None # None: memory is not a constraint
+    max_multiprogramming: int | None = None # max number of admitted (not yet terminated) processes, None: no limit
+    allocator: AllocStrategy | None = None # None: memory is a single counter, otherwise every process needs one contiguous free block
+
+    def __post_init__(self) -> None:
+        if self.algo not in ("FCFS", "SJF", "PRIORITY"):
+            raise ValueError(f"Unknown LTS algorithm: {self.algo}")
+        if self.allocator is not None:
+            if self.allocator not in ("FIRST_FIT", "BEST_FIT", "NEXT_FIT", "BUDDY"):
+                raise ValueError(f"Unknown allocation strategy: {self.allocator}")
+            if self.memory_capacity is None:
+                raise ValueError("An allocator needs a memory capacity")
+            if self.allocator == "BUDDY" and self.memory_capacity & (self.memory_capacity - 1) != 0:
+                raise ValueError(f"The buddy allocator needs a power-of-two memory capacity. Got: {self.memory_capacity}")
+        if self.memory_capacity is not None and self.memory_capacity <= 0:
+            raise ValueError(f"Memory capacity must be positive. Got: {self.memory_capacity}")
+        if self.max_multiprogramming is not None and self.max_multiprogramming < 1:
+            raise ValueError(f"Degree of multiprogramming must be at least 1. Got: {self.max_multiprogramming}")
+
+@dataclass
+class JobPool:
+    # NEW processes waiting for admission, kept in a heap ordered by the LTS algorithm.
+    algo: LTSAlgo
+    pool: List[Tuple[Tuple, Process]] = field(default_factory=list)
+
+    def _key(self, p: Process) -> Tuple:
+        if self.algo == "SJF":
+            return (p.burst_time, p.arrival_time, p.pid)
+        if self.algo == "PRIORITY":
+            priority = p.category.value if p.category is not None else 0
+            return (-priority, p.arrival_time, p.pid)
+        return (p.arrival_time, p.pid) # FCFS
+
+    def push(self, p: Process) -> None:
+        heapq.heappush(self.pool, (self._key(p), p))
+
+    def peek(self) -> Process | None:
+        return self.pool[0][1] if self.pool else None
+
+    def pop(self) -> Process:
+        return heapq.heappop(self.pool)[1]
+
+    def __len__(self) -> int:
+        return len(self.pool)
+
+
+# Medium-Term Scheduler (swapping under memory pressure)
+MTSVictim = Literal["LARGEST", "LONGEST_REMAINING", "LOWEST_PRIORITY"]
+
+@dataclass
+class MTSConfig:
+    victim: MTSVictim = "LARGEST" # which READY process gets swapped out first
+    swap_cost: int = 0 # ticks per swap transfer (one transfer at a time)
+
+    def __post_init__(self) -> None:
+        if self.victim not in ("LARGEST", "LONGEST_REMAINING", "LOWEST_PRIORITY"):
+            raise ValueError(f"Unknown victim selection policy: {self.victim}")
+        if self.swap_cost < 0:
+            raise ValueError(f"Swap cost must be non-negative. Got: {self.swap_cost}")
+
+
+# DVFS: frequency levels of the CPU and a governor that picks the level
+## Burst times are measured at the highest frequency, at frequency f a tick of EXECUTING does f / f_max of a tick of work.
+## PERFORMANCE: always the highest level, POWERSAVE: always the lowest,
+## ONDEMAND: every sampling_period, the highest level if the CPU was busy (not IDLE) more than up_threshold of the period,
+## otherwise the lowest level that would bring the busy fraction back under up_threshold.
+## A frequency change stalls execution for transition_latency ticks. Context switches take the same time at every frequency.
+DVFSGovernor = Literal["PERFORMANCE", "POWERSAVE", "ONDEMAND"]
+
+@dataclass
+class DVFSConfig:
+    frequencies: List[int] # e.g. MHz, ascending
+    governor: DVFSGovernor = "ONDEMAND"
+    transition_latency: int = 0 # in ticks
+    sampling_period: int | None = None # in ticks (ONDEMAND), None: 10q
+    up_threshold: float = 0.8
+    # power model: busy = idle_power + (max_power - idle_power) * (f / f_max)^3 (dynamic power ~ V^2 f, V ~ f), idle = idle_power
+    max_power: float = 1.0
+    idle_power: float = 0.1
+
+    def __post_init__(self) -> None:
+        if not self.frequencies:
+            raise ValueError("DVFS needs at least one frequency level")
+        if any(f <= 0 for f in self.frequencies) or any(a >= b for a, b in zip(self.frequencies, self.frequencies[1:])):
+            raise ValueError(f"Frequencies must be positive and strictly ascending. Got: {self.frequencies}")
+        if self.governor not in ("PERFORMANCE", "POWERSAVE", "ONDEMAND"):
+            raise ValueError(f"Unknown governor: {self.governor}. Known: PERFORMANCE, POWERSAVE, ONDEMAND")
+        if self.transition_latency < 0:
+            raise ValueError(f"Transition latency must be non-negative. Got: {self.transition_latency}")
+        if self.sampling_period is not None and self.sampling_period <= 0:
+            raise ValueError(f"Sampling period must be positive. Got: {self.sampling_period}")
+        if not 0 < self.up_threshold <= 1:
+            raise ValueError(f"Up threshold must be in (0, 1]. Got: {self.up_threshold}")
+        if self.max_power <= 0 or not 0 <= self.idle_power <= self.max_power:
+            raise ValueError(f"Power model needs max_power > 0 and 0 <= idle_power <= max_power. Got: {self.max_power}, {self.idle_power}")
+
+
+# Shared-resource locks
+## A critical section: after `offset` ticks of its own CPU time the process needs `resource` for the next `duration` ticks of CPU time.
+## A held lock blocks it (WAITING, FIFO per resource) until the owner leaves its section and hands the lock over.
+@dataclass
+class CriticalSection:
+    resource: str
+    offset: int # in ticks of executed time
+    duration: int # in ticks of executed time
+
+    def __post_init__(self) -> None:
+        if self.offset < 0:
+            raise ValueError(f"Critical section on {self.resource}: offset must be non-negative. Got: {self.offset}")
+        if self.duration <= 0:
+            raise ValueError(f"Critical section on {self.resource}: duration must be positive. Got: {self.duration}")
+
+
+@dataclass
+class LockConfig:
+    # The waiters' priority is lent to the owner until it releases the lock:
+    ## PRIORITY/PRIORITY_P -> the highest waiting priority, MLQ -> the highest waiting level. Other algorithms have no priorities to lend.
+    priority_inheritance: bool = False
+    convoy_threshold: int = 3 # this many waiters on one lock count as a convoy, whether its owner is running or not
+
+    def __post_init__(self) -> None:
+        if self.convoy_threshold < 1:
+            raise ValueError(f"Convoy threshold must be at least 1. Got: {self.convoy_threshold}")
+
+
+@dataclass
+class LockStats:
+    acquisitions: int = 0
+    contended: int = 0 # acquisitions that had to wait
+    total_wait: int = 0 # ticks spent WAITING on this lock (all waiters)
+    max_waiters: int = 0
+    convoys: int = 0 # episodes with >= convoy_threshold waiters (from the waiter that reaches it until a hand-over drops below)
+    in_convoy: bool = False
+
+
+# Completely Fair Scheduler
+## Weights per category, same scale as Linux (nice 0 = 1024, every nice level is ~1.25x), higher base priority -> larger share.
+CFS_NICE_0_WEIGHT: int = 1024
+CFS_WEIGHTS: Dict[ProcessCategory | None, int] = {
+    None: 1024, # no category (STANDARD input): nice 0
+    ProcessCategory.BATCH: 335, # nice 5
+    ProcessCategory.INTERACTIVE: 1024, # nice 0
+    ProcessCategory.SYSTEM: 3121, # nice -5
+    ProcessCategory.REAL_TIME: 9548, # nice -10
+}
+
+@dataclass
+class CFSConfig:
+    # in ticks, None: derived from the quantum (target_latency = 4q, min_granularity = q/2)
+    target_latency: int | None = None # every runnable process should run once within this period
+    min_granularity: int | None = None # shortest slice (also the wakeup-preemption threshold)
+
+    def __post_init__(self) -> None:
+        if self.target_latency is not None and self.target_latency <= 0:
+            raise ValueError(f"Target latency must be positive. Got: {self.target_latency}")
+        if self.min_granularity is not None and self.min_granularity <= 0:
+            raise ValueError(f"Minimum granularity must be positive. Got: {self.min_granularity}")
+
+
+# Fair share (FAIR_SHARE): two levels, the group (user/tenant, 5th input column) with the least decayed CPU usage per weight
+## runs next, its members take turns (RR, quantum q). Processes without a group share one group (None).
+@dataclass
+class FairShareConfig:
+    weights: Dict[str, float] = field(default_factory=dict) # group -> weight, missing groups: 1 (equal shares)
+    half_life: int | None = None # in ticks, past usage counts half after this long. None: 10q
+
+    def __post_init__(self) -> None:
+        for group, weight in self.weights.items():
+            if weight <= 0:
+                raise ValueError(f"Group {group}: weight must be positive. Got: {weight}")
+        if self.half_life is not None and self.half_life <= 0:
+            raise ValueError(f"Half-life must be positive. Got: {self.half_life}")
+
+
+# Adaptive-quantum Round Robin (ARR): FIFO like RR, the quantum is recomputed for every dispatch
+## MEDIAN / MEAN: of the remaining burst times of the ready processes (the dispatched one included)
+## TARGET_LATENCY: target_latency / number of runnable processes
+## GROWING: per process, starts at q and is multiplied by `growth` every time the process uses its whole quantum
+RRQuantumRule = Literal["MEDIAN", "MEAN", "TARGET_LATENCY", "GROWING"]
+
+@dataclass
+class AdaptiveRRConfig:
+    rule: RRQuantumRule = "MEDIAN"
+    # in ticks, None: derived from the quantum (min_quantum = q, max_quantum = 8q, target_latency = 8q)
+    min_quantum: int | None = None
+    max_quantum: int | None = None
+    target_latency: int | None = None # TARGET_LATENCY only
+    growth: float = 2 # GROWING only
+
+    def __post_init__(self) -> None:
+        if self.rule not in ("MEDIAN", "MEAN", "TARGET_LATENCY", "GROWING"):
+            raise ValueError(f"Unknown quantum rule: {self.rule}. Known: MEDIAN, MEAN, TARGET_LATENCY, GROWING")
+        for name in ("min_quantum", "max_quantum", "target_latency"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive. Got: {value}")
+        if self.min_quantum is not None and self.max_quantum is not None and self.min_quantum > self.max_quantum:
+            raise ValueError(f"min_quantum ({self.min_quantum}) must not exceed max_quantum ({self.max_quantum})")
+        if self.growth <= 1:
+            raise ValueError(f"Growth must be greater than 1. Got: {self.growth}")
+
+
+# Preemption hysteresis (SRTF, SPN while loading): a shorter newcomer only takes the CPU when it's worth a context switch
+@dataclass
+class PreemptionConfig:
+    # None for both: any shorter newcomer preempts. Otherwise a preemption needs one of the set conditions:
+    gain_factor: float | None = None # the remaining-time gain exceeds gain_factor * cs
+    min_granularity: int | None = None # the current process has run at least this many ticks since it was dispatched (a deferred newcomer is re-checked then)
+
+    def __post_init__(self) -> None:
+        if self.gain_factor is not None and self.gain_factor < 0:
+            raise ValueError(f"Gain factor must be non-negative. Got: {self.gain_factor}")
+        if self.min_granularity is not None and self.min_granularity <= 0:
+            raise ValueError(f"Minimum granularity must be positive. Got: {self.min_granularity}")
+
+
+# Proportional share (STRIDE, LOTTERY)
+## Tickets per category, in proportion to the category's priority (BATCH gets 1 share, REAL_TIME gets 4).
+TICKETS_PER_SHARE: int = 100
+PROPORTIONAL_SHARE_TICKETS: Dict[ProcessCategory | None, int] = {
+    None: TICKETS_PER_SHARE, # no category (STANDARD input): everyone is equal
+    ProcessCategory.BATCH: ProcessCategory.BATCH.value * TICKETS_PER_SHARE,
+    ProcessCategory.INTERACTIVE: ProcessCategory.INTERACTIVE.value * TICKETS_PER_SHARE,
+    ProcessCategory.SYSTEM: ProcessCategory.SYSTEM.value * TICKETS_PER_SHARE,
+    ProcessCategory.REAL_TIME: ProcessCategory.REAL_TIME.value * TICKETS_PER_SHARE,
+}
+STRIDE1: int = 1 << 20 # stride = STRIDE1 // tickets
+
+
+# Real-time schedulability (see schedulability.py)
+## A periodic task releases a job of `wcet` ticks every `period` ticks, each job must finish `deadline` ticks after its release.
+@dataclass
+class PeriodicTask:
+    wcet: int # C: worst-case execution time
+    period: int # T
+    deadline: int | None = None # D (relative), None: implicit deadline D = T
+    pid: int | None = None # the process it was derived from, if any
+
+    def __post_init__(self) -> None:
+        if self.deadline is None:
+            self.deadline = self.period
+        if self.wcet <= 0 or self.period <= 0 or self.deadline <= 0:
+            raise ValueError(f"Periodic task needs positive wcet, period and deadline. Got: C={self.wcet}, T={self.period}, D={self.deadline}")
+        if self.deadline > self.period:
+            raise ValueError(f"Only constrained deadlines (D <= T) are supported. Got: D={self.deadline}, T={self.period}")
+
+@dataclass
+class SchedulabilityReport:
+    utilization: float # sum of C/T
+    liu_layland_bound: float # n(2^(1/n) - 1)
+    passes_utilization_bound: bool # sufficient test (only meaningful for implicit deadlines)
+    response_times: List[int | None] # worst-case response time per task (same order as the input), None: exceeds its deadline
+    schedulable: bool # exact verdict under rate-monotonic priorities
+
+
+# Queueing-theory estimates (see queueing.py)
+## First-order moments of a workload, read as a single-server queue (times in ticks).
+@dataclass
+class WorkloadFit:
+    n: int
+    arrival_rate: float # lambda: processes per tick
+    interarrival_scv: float # squared coefficient of variation of the interarrival times (1 for Poisson arrivals)
+    mean_service: float # E[S]
+    second_moment_service: float # E[S^2]
+    service_sizes: List[float] = field(repr=False, default_factory=list) # the empirical service distribution (SRPT)
+
+    @property
+    def utilization(self) -> float: # rho = lambda E[S]
+        return self.arrival_rate * self.mean_service
+
+    @property
+    def service_scv(self) -> float: # 1 for exponential bursts, 0 for constant ones
+        return self.second_moment_service / self.mean_service ** 2 - 1 if self.mean_service > 0 else 0.0
+
+@dataclass
+class QueueingEstimate:
+    # in ticks, inf when the queue is unstable (rho >= 1)
+    model: str # "M/M/1", "M/G/1", "M/G/1-SRPT", "M/G/1-PS"
+    avg_wait_time: float # time not spent being served (T - S)
+    avg_response_time: float | None # until the first dispatch, None: the model has no first dispatch (PS serves everyone at once)
+    avg_turnaround_time: float # T, the sojourn time ("response time" in queueing theory)
+
+
+# Static priority (PRIORITY, PRIORITY_P)
+## Base priority per category (the values in the ProcessCategory comments), higher runs first.
+BASE_PRIORITY: Dict[ProcessCategory | None, int] = {
+    None: 0, # no category (STANDARD input): everyone is equal -> FCFS
+    ProcessCategory.BATCH: 0,
+    ProcessCategory.INTERACTIVE: 32,
+    ProcessCategory.SYSTEM: 64,
+    ProcessCategory.REAL_TIME: 96,
+}
+
+@dataclass
+class PriorityConfig:
+    # Aging: a READY process gains one priority level for every `aging_interval` ticks it waits (continuously, not in steps).
+    ## The gain is never stored: effective priority = priority + (now - ready_since) / aging_interval (see policies.PriorityQueue).
+    aging_interval: int | None = None # None: no aging
+
+    def __post_init__(self) -> None:
+        if self.aging_interval is not None and self.aging_interval <= 0:
+            raise ValueError(f"Aging interval must be positive. Got: {self.aging_interval}")
+
+
+# Multi-Level Feedback Queue
+MLFQLevelAlgo = Literal["RR", "FCFS"] # FIFO levels (a boost splices them, see policies.FeedbackQueues)
+
+@dataclass
+class MLFQLevel:
+    algo: MLFQLevelAlgo = "RR"
+    q: int | None = None # time slice (RR only)
+    # Demotion: None -> after every expired time slice (per-slice rule).
+    ## Otherwise: after `allotment` ticks at this level in total, however they were split (preemptions, short slices).
+    allotment: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.algo not in ("RR", "FCFS"):
+            raise ValueError(f"MLFQ levels are RR or FCFS. Got: {self.algo}")
+        if self.algo == "RR" and (self.q is None or self.q <= 0):
+            raise ValueError(f"A RR level needs a positive quantum. Got: {self.q}")
+        if self.algo == "FCFS" and self.q is not None:
+            raise ValueError(f"A FCFS level has no quantum. Got: {self.q}")
+        if self.allotment is not None and self.allotment <= 0:
+            raise ValueError(f"MLFQ allotment must be positive. Got: {self.allotment}")
+
+@dataclass
+class MLFQConfig:
+    # Topology: one entry per level, index 0 = highest priority. None (default): RR q, RR 2q, RR 3q, FCFS.
+    ## All the levels exist from the start, a process only ever moves between them (demotion, boost).
+    levels: List[MLFQLevel] | None = None
+    boost_interval: int | None = None # S: every S ticks all processes move back to the top level, None: never
+
+    def __post_init__(self) -> None:
+        if self.levels is not None and not self.levels:
+            raise ValueError("MLFQ needs at least one level")
+        if self.boost_interval is not None and self.boost_interval <= 0:
+            raise ValueError(f"Boost interval must be positive. Got: {self.boost_interval}")
+
+
+# Multi-Level Queue layout
+## Which categories go to which level, and how every level schedules. Validated once, then compiled into
+## the engine's lookup table (category name -> level), so placing an arriving process is one dict lookup.
+@dataclass
+class MLQLevelSpec:
+    algo: STSAlgo
+    categories: List[str] # input category names (built-in or aliases) served by this level
+    q: int | None = None # time slice, in ticks (needed by RR, SRTF, STRIDE, LOTTERY)
+    share: int | None = None # relative CPU share, set on every level (or none) to replace strict priority with deficit round robin
+
+@dataclass
+class MLQLayout:
+    levels: List[MLQLevelSpec] # index 0 = highest priority
+    # Extra category names -> the built-in category whose weights/tickets/priority they use, e.g. {"BACKGROUND": "BATCH"}
+    aliases: Dict[str, InputProcessCategory] = field(default_factory=dict)
+    # Deficit round robin between the levels (only with shares): one round hands out drr_round ticks, split by share.
+    ## None: 10 * the scheduler's quantum.
+    drr_round: int | None = None
+    category_level: Dict[str, int] = field(init=False, default_factory=dict) # compiled: category name -> level
+
+    def __post_init__(self) -> None:
+        if not self.levels:
+            raise ValueError("MLQ layout needs at least one level")
+        for name, base in self.aliases.items():
+            if name in ProcessCategory.__members__:
+                raise ValueError(f"Alias {name} shadows a built-in category")
+            if base not in ProcessCategory.__members__:
+                raise ValueError(f"Alias {name} must point to a built-in category. Got: {base}")
+        for i, level in enumerate(self.levels):
+            if level.algo in ("MLQ", "MLFQ"):
+                raise ValueError(f"Level {i}: {level.algo} can't be the algorithm of a level")
+            if level.algo not in ("FCFS", "SPN", "HRRN", "SRTF", "RR", "ARR", "CFS", "STRIDE", "LOTTERY", "EDF", "PRIORITY", "PRIORITY_P", "FAIR_SHARE"):
+                raise ValueError(f"Level {i}: unknown algorithm {level.algo}")
+            if level.algo in ("RR", "SRTF", "STRIDE", "LOTTERY", "ARR", "FAIR_SHARE") and (level.q is None or level.q <= 0):
+                raise ValueError(f"Level {i}: {level.algo} needs a positive quantum. Got: {level.q}")
+            if not level.categories:
+                raise ValueError(f"Level {i}: serves no category")
+            if level.share is not None and level.share <= 0:
+                raise ValueError(f"Level {i}: share must be positive. Got: {level.share}")
+            for name in level.categories:
+                if name not in ProcessCategory.__members__ and name not in self.aliases:
+                    raise ValueError(f"Level {i}: unknown category {name} (not built-in, not an alias)")
+                if name in self.category_level:
+                    raise ValueError(f"Category {name} is served by two levels ({self.category_level[name]} and {i})")
+                self.category_level[name] = i
+        if any(level.share is not None for level in self.levels) and not all(level.share is not None for level in self.levels):
+            raise ValueError("Either every MLQ level has a share (deficit round robin) or none (strict priority)")
+        if self.drr_round is not None and self.drr_round <= 0:
+            raise ValueError(f"DRR round must be positive. Got: {self.drr_round}")
+
+    def base_category(self, name: str) -> ProcessCategory:
+        return ProcessCategory[self.aliases.get(name, name)]
@@ -0,0 +1,99 @@
+import heapq
+import math
+from typing import List, Tuple
+
+from definitions import InputListScaled, SimulationSummary
+
+# Egalitarian processor sharing (PS): the q -> 0 limit of Round Robin, computed event by event instead of tick by tick.
+## Every active process gets 1/n of the CPU. With an overhead factor o (e.g. cs / q for RR with quantum q), the CPU only
+## does 1 / (1 + o) of useful work while it switches between two or more processes (a single process runs undisturbed).
+## The processes are kept in a heap of finish tags in virtual time (the service every active process has received),
+## so the whole run is O(n log n): fast enough as an analytic reference for RR at millions of processes.
+## Times are fluid (floats, in ticks). Every process is served from its arrival, there is no first dispatch: no response time.
+
+
+def processor_sharing(data_list: InputListScaled, overhead: float = 0.0) -> List[float]:
+    """Completion time of every process (input order) under processor sharing."""
+    if overhead < 0:
+        raise ValueError(f"Overhead factor must be non-negative. Got: {overhead}")
+    order = sorted(range(len(data_list)), key=lambda i: data_list[i][0])
+    completion = [0.0] * len(data_list)
+    active: List[Tuple[float, int]] = [] # (finish tag in virtual time, index)
+    virtual_time = 0.0 # service received by every process that has been active since the start
+    now = 0.0
+    next_arrival = 0
+    while next_arrival < len(order) or active:
+        if not active: # idle until the next arrival
+            now = max(now, data_list[order[next_arrival]][0])
+        n = len(active)
+        rate = 1.0 if n <= 1 else 1.0 / (1.0 + overhead) # useful work per unit of time, shared by n
+        # next event: the next arrival or the next completion, whichever comes first
+        finish_at = now + (active[0][0] - virtual_time) * n / rate if active else math.inf
+        arrival_at = data_list[order[next_arrival]][0] if next_arrival < len(order) else math.inf
+        if arrival_at <= finish_at:
+            if n > 0:
+                virtual_time += (arrival_at - now) * rate / n
+            now = arrival_at
+            i = order[next_arrival]
+            heapq.heappush(active, (virtual_time + data_list[i][1], i))
+            next_arrival += 1
+        else:
+            virtual_time, now = active[0][0], finish_at
+            while active and active[0][0] <= virtual_time: # equal tags finish together
+                _, i = heapq.heappop(active)
+                completion[i] = now
+    return completion
+
+
+def processor_sharing_summary(data_list: InputListScaled, overhead: float = 0.0) -> SimulationSummary:
+    """The PS run as a SimulationSummary (ticks), to put next to the simulated algorithms."""
+    completion = processor_sharing(data_list, overhead)
+    n = len(data_list)
+    turnaround = [completion[i] - item[0] for i, item in enumerate(data_list)]
+    makespan = max(completion)
+    busy_time = sum(item[1] for item in data_list) # useful work only, the overhead is not EXECUTING time
+    return SimulationSummary(
+        algorithm="PS",
+        n=n,
+        makespan=makespan,
+        avg_turnaround_time=sum(turnaround) / n,
+        avg_wait_time=sum(tat - item[1] for tat, item in zip(turnaround, data_list)) / n, # time not spent on its own work
+        avg_response_time=None, # no first dispatch (same as queueing.mg1_ps)
+        throughput=n / makespan if makespan > 0 else 0.0,
+        cpu_utilization=busy_time / makespan if makespan > 0 else 0.0,
+        context_switches=0,
+        p95_response_time=None,
+    )
+
+
+if __name__ == "__main__":
+    import io
+    import contextlib
+    import random
+    import time
+    from definitions import SchedulerMode
+    from main import Scheduler
+
+    rng = random.Random(3)
+    workload = []
+    arrival = 0
+    for _ in range(2000):
+        arrival += rng.randint(0, 24) # load ~0.9
+        workload.append((arrival, rng.randint(1, 20)))
+    # RR converges to PS as q -> 0 (without context switches), and to PS with overhead cs / q with them
+    for q, cs in ((8, 0), (2, 0), (1, 0), (4, 2), (2, 2)):
+        scheduler = Scheduler([list(item) for item in workload], cs, q, SchedulerMode.STANDARD)
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler.RR()
+        rr = scheduler.summarize()
+        ps = processor_sharing_summary(workload, overhead=cs / q)
+        print(f"q={q} cs={cs}: RR avg TAT {rr.avg_turnaround_time:.2f}, PS (overhead {cs / q:g}) avg TAT {ps.avg_turnaround_time:.2f}")
+
+    big = []
+    arrival = 0
+    for _ in range(10 ** 6):
+        arrival += rng.randint(0, 24)
+        big.append((arrival, rng.randint(1, 20)))
+    started = time.perf_counter()
+    summary = processor_sharing_summary(big)
+    print(f"PS on {len(big)} processes: {time.perf_counter() - started:.2f}s, avg TAT {summary.avg_turnaround_time:.2f}")
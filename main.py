@@ -30,20 +30,40 @@
 # # Load 'BlenderCode' next
 # require("BlenderCode")
 
+# # Load 'structures', 'memory' (memory allocator model used by the long-term scheduler) and 'policies' (ready queues)
+# require("structures")
+# require("memory")
+# require("policies")
+# require("schedulability")
+
 # # =========================================================
 # # 2. NOW IMPORT NORMALLY
 # # =========================================================
 
-from typing import Union, List, Optional
+import copy
+import gzip
+import io
+import math
+import os
+import pickle
+import random
+import time
+from collections import deque
+from typing import Union, List, Optional, Dict, Tuple
 from dataclasses import dataclass, field
 # import BlenderCode
 from definitions import (
     TICK,
     SimulationLog, SystemState, SchedulerMode, ProcessEvents,
-    Process, ProcessState, ProcessCategory,
+    Process, ProcessState,
     InputList, validate_input_and_determine_scheduler_mode, scale_input_time,
-    QueueLevel, STSAlgo
+    QueueLevel, EngineState, CheckpointConfig, STSAlgo, SimulationSummary, percentile, jain_index, SchedulabilityReport,
+    LTSConfig, JobPool, MTSConfig, CFSConfig, PriorityConfig, PreemptionConfig, AdaptiveRRConfig, FairShareConfig, CriticalSection, LockConfig, LockStats, DVFSConfig, BASE_PRIORITY, MLFQConfig, MLFQLevel, MLQLayout, MLQLevelSpec
 )
+from memory import MemoryAllocator, BuddyAllocator, make_allocator
+from policies import CFSRunQueue, StrideQueue, LotteryQueue, EDFQueue, HRRNQueue, AdaptiveRRQueue, FairShareQueue, PriorityQueue, FeedbackQueues, FeedbackLevel
+from schedulability import rate_monotonic_test, periodic_tasks_from_input
+from structures import lowest_set_bit
 
 
 @dataclass
@@ -55,12 +75,79 @@ class Scheduler:
     mode: SchedulerMode
     logs: List[SimulationLog] = field(init=False, default_factory=list)
     current_time: int = 0 # in tick
+    # Long-term scheduling (optional): job pool + admission under a memory budget / multiprogramming degree
+    lts: Optional[LTSConfig] = None
+    memory_sizes: Optional[List[int]] = None # one entry per input item (same order as input_data_list)
+    # Medium-term scheduling (optional, needs a LTS memory capacity): swap READY processes out under memory pressure
+    mts: Optional[MTSConfig] = None
+    # CFS tuning (None: derived from q)
+    cfs: Optional[CFSConfig] = None
+    # PRIORITY/PRIORITY_P aging (None: no aging)
+    priority: Optional[PriorityConfig] = None
+    # MLFQ topology (levels: algorithm, quantum, allotment) and boost (None: RR q, RR 2q, RR 3q, FCFS, demotion after every slice, no boost)
+    mlfq: Optional[MLFQConfig] = None
+    # MLQ layout: categories -> levels, per-level algorithm/quantum, aliases (None: the default layout, see MLQ)
+    mlq: Optional[MLQLayout] = None
+    # ARR quantum rule and bounds (None: median of the remaining bursts, between q and 8q of the level)
+    adaptive_rr: Optional[AdaptiveRRConfig] = None
+    # Critical sections, one list per input item (same order as input_data_list, offsets/durations in ticks of executed time)
+    critical_sections: Optional[List[List[CriticalSection]]] = None
+    # Lock behaviour (None: FIFO hand-over without priority inheritance, convoys from 3 waiters)
+    locks: Optional[LockConfig] = None
+    # CPU frequency levels, governor and power model (None: always full speed, no energy estimate)
+    dvfs: Optional[DVFSConfig] = None
+    # FAIR_SHARE group weights and usage half-life (None: equal shares, half-life 10q)
+    fair_share: Optional[FairShareConfig] = None
+    # SRTF/SPN preemption hysteresis (None: any shorter newcomer preempts)
+    preemption: Optional[PreemptionConfig] = None
+    # Periodic checkpoints of the run (None: none), a run can go on from its last one with Scheduler.resume_checkpoint(path)
+    checkpoint: Optional[CheckpointConfig] = None
+    seed: int = 0 # random draws (LOTTERY) are reproducible for the same seed
+    fast_forward: bool = True # skip the ticks where nothing but the current state's own progress happens (same logs and metrics)
+    time_scale: int = 1 # ticks per input time unit (see scale_input_time), only used to print times back in input units
+    verbose: bool = True # print a line when a run starts or resumes
     def __post_init__(self) -> None:
         """
         Initializes the scheduler
         """
         self.half_cs: int = self.cs/2 
+        cfs = self.cfs or CFSConfig()
+        self.cfs_target_latency: int = cfs.target_latency if cfs.target_latency is not None else 4 * self.q
+        self.cfs_min_granularity: int = cfs.min_granularity if cfs.min_granularity is not None else max(TICK, self.q // 2)
+        if self.mts is not None and (self.lts is None or self.lts.memory_capacity is None):
+            raise ValueError("The medium-term scheduler needs a long-term scheduler with a memory capacity")
+        # keep the per-process lists aligned with the input while sorting it (stable sort, same as below)
+        order = sorted(range(len(self.input_data_list)), key=lambda i: self.input_data_list[i][0])
+        if self.memory_sizes is not None:
+            if len(self.memory_sizes) != len(self.input_data_list):
+                raise ValueError(f"memory_sizes must have one entry per process. Got: {len(self.memory_sizes)}, expected: {len(self.input_data_list)}")
+            for i, size in enumerate(self.memory_sizes):
+                if size < 0:
+                    raise ValueError(f"Item at index {i}: Memory size must be non-negative. Got: {size}")
+                if self.lts and self.lts.memory_capacity is not None and size > self.lts.memory_capacity:
+                    raise ValueError(f"Item at index {i}: Memory size ({size}) exceeds the memory capacity ({self.lts.memory_capacity}), it could never be admitted")
+            self.memory_sizes = [self.memory_sizes[i] for i in order]
+        if self.critical_sections is not None:
+            if len(self.critical_sections) != len(self.input_data_list):
+                raise ValueError(f"critical_sections must have one entry per process. Got: {len(self.critical_sections)}, expected: {len(self.input_data_list)}")
+            for i, (item, sections) in enumerate(zip(self.input_data_list, self.critical_sections)):
+                end = 0
+                for section in sections:
+                    if section.offset < end:
+                        raise ValueError(f"Item at index {i}: critical sections must be in order of offset and must not overlap (nested locks aren't modelled)")
+                    end = section.offset + section.duration
+                if end > item[1]:
+                    raise ValueError(f"Item at index {i}: critical section ends after the burst ({end} > {item[1]})")
+            self.critical_sections = [self.critical_sections[i] for i in order]
+        self.lock_config = self.locks or LockConfig()
+        self.process_templates: Optional[List[Process]] = None # decoded input, see _process_templates
+        self.on_quantum_expiry = None # called with the engine state right before a time slice expires (sweep_quantum)
         self.input_data_list.sort(key=lambda x: x[0]) # sorted based on the at
+        if self.mode is SchedulerMode.MLQ:
+            self.mlq_layout = self.mlq or self._default_mlq_layout()
+            for i, item in enumerate(self.input_data_list):
+                if item[2] not in self.mlq_layout.category_level:
+                    raise ValueError(f"Item at index {i}: category {item[2]} isn't served by any MLQ level. Known: {', '.join(self.mlq_layout.category_level)}")
         self.all_algorithms = {
             # Non-preemptive
             "FCFS": self.FCFS,
@@ -69,831 +156,395 @@ class Scheduler:
             "SRTF": self.SRTF,
             # Preemptive
             "RR": self.RR,
+            "ARR": self.ARR,
             "MLQ": self.MLQ, # + category
-            "MLFQ": self.MLFQ
+            "MLFQ": self.MLFQ,
+            "CFS": self.CFS,
+            "STRIDE": self.STRIDE,
+            "LOTTERY": self.LOTTERY,
+            "EDF": self.EDF,
+            "PRIORITY": self.PRIORITY,
+            "PRIORITY_P": self.PRIORITY_P,
+            "FAIR_SHARE": self.FAIR_SHARE
         }
 
     def run(self, algo: STSAlgo) -> None:
         """
         Main driver: runs specific algorithm
         """
-        available_algorithms = []
-        if self.mode is SchedulerMode.STANDARD:
-            available_algorithms = ["FCFS", "SPN", "HRRN", "RR", "SRTF", "MLFQ"]
-        elif self.mode is SchedulerMode.MLQ:
-            available_algorithms = ["MLQ"]
-
+        self.check_algorithm(algo)
 
-        if algo not in available_algorithms:
-            raise ValueError(f"The selected algorithm ({algo}) isn't compatible with the input_data format!\nAvailable algorithms: {', '.join(available_algorithms)}")
+        # Analytic pre-check (milliseconds): infeasible real-time task sets are flagged before the simulation
+        report = self.real_time_schedulability()
+        if report is not None:
+            verdict = "SCHEDULABLE" if report.schedulable else "NOT SCHEDULABLE"
+            response_times = [r if r is not None else "miss" for r in report.response_times]
+            print(f"Rate-monotonic pre-check (REAL_TIME): U={report.utilization:.3f}, Liu-Layland bound={report.liu_layland_bound:.3f} ({'passed' if report.passes_utilization_bound else 'not passed'}), worst-case response times (ticks) {response_times} -> {verdict}")
 
         self.all_algorithms[algo]() # Clean dynamic call
 
         self.generate_gantt_and_metrics()
 
-    # ===== STANDARD scheduling =====
-
-    def FCFS(self): # First-come, First-serve
-        print(f"Running Algorithm: FCFS...")
-        # --- Initialization ---
-        self._reset_simulation_objects()
-        system_state = SystemState.IDLE
-        current_process: Optional[Process] = None
-        outgoing_process: Optional[Process] = None # For CS_SAVE
-        # CS Tracking
-        cs_progress = 0
-        # # Quantum Tracking
-        # current_quantum_counter = 0
-        # Logging Pointers
-        segment_start_time = 0
-        next_arrival_idx = 0
-        completed_count = 0
-        total_data_items = len(self.input_data_list)
-        
-        # ready queue
-        ready_queue: List[QueueLevel] = [
-            QueueLevel(
-                q=None, # non-Preemptive logic
-                algo="FCFS",
-                queue=[]
-            )
-        ]
-        while completed_count <= total_data_items:
-            # 1. Handle Arrivals.
-            while next_arrival_idx < total_data_items:
-                proc = self.processes[next_arrival_idx]
-                if proc.arrival_time <= self.current_time:
-                    proc.state = ProcessState.READY
-                    # add to ready queue
-                    ready_queue[0].queue.append(proc)
-                    ready_queue[0].new_event_occurred = True
-                    proc.process_ready_queue_id = 0
-                    next_arrival_idx += 1
-                    self._add_log(ready_queue[0].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
-                else:
-                    break
-            
+    def available_algorithms(self) -> List[STSAlgo]:
+        """The algorithms that can run on this input (MLQ input: the ones that use the categories)"""
+        if self.mode is SchedulerMode.MLQ:
+            return ["MLQ", "CFS", "STRIDE", "LOTTERY", "EDF", "PRIORITY", "PRIORITY_P", "FAIR_SHARE"] # CFS weights, tickets and priorities come from the categories
+        return ["FCFS", "SPN", "HRRN", "RR", "ARR", "SRTF", "MLFQ", "CFS", "STRIDE", "LOTTERY", "EDF", "PRIORITY", "PRIORITY_P", "FAIR_SHARE"]
 
-            if system_state == SystemState.CS_LOAD: 
-                if ready_queue[0].new_event_occurred: # a new process just arrived? okay, we don't care since the FCFS doesn't care :)
-                    pass
-                if cs_progress >= self.half_cs:
-                    # Load Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                    segment_start_time = self.current_time
-                    
-                    system_state = SystemState.EXECUTING
-                    current_process.state = ProcessState.RUNNING
-                    # current_quantum_counter = 0
-                    cs_progress = 0
+    def check_algorithm(self, algo: STSAlgo) -> None:
+        """Raises ValueError if algo can't run on this input"""
+        available_algorithms = self.available_algorithms()
+        if algo not in available_algorithms:
+            raise ValueError(f"The selected algorithm ({algo}) isn't compatible with the input_data format!\nAvailable algorithms: {', '.join(available_algorithms)}")
 
-                    # First run metrics
-                    if current_process.start_time == -1:
-                        current_process.start_time = self.current_time
-                        current_process.response_time = current_process.start_time - current_process.arrival_time
-                    continue # no ticks!
-                cs_progress += TICK    
-            elif system_state == SystemState.CS_SAVE:
-                if cs_progress >= self.half_cs:
-                    # Save Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, outgoing_process.pid, "CS_SAVE")
-                    segment_start_time = self.current_time
-                    # outgoing_process.state is ProcessState.TERMINATED:
-                    outgoing_process.completion_time = self.current_time
-                    outgoing_process.turnaround_time = outgoing_process.completion_time - outgoing_process.arrival_time
-                    outgoing_process = None
-                    cs_progress = 0
-                    
-                    system_state = SystemState.IDLE
-                    continue # no ticks!
-                cs_progress += TICK
-            elif system_state is SystemState.EXECUTING: # non-preemptive execution
-                if ready_queue[0].new_event_occurred: # that means a new process just arrived. But we don't care :)
-                    pass
-                if current_process.remaining_time <= 0: # terminated
-                    # Burst Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                    segment_start_time = self.current_time
-                    
-                    current_process.state = ProcessState.TERMINATED
-                    completed_count += 1
-                    
-                    outgoing_process = current_process
-                    current_process = None
-                    
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    continue # no ticks!
-                current_process.remaining_time -= TICK
-                               
-            elif system_state is SystemState.IDLE:
-                candidate: Process | None = None if len(ready_queue[0].queue) == 0 else ready_queue[0].queue.pop(0) # since input data is already sorted based on at.
-                
-                if candidate:
-                    
-                    # Log IDLE time if we were waiting
-                    if self.current_time > segment_start_time: # avoid logging on 0 if a process arrived at 0 and system was idle(situations like: system is idle, but it switches into other states instantly, no ticks)
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, None, "IDLE")
-                        segment_start_time = self.current_time
-                        
-                    
-                    current_process = candidate # Removed from queue
-                    system_state = SystemState.CS_LOAD
-                    cs_progress = 0
-                    ready_queue[0].new_event_occurred = False # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
-                    
-                    continue # no ticks!     
-            # Advance Time
-            
-            for p in ready_queue[0].queue:
-                p.wait_time += TICK
-                
-            self.current_time += TICK
-            # Safety break
-            if (system_state == SystemState.IDLE and 
-                len(ready_queue[0].queue) == 0 and 
-                next_arrival_idx >= total_data_items and 
-                current_process is None and
-                outgoing_process is None):
-                break
- 
-    def SPN(self): # Shortest Process Next 
-        print(f"Running Algorithm: SPN...")
-        # --- Initialization ---
-        self._reset_simulation_objects()
-        system_state = SystemState.IDLE
-        current_process: Optional[Process] = None
-        outgoing_process: Optional[Process] = None # For CS_SAVE
-        # CS Tracking
-        cs_progress = 0
-        # Quantum Tracking
-        current_quantum_counter = 0
-        # Logging Pointers
-        segment_start_time = 0
-        next_arrival_idx = 0
-        completed_count = 0
-        total_data_items = len(self.input_data_list)
-        
-        # ready queue
-        ready_queue: List[QueueLevel] = [
-            QueueLevel(
-                q=None, # non-Preemptive logic
-                algo="SPN",
-                queue=[]
-            )
-        ]
-        while completed_count <= total_data_items:
-            # 1. Handle Arrivals.
-            while next_arrival_idx < total_data_items:
-                proc = self.processes[next_arrival_idx]
-                if proc.arrival_time <= self.current_time:
-                    proc.state = ProcessState.READY
-                    # add to ready queue
-                    ready_queue[0].queue.append(proc)
-                    ready_queue[0].new_event_occurred = True
-                    proc.process_ready_queue_id = 0
-                    next_arrival_idx += 1
-                    self._add_log(ready_queue[0].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
-                else:
-                    break
-            
+    def sweep_quantum(self, quanta: List[int], algo: STSAlgo = "RR") -> List[Tuple[int, SimulationSummary]]:
+        """
+        Runs RR (or MLFQ with the default topology: RR q, 2q, 3q, FCFS) once per quantum (in ticks), sharing the common prefix.
+        The runs are identical until a time slice expires in one of them: the shortest quantum runs first, and at its first
+        expiry the longer ones fork off (copies of the scheduler and of the engine state) and go on from there, led by the
+        shortest of them, and so on. Returns (quantum, summary) in the order of quanta, the same as a run per quantum.
+        """
+        if algo not in ("RR", "MLFQ"):
+            raise ValueError(f"Quantum sweeps share the prefix of RR or MLFQ runs. Got: {algo}")
+        if algo == "MLFQ" and self.mlfq is not None and self.mlfq.levels is not None:
+            raise ValueError("The MLFQ quanta come from its topology (mlfq.levels), q is only used by the default topology")
+        if any(q <= 0 for q in quanta):
+            raise ValueError(f"Quantum Time (q) must be positive. Got: {quanta}")
+        if self.checkpoint is not None:
+            raise ValueError("Forked runs would all write the same checkpoint files: run the quanta one by one to checkpoint them")
+        # DVFS samples every 10q by default: then the runs differ from the start
+        shared_prefix = self.dvfs is None or self.dvfs.sampling_period is not None
+        distinct = sorted(set(quanta))
+        groups = [distinct] if shared_prefix else [[q] for q in distinct]
+        pending: List[Tuple[List[int], Scheduler, Optional[EngineState]]] = [(group, copy.copy(self), None) for group in groups]
+        summaries: Dict[int, SimulationSummary] = {}
+        while pending:
+            group, runner, state = pending.pop()
+            leader, followers = group[0], group[1:]
+            runner._set_quantum(leader, state)
+
+            def part_ways(at_expiry: EngineState) -> None:
+                nonlocal followers
+                if followers: # the first expiry of the leader, the others haven't used up their quantum yet
+                    pending.append((followers, *runner._fork(at_expiry)))
+                    followers = []
+            runner.on_quantum_expiry = part_ways
+            if state is None:
+                getattr(runner, algo)()
+            else:
+                runner._simulate(state.algorithm, state.ready_queue, state.feedback, resume=state)
+            runner.on_quantum_expiry = None
+            for q in [leader] + followers: # followers left: no slice ever expired, so neither would a longer one
+                summaries[q] = runner.summarize()
+        return [(q, summaries[q]) for q in quanta]
+
+    def _set_quantum(self, q: int, state: Optional[EngineState]) -> None:
+        """Switches a run (forked or not started yet) to another quantum: its RR level, or the default MLFQ topology."""
+        self.q = q
+        if state is None:
+            return
+        if state.feedback is not None:
+            self.mlfq_config = self._mlfq_topology()
+            state.feedback = self.mlfq_config
+            for queue_level, level in zip(state.ready_queue, self.mlfq_config.levels):
+                queue_level.q = level.q
+        else:
+            for queue_level in state.ready_queue:
+                queue_level.q = q
+        if state.current_quantum_limit is not None: # the slice in progress gets the new quantum too
+            current = state.current_process
+            state.current_quantum_limit = self._time_slice(state.ready_queue[current.process_ready_queue_id], current)
+
+    def _fork(self, state: EngineState) -> Tuple["Scheduler", EngineState]:
+        """
+        Copy of the scheduler and of the engine state of its run, taken together so they keep sharing the same processes
+        and queues. The copy can go on independently (_simulate(..., resume=state)), the input itself is shared.
+        """
+        memo = {id(shared): shared for shared in (self.input_data_list, self.process_templates, self.critical_sections, self.memory_sizes) if shared is not None}
+        # processes only hold values (their critical sections are never changed), logs are never changed once written:
+        ## shallow copies are enough and much cheaper than a deep copy of every one of them
+        for proc in self.processes:
+            memo[id(proc)] = proc.clone()
+        memo[id(self.logs)] = list(self.logs)
+        return copy.deepcopy((self, state), memo)
+
+    def __getstate__(self) -> Dict:
+        """Copies and checkpoints leave out what belongs to the caller of the run (a sweep's callback)."""
+        state = self.__dict__.copy()
+        state["on_quantum_expiry"] = None
+        return state
+
+    # ===== Checkpoints =====
+    ## <path>: the scheduler and the engine state, without the logs (pickled, gzipped, replaced on every checkpoint).
+    ## <path>.logs: the logs only grow, so every checkpoint appends the new ones (one gzip member each) and records where they end.
+    def _reset_checkpoints(self) -> None:
+        if self.checkpoint is None:
+            return
+        self.next_checkpoint_time = self.checkpoint.interval if self.checkpoint.interval is not None else math.inf
+        self.next_checkpoint_wall = time.monotonic() + self.checkpoint.interval_seconds if self.checkpoint.interval_seconds is not None else math.inf
+        self.checkpoints_written = 0
+        self.checkpoint_logs_count = 0 # logs already in <path>.logs
+        self.checkpoint_logs_size = 0 # bytes of <path>.logs that belong to the last checkpoint
+        open(self.checkpoint.path + ".logs", "wb").close()
+
+    def _checkpoint_due(self) -> bool:
+        return self.current_time >= self.next_checkpoint_time or time.monotonic() >= self.next_checkpoint_wall
+
+    def _write_checkpoint(self, state: EngineState) -> None:
+        """Written next to the file and renamed, so a crash never leaves half a checkpoint (extra logs after it are cut on resume)."""
+        if self.checkpoint.interval is not None:
+            self.next_checkpoint_time = self.current_time + self.checkpoint.interval
+        if self.checkpoint.interval_seconds is not None:
+            self.next_checkpoint_wall = time.monotonic() + self.checkpoint.interval_seconds
+        self.checkpoints_written += 1
+        logs_path = self.checkpoint.path + ".logs"
+        with gzip.open(logs_path, "ab", compresslevel=1) as f:
+            new_logs = [(log.algorithm, log.start_time, log.end_time, log.pid, log.event_type) for log in self.logs[self.checkpoint_logs_count:]]
+            pickle.dump(new_logs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.checkpoint_logs_count = len(self.logs)
+        self.checkpoint_logs_size = os.path.getsize(logs_path)
+
+        partial = self.checkpoint.path + ".partial"
+        logs, templates = self.logs, self.process_templates
+        self.logs, self.process_templates = None, None # in <path>.logs / rebuilt from the input when needed
+        try:
+            with gzip.open(partial, "wb", compresslevel=1) as f:
+                pickle.dump((self, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            self.logs, self.process_templates = logs, templates
+        os.replace(partial, self.checkpoint.path)
+
+    @staticmethod
+    def resume_checkpoint(path: str) -> "Scheduler":
+        """
+        Loads a checkpoint and runs the simulation from there to the end, exactly as the interrupted run would have
+        gone on (it keeps writing checkpoints with the same configuration). Returns the scheduler: summarize(),
+        generate_gantt_and_metrics() as after a run.
+        """
+        with gzip.open(path, "rb") as f:
+            scheduler, state = pickle.load(f)
+        logs_path = path + ".logs"
+        with open(logs_path, "rb") as f:
+            chunks = io.BytesIO(gzip.decompress(f.read(scheduler.checkpoint_logs_size)))
+        os.truncate(logs_path, scheduler.checkpoint_logs_size) # logs appended after this checkpoint will be written again
+        scheduler.logs = []
+        while chunks.tell() < len(chunks.getbuffer()):
+            scheduler.logs.extend(SimulationLog(*log) for log in pickle.load(chunks))
+        if scheduler.checkpoint.interval_seconds is not None: # the monotonic clock of another process means nothing here
+            scheduler.next_checkpoint_wall = time.monotonic() + scheduler.checkpoint.interval_seconds
+        if scheduler.verbose:
+            print(f"Resuming Algorithm: {state.algorithm} at tick {scheduler.current_time}...")
+        scheduler._simulate(state.algorithm, state.ready_queue, state.feedback, resume=state)
+        return scheduler
+
+    def real_time_schedulability(self) -> Optional[SchedulabilityReport]:
+        """Rate-monotonic analysis of the REAL_TIME processes with deadlines (as periodic tasks, T = D = deadline - at), None if there are none."""
+        tasks = periodic_tasks_from_input(self.input_data_list, self.mlq_layout if self.mode is SchedulerMode.MLQ else None)
+        return rate_monotonic_test(tasks) if tasks else None
 
-            if system_state == SystemState.CS_LOAD: 
-                if ready_queue[0].new_event_occurred: # that means a new process just arrived. We check if there is a BETTER process than the one we are loading. let's check the event!
-                    ready_queue[0].new_event_occurred = False
-                    best_candidate_in_queue: Process = min(ready_queue[0].queue, key=lambda p: p.remaining_time)
-                    if best_candidate_in_queue.remaining_time < current_process.remaining_time:
-                        # should_abort = True
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                        segment_start_time = self.current_time
-                        
-                    
-                        current_process.state = ProcessState.READY
-                        ready_queue[0].queue.append(current_process)
-                        current_process = None
-                        system_state = SystemState.IDLE
-                        cs_progress = 0
-                        continue # no ticks!
-                if cs_progress >= self.half_cs:
-                    # Load Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                    segment_start_time = self.current_time
-                    
-                    system_state = SystemState.EXECUTING
-                    current_process.state = ProcessState.RUNNING
-                    current_quantum_counter = 0
-                    cs_progress = 0
+    # ===== STANDARD scheduling =====
+    # Every algorithm only describes its ready queue levels, the tick loop itself is shared (see _simulate).
 
-                    # First run metrics
-                    if current_process.start_time == -1:
-                        current_process.start_time = self.current_time
-                        current_process.response_time = current_process.start_time - current_process.arrival_time
-                        # current_process.wait_time = current_process.response_time # preemptive WT≠RT
-                    continue # no ticks!
-                cs_progress += TICK    
-            elif system_state == SystemState.CS_SAVE:
-                if cs_progress >= self.half_cs:
-                    # Save Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, outgoing_process.pid, "CS_SAVE")
-                    segment_start_time = self.current_time
-                    # outgoing_process.state is ProcessState.TERMINATED:
-                    outgoing_process.completion_time = self.current_time
-                    outgoing_process.turnaround_time = outgoing_process.completion_time - outgoing_process.arrival_time
-                    
-                    outgoing_process = None
-                    cs_progress = 0
-                    # Here we need to do something so in the next loop, we're gonna select the next candidate!
-                    system_state = SystemState.IDLE
-                    continue # no ticks!
-                cs_progress += TICK
-            elif system_state is SystemState.EXECUTING: # non-preemptive execution
-                if ready_queue[0].new_event_occurred:
-                    pass
-                if current_process.remaining_time <= 0: # terminated
-                    # Burst Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                    segment_start_time = self.current_time
-                    
-                    current_process.state = ProcessState.TERMINATED
-                    completed_count += 1
-                    
-                    outgoing_process = current_process
-                    current_process = None
-                    # current_quantum_counter = 0
-                    
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    continue # no ticks!
-                current_process.remaining_time -= TICK
-                               
-            elif system_state is SystemState.IDLE:
-                candidate: Process | None = None if len(ready_queue[0].queue) == 0 else min(ready_queue[0].queue, key=lambda p: p.remaining_time) 
-                
-                if candidate:
-                    
-                    # Log IDLE time if we were waiting
-                    if self.current_time > segment_start_time: # avoid logging on 0 if a process arrived at 0 and system was idle(situations like: system is idle, but it switches into other states instantly, no ticks)
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, None, "IDLE")
-                        segment_start_time = self.current_time
-                        
-                    
-                    ready_queue[0].queue.remove(candidate) # remove the candidate from ready queue!
-                    current_process = candidate # Removed from queue
-                    system_state = SystemState.CS_LOAD
-                    cs_progress = 0
-                    ready_queue[0].new_event_occurred = False # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
-                    
-                    continue # no ticks!     
-            # Advance Time
-            
-            for p in ready_queue[0].queue:
-                p.wait_time += TICK
-                
-            self.current_time += TICK
-            # Safety break
-            if (system_state == SystemState.IDLE and 
-                len(ready_queue[0].queue) == 0 and 
-                next_arrival_idx >= total_data_items and 
-                current_process is None and
-                outgoing_process is None):
-                break
+    def FCFS(self): # First-come, First-serve
+        self._simulate("FCFS", [QueueLevel(q=None, algo="FCFS", queue=[])]) # non-Preemptive logic
 
+    def SPN(self): # Shortest Process Next 
+        self._simulate("SPN", [QueueLevel(q=None, algo="SPN", queue=[])]) # non-Preemptive logic
 
     def HRRN(self): # Highest Response Ration First
-        print(f"Running Algorithm: HRRN...")
-        # --- Initialization ---
-        self._reset_simulation_objects()
-        system_state = SystemState.IDLE
-        current_process: Optional[Process] = None
-        outgoing_process: Optional[Process] = None # For CS_SAVE
-        # CS Tracking
-        cs_progress = 0
-        # Quantum Tracking
-        current_quantum_counter = 0
-        # Logging Pointers
-        segment_start_time = 0
-        next_arrival_idx = 0
-        completed_count = 0
-        total_data_items = len(self.input_data_list)
-        
-        # ready queue
-        ready_queue: List[QueueLevel] = [
-            QueueLevel(
-                q=None, # non-Preemptive logic
-                algo="HRRN",
-                queue=[]
-            )
-        ]
-        while completed_count <= total_data_items:
-            # 1. Handle Arrivals.
-            while next_arrival_idx < total_data_items:
-                proc = self.processes[next_arrival_idx]
-                if proc.arrival_time <= self.current_time:
-                    proc.state = ProcessState.READY
-                    # add to ready queue
-                    ready_queue[0].queue.append(proc)
-                    ready_queue[0].new_event_occurred = True
-                    proc.process_ready_queue_id = 0
-                    next_arrival_idx += 1
-                    self._add_log(ready_queue[0].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
-                else:
-                    break
-            
-
-            if system_state == SystemState.CS_LOAD: 
-                if len(ready_queue[0].queue) > 0: # We need to check the ready queue every ticks! since, at arrival times, waiting time values are equal to zero but one tick later? how about two ticks later? so we need to check it as long as the ready queue is not empty–this might be a bit overdoing, but it's safe.
-                    best_candidate_in_queue: Process = max(ready_queue[0].queue, key=lambda p: (p.wait_time)/p.burst_time)
-                    # should_abort = False
-                    if (best_candidate_in_queue.wait_time)/best_candidate_in_queue.burst_time > (current_process.wait_time)/current_process.burst_time:
-                        # should_abort = True
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                        segment_start_time = self.current_time
-                        
-                    
-                        current_process.state = ProcessState.READY
-                        ready_queue[0].queue.append(current_process)
-                        current_process = None
-                        system_state = SystemState.IDLE
-                        cs_progress = 0
-                        continue # no ticks!
-                if cs_progress >= self.half_cs:
-                    # Load Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                    segment_start_time = self.current_time
-                    
-                    system_state = SystemState.EXECUTING
-                    current_process.state = ProcessState.RUNNING
-                    current_quantum_counter = 0
-                    cs_progress = 0
-
-                    # First run metrics
-                    if current_process.start_time == -1:
-                        current_process.start_time = self.current_time
-                        current_process.response_time = current_process.start_time - current_process.arrival_time
-                        # current_process.wait_time = current_process.response_time # preemptive WT≠RT
-                    continue # no ticks!
-                cs_progress += TICK    
-            elif system_state == SystemState.CS_SAVE:
-                if cs_progress >= self.half_cs:
-                    # Save Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, outgoing_process.pid, "CS_SAVE")
-                    segment_start_time = self.current_time
-                  
-                    # Outgoing process was terminated!
-                    outgoing_process.completion_time = self.current_time
-                    outgoing_process.turnaround_time = outgoing_process.completion_time - outgoing_process.arrival_time
-                    
-                    outgoing_process = None
-                    cs_progress = 0
-                    system_state = SystemState.IDLE # we're gonna select the next candidate if there's any!
-                    continue # no ticks!
-                cs_progress += TICK
-            elif system_state is SystemState.EXECUTING: # non-preemptive execution
-                if ready_queue[0].new_event_occurred: # non-preemptive, so we don't look at the ready queue anymore.
-                    pass
-                if current_process.remaining_time <= 0: # terminated
-                    # Burst Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                    segment_start_time = self.current_time
-                    
-                    current_process.state = ProcessState.TERMINATED
-                    completed_count += 1
-                    
-                    outgoing_process = current_process
-                    current_process = None
-                    
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    continue # no ticks!
-                current_process.remaining_time -= TICK
-                               
-            elif system_state is SystemState.IDLE:
-                candidate: Process | None = None if len(ready_queue[0].queue) == 0 else max(ready_queue[0].queue, key=lambda p: (p.wait_time)/p.burst_time) # since HRRN is non-preemptive, and every process in the ready queue was waiting from its arrival time, so the waiting time for them is equal to current time - arrival time.                
-                if candidate:
-                    
-                    # Log IDLE time if we were waiting
-                    if self.current_time > segment_start_time: # avoid logging on 0 if a process arrived at 0 and system was idle(situations like: system is idle, but it switches into other states instantly, no ticks)
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, None, "IDLE")
-                        segment_start_time = self.current_time
-                        
-                    
-                    ready_queue[0].queue.remove(candidate) # remove the candidate from ready queue!
-                    current_process = candidate # Removed from queue
-                    system_state = SystemState.CS_LOAD
-                    cs_progress = 0
-                    ready_queue[0].new_event_occurred = False # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
-                    
-                    continue # no ticks!     
-            # Advance Time
-            
-            for p in ready_queue[0].queue:
-                p.wait_time += TICK
-                
-            self.current_time += TICK
-            # Safety break
-            if (system_state == SystemState.IDLE and 
-                len(ready_queue[0].queue) == 0 and 
-                next_arrival_idx >= total_data_items and 
-                current_process is None and
-                outgoing_process is None):
-                break
-
+        self._simulate("HRRN", [QueueLevel(q=None, algo="HRRN", queue=[])]) # non-Preemptive logic
 
     def RR(self): # Round Robin
-        print(f"Running Algorithm: RR...")
-        # --- Initialization ---
-        self._reset_simulation_objects()
-        system_state = SystemState.IDLE
-        current_process: Optional[Process] = None
-        outgoing_process: Optional[Process] = None # For CS_SAVE
-        # CS Tracking
-        cs_progress = 0
-        # Quantum Tracking
-        current_quantum_counter = 0
-        # Logging Pointers
-        segment_start_time = 0
-        next_arrival_idx = 0
-        completed_count = 0
-        total_data_items = len(self.input_data_list)
-        
-        # ready queue
-        ready_queue: List[QueueLevel] = [
-            QueueLevel(
-                q=self.q, # Preemptive logic
-                algo="RR",
-                queue=[]
-            )
-        ]
-        while completed_count <= total_data_items:
-            # 1. Handle Arrivals.
-            while next_arrival_idx < total_data_items:
-                proc = self.processes[next_arrival_idx]
-                if proc.arrival_time <= self.current_time:
-                    proc.state = ProcessState.READY
-                    # add to ready queue
-                    ready_queue[0].queue.append(proc)
-                    ready_queue[0].new_event_occurred = True
-                    proc.process_ready_queue_id = 0
-                    next_arrival_idx += 1
-                    self._add_log(ready_queue[0].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
-                else:
-                    break
-            
-
-            if system_state == SystemState.CS_LOAD: 
-                if ready_queue[0].new_event_occurred: # a new process just arrived? okay, we don't care since the RR use the same policy as the FCFS.
-                    pass
-                if cs_progress >= self.half_cs:
-                    # Load Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                    segment_start_time = self.current_time
-                    
-                    system_state = SystemState.EXECUTING
-                    current_process.state = ProcessState.RUNNING
-                    current_quantum_counter = 0
-                    cs_progress = 0
-
-                    # First run metrics
-                    if current_process.start_time == -1:
-                        current_process.start_time = self.current_time
-                        current_process.response_time = current_process.start_time - current_process.arrival_time
-                        # current_process.wait_time = current_process.response_time # preemptive WT≠RT
-                    continue # no ticks!
-                cs_progress += TICK    
-            elif system_state == SystemState.CS_SAVE:
-                if cs_progress >= self.half_cs:
-                    # Save Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, outgoing_process.pid, "CS_SAVE")
-                    segment_start_time = self.current_time
-                    if outgoing_process.state is ProcessState.TERMINATED:
-                        outgoing_process.completion_time = self.current_time
-                        outgoing_process.turnaround_time = outgoing_process.completion_time - outgoing_process.arrival_time
-                    elif outgoing_process.state is ProcessState.READY:
-                        ready_queue[0].queue.append(outgoing_process)
-                    outgoing_process = None
-                    cs_progress = 0
-                    
-                    system_state = SystemState.IDLE
-                    continue # no ticks!
-                cs_progress += TICK
-            elif system_state is SystemState.EXECUTING: # preemptive execution
-                if ready_queue[0].new_event_occurred: # that means a new process just arrived. But we don't care :)
-                    pass
-                if current_process.remaining_time <= 0: # terminated
-                    # Burst Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                    segment_start_time = self.current_time
-                    
-                    current_process.state = ProcessState.TERMINATED
-                    completed_count += 1
-                    
-                    outgoing_process = current_process
-                    current_process = None
-                    current_quantum_counter = 0
-                    
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    continue # no ticks!
-                elif current_quantum_counter >= self.q:  # quantum time expired?
-                    # Log quantum time expired
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                    segment_start_time = self.current_time
-                    
-                    # Ready for CS_save?
-                    current_process.state = ProcessState.READY # append ready queue in CS_Save!
-                    outgoing_process = current_process
-                    current_process = None
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    current_quantum_counter = 0
-                    continue # no ticks!
-                current_process.remaining_time -= TICK
-                current_quantum_counter += TICK
-                               
-            elif system_state is SystemState.IDLE:
-                candidate: Process | None = None if len(ready_queue[0].queue) == 0 else ready_queue[0].queue.pop(0) # since input data is already sorted based on at.
-                
-                if candidate:
-                    
-                    # Log IDLE time if we were waiting
-                    if self.current_time > segment_start_time: # avoid logging on 0 if a process arrived at 0 and system was idle(situations like: system is idle, but it switches into other states instantly, no ticks)
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, None, "IDLE")
-                        segment_start_time = self.current_time
-                        
-                    
-                    current_process = candidate # Removed from queue
-                    system_state = SystemState.CS_LOAD
-                    cs_progress = 0
-                    ready_queue[0].new_event_occurred = False # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
-                    
-                    continue # no ticks!     
-            # Advance Time
-            
-            for p in ready_queue[0].queue:
-                p.wait_time += TICK
-                
-            self.current_time += TICK
-            # Safety break
-            if (system_state == SystemState.IDLE and 
-                len(ready_queue[0].queue) == 0 and 
-                next_arrival_idx >= total_data_items and 
-                current_process is None and
-                outgoing_process is None):
-                break
-
-    def SRTF(self): # Shortest Remaining Time First
-        print(f"Running Algorithm: SRTF...")
-        # --- Initialization ---
-        self._reset_simulation_objects()
-        system_state = SystemState.IDLE
-        current_process: Optional[Process] = None
-        outgoing_process: Optional[Process] = None # For CS_SAVE
-        # CS Tracking
-        cs_progress = 0
-        # Quantum Tracking
-        current_quantum_counter = 0
-        # Logging Pointers
-        segment_start_time = 0
-        next_arrival_idx = 0
-        completed_count = 0
-        total_data_items = len(self.input_data_list)
-        
-        # ready queue
-        ready_queue: List[QueueLevel] = [
-            QueueLevel(
-                q=self.q, # Preemptive logic
-                algo="SRTF",
-                queue=[]
-            )
-        ]
-        while completed_count <= total_data_items:
-            # 1. Handle Arrivals.
-            while next_arrival_idx < total_data_items:
-                proc = self.processes[next_arrival_idx]
-                if proc.arrival_time <= self.current_time:
-                    proc.state = ProcessState.READY
-                    # add to ready queue
-                    ready_queue[0].queue.append(proc)
-                    ready_queue[0].new_event_occurred = True
-                    proc.process_ready_queue_id = 0
-                    next_arrival_idx += 1
-                    self._add_log(ready_queue[0].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
-                else:
-                    break
-            
-
-            if system_state == SystemState.CS_LOAD: 
-                if ready_queue[0].new_event_occurred: # that means a new process just arrived. We check if there is a BETTER process than the one we are loading. let's check the event!
-                    ready_queue[0].new_event_occurred = False
-                    best_candidate_in_queue: Process = min(ready_queue[0].queue, key=lambda p: p.remaining_time)
-                    should_abort = False
-                    if best_candidate_in_queue.remaining_time < current_process.remaining_time:
-                        should_abort = True
-                    if should_abort:
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                        segment_start_time = self.current_time
-                        
-                    
-                        current_process.state = ProcessState.READY
-                        ready_queue[0].queue.append(current_process)
-                        current_process = None
-                        system_state = SystemState.IDLE
-                        cs_progress = 0
-                        continue # no ticks!
-                if cs_progress >= self.half_cs:
-                    # Load Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                    segment_start_time = self.current_time
-                    
-                    system_state = SystemState.EXECUTING
-                    current_process.state = ProcessState.RUNNING
-                    current_quantum_counter = 0
-                    cs_progress = 0
+        self._simulate("RR", [QueueLevel(q=self.q, algo="RR", queue=[])]) # Preemptive logic
 
-                    # First run metrics
-                    if current_process.start_time == -1:
-                        current_process.start_time = self.current_time
-                        current_process.response_time = current_process.start_time - current_process.arrival_time
-                        # current_process.wait_time = current_process.response_time # preemptive WT≠RT
-                    continue # no ticks!
-                cs_progress += TICK    
-            elif system_state == SystemState.CS_SAVE:
-                if cs_progress >= self.half_cs:
-                    # Save Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, outgoing_process.pid, "CS_SAVE")
-                    segment_start_time = self.current_time
-                    if outgoing_process.state is ProcessState.TERMINATED:
-                        outgoing_process.completion_time = self.current_time
-                        outgoing_process.turnaround_time = outgoing_process.completion_time - outgoing_process.arrival_time
-                    elif outgoing_process.state is ProcessState.READY:
-                        ready_queue[0].queue.append(outgoing_process)
-                    outgoing_process = None
-                    cs_progress = 0
-                    # Here we need to do something so in the next loop, we're gonna select the next candidate!
-                    system_state = SystemState.IDLE
-                    continue # no ticks!
-                cs_progress += TICK
-            elif system_state is SystemState.EXECUTING: # preemptive execution
-                if ready_queue[0].new_event_occurred: # that means a new process just arrived. We check if there is a BETTER process than the one we are loading. let's check the event!
-                    ready_queue[0].new_event_occurred = False
-                    best_candidate_in_queue: Process = min(ready_queue[0].queue, key=lambda p: p.remaining_time)
-                    if best_candidate_in_queue.remaining_time < current_process.remaining_time:
-                            # Log quantum time expired
-                            self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                            segment_start_time = self.current_time
-                            
-                            # Ready for CS_save?
-                            current_process.state = ProcessState.READY # append ready queue!
-                            outgoing_process = current_process
-                            current_process = None
-                            
-                            system_state = SystemState.CS_SAVE
-                            cs_progress = 0
-                            current_quantum_counter = 0
-                            continue # no ticks!
-                if current_process.remaining_time <= 0: # terminated
-                    # Burst Complete
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                    segment_start_time = self.current_time
-                    
-                    current_process.state = ProcessState.TERMINATED
-                    completed_count += 1
-                    
-                    outgoing_process = current_process
-                    current_process = None
-                    current_quantum_counter = 0
-                    
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    continue # no ticks!
-                elif current_quantum_counter >= self.q:  # quantum time expired?
-                    # Log quantum time expired
-                    self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                    segment_start_time = self.current_time
-                    
-                    # Ready for CS_save?
-                    current_process.state = ProcessState.READY # append ready queue!
-                    outgoing_process = current_process
-                    current_process = None
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    current_quantum_counter = 0
-                    continue # no ticks!
-                current_process.remaining_time -= TICK
-                current_quantum_counter += TICK
-                               
-            elif system_state is SystemState.IDLE:
-                candidate: Process | None = None if len(ready_queue[0].queue) == 0 else min(ready_queue[0].queue, key=lambda p: p.remaining_time) 
-                
-                if candidate:
-                    
-                    # Log IDLE time if we were waiting
-                    if self.current_time > segment_start_time: # avoid logging on 0 if a process arrived at 0 and system was idle(situations like: system is idle, but it switches into other states instantly, no ticks)
-                        self._add_log(ready_queue[0].algo, segment_start_time, self.current_time, None, "IDLE")
-                        segment_start_time = self.current_time
-                        
-                    
-                    ready_queue[0].queue.remove(candidate) # remove the candidate from ready queue!
-                    current_process = candidate # Removed from queue
-                    system_state = SystemState.CS_LOAD
-                    cs_progress = 0
-                    ready_queue[0].new_event_occurred = False # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
-                    
-                    continue # no ticks!     
-            # Advance Time
-            
-            for p in ready_queue[0].queue:
-                p.wait_time += TICK
-                
-            self.current_time += TICK
-            # Safety break
-            if (system_state == SystemState.IDLE and 
-                len(ready_queue[0].queue) == 0 and 
-                next_arrival_idx >= total_data_items and 
-                current_process is None and
-                outgoing_process is None):
-                break
+    def ARR(self): # Adaptive-quantum Round Robin
+        # FIFO like RR, the quantum of every dispatch comes from the AdaptiveRRConfig rule.
+        self._simulate("ARR", [QueueLevel(q=self.q, algo="ARR", queue=[])]) # Preemptive logic
+
+    def SRTF(self): # Shortest Remaining Time First
+        self._simulate("SRTF", [QueueLevel(q=self.q, algo="SRTF", queue=[])]) # Preemptive logic
+
+    def CFS(self): # Completely Fair Scheduler
+        # Smallest vruntime first, time slice = weighted share of the target latency (at least the minimum granularity).
+        self._simulate("CFS", [QueueLevel(q=None, algo="CFS", queue=[])]) # Preemptive logic
+
+    def STRIDE(self): # Stride Scheduling (deterministic proportional share)
+        # Smallest pass first, one quantum at a time, the pass grows by STRIDE1 / tickets on every tick.
+        self._simulate("STRIDE", [QueueLevel(q=self.q, algo="STRIDE", queue=[])]) # Preemptive logic
+
+    def LOTTERY(self): # Lottery Scheduling (randomized proportional share)
+        # A ticket is drawn for every dispatch, one quantum at a time.
+        self._simulate("LOTTERY", [QueueLevel(q=self.q, algo="LOTTERY", queue=[])]) # Preemptive logic
 
+    def EDF(self): # Earliest Deadline First
+        # Earliest absolute deadline first, a newcomer with an earlier deadline preempts. No deadline: runs last.
+        self._simulate("EDF", [QueueLevel(q=None, algo="EDF", queue=[])]) # Preemptive logic
+
+    def PRIORITY(self): # Static Priority, non-preemptive
+        # Highest (aged) priority first, runs until done.
+        self._simulate("PRIORITY", [QueueLevel(q=None, algo="PRIORITY", queue=[])]) # non-Preemptive logic
+
+    def PRIORITY_P(self): # Static Priority, preemptive
+        # Highest (aged) priority first, a newcomer with a higher priority preempts, and so does a waiter that ages past the running process.
+        self._simulate("PRIORITY_P", [QueueLevel(q=None, algo="PRIORITY_P", queue=[])]) # Preemptive logic
+
+    def FAIR_SHARE(self): # Fair-share scheduling between groups (users/tenants)
+        # The group with the least decayed usage per weight runs next, its members take turns, one quantum at a time.
+        self._simulate("FAIR_SHARE", [QueueLevel(q=self.q, algo="FAIR_SHARE", queue=[])]) # Preemptive logic
 
     def MLFQ(self):     # Multi‑Level Feedback Queue
-        # At most we have four queues, which they are generated only if needed(automatically).
+        # Every process arrives at the first queue and is demoted one level when its quantum (or allotment) is used up.
+        ## The levels come from the topology (self.mlfq), all of them are created up front. Default: four queues
         ## First queue: RR, q=self.q
         ## Second queue: RR, q=self.q*2
         ## Third queue: RR, q=self.q*3
         ## Fourth queue: FCFS
-        print(f"Running Algorithm: MLFQ...")
-        # --- Initialization ---
-        self._reset_simulation_objects()
-        system_state = SystemState.IDLE
-        current_process: Optional[Process] = None
-        outgoing_process: Optional[Process] = None # For CS_SAVE
-        # CS Tracking
-        cs_progress = 0
-        # Quantum Tracking
-        current_quantum_counter = 0
-        # Logging Pointers
-        segment_start_time = 0
-        next_arrival_idx = 0
-        completed_count = 0
-        total_data_items = len(self.input_data_list)
-        
-        
-        # ready queues
+        self.mlfq_config = self._mlfq_topology()
         ready_queue: List[QueueLevel] = [
-            QueueLevel(
-                q=self.q*1, # Preemptive logic
-                algo="RR",
-                queue=[]
-            )
-            # QueueLevel(
-            #     q=self.q*2, # Preemptive logic
-            #     algo="RR",
-            #     queue=[]
-            # ),
-            # QueueLevel(
-            #     q=self.q*3, # Preemptive logic
-            #     algo="RR",
-            #     queue=[]
-            # ),
-            # QueueLevel(
-            #     q=None, # non-Preemptive logic
-            #     algo="FCFS",
-            #     queue=[]
-            # )
+            QueueLevel(q=level.q, algo=level.algo, queue=[]) # FCFS: non-Preemptive logic
+            for level in self.mlfq_config.levels
+        ]
+        self._simulate("MLFQ", ready_queue, feedback=self.mlfq_config)
+
+    def _mlfq_topology(self) -> MLFQConfig:
+        config = self.mlfq or MLFQConfig()
+        if config.levels is not None:
+            return config
+        default_levels = [MLFQLevel("RR", self.q*1), MLFQLevel("RR", self.q*2), MLFQLevel("RR", self.q*3), MLFQLevel("FCFS")]
+        return MLFQConfig(levels=default_levels, boost_interval=config.boost_interval)
+
+    # ===== MLQ scheduling =====
+    def MLQ(self):     # Multi‑Level Queue 
+        # The levels come from the layout (self.mlq, validated in MLQLayout), see _default_mlq_layout for the default one.
+        ready_queue: List[QueueLevel] = [
+            QueueLevel(q=level.q, algo=level.algo, queue=[], categories=tuple(level.categories), share=level.share)
+            for level in self.mlq_layout.levels
         ]
+        self._simulate("MLQ", ready_queue)
+
+    def _default_mlq_layout(self) -> MLQLayout:
+        ## First queue: REAL TIME, RR, q=self.q (EDF if the input has deadlines)
+        ## Second queue: SYSTEM, SPN
+        ## Third queue: INTERACTIVE, RR, q=self.q*3
+        ## Fourth queue: BATCH, FCFS
+        real_time_algo: STSAlgo = "EDF" if self._has_deadlines() else "RR"
+        return MLQLayout(levels=[
+            MLQLevelSpec(algo=real_time_algo, categories=["REAL_TIME"], q=self.q*1),
+            MLQLevelSpec(algo="SPN", categories=["SYSTEM"]),
+            MLQLevelSpec(algo="RR", categories=["INTERACTIVE"], q=self.q*3),
+            MLQLevelSpec(algo="FCFS", categories=["BATCH"])
+        ])
+
+    # ===== Shared tick loop =====
+    def _simulate(self, algorithm: STSAlgo, ready_queue: List[QueueLevel], feedback: Optional[MLFQConfig] = None, resume: Optional[EngineState] = None) -> None:
+        """
+        Runs the tick loop over the given ready queue levels (index 0 = highest priority).
+        - A process is placed at the level that serves its category (level 0 if no level has a category).
+        - A process at a higher level preempts (or aborts the CS_LOAD of) a process at a lower level, unless the lower level is FCFS.
+        - Inside a level, the level's algorithm decides (SPN/SRTF/HRRN compare candidates, RR/SRTF have a quantum).
+        - feedback (MLFQ): on quantum expiry the process moves one level down (every time, or once its allotment is used up),
+          and every boost_interval ticks all processes go back to level 0.
+        - resume: continue a run from its engine state instead of starting it (see _fork), the ready queue comes from there.
+        """
+        if resume is None:
+            if self.verbose:
+                print(f"Running Algorithm: {algorithm}...")
+            # --- Initialization ---
+            self._reset_simulation_objects()
+            self.last_algorithm = algorithm
+            rng = random.Random(self.seed)
+            feedback_queues: Optional[FeedbackQueues] = None
+            next_boost_time: Optional[int] = None
+            if feedback is not None:
+                feedback_queues = FeedbackQueues(len(ready_queue))
+                for queue_level, level_queue in zip(ready_queue, feedback_queues.levels):
+                    queue_level.queue = level_queue
+                next_boost_time = feedback.boost_interval
+            else:
+                for queue_level in ready_queue:
+                    queue_level.queue = self._make_level_queue(queue_level.algo, rng, queue_level.q)
+            self.mlfq_boosts = 0
+            # Deficit round robin between the levels (MLQ with shares), None: strict priority
+            self.drr_deficits: Optional[List[float]] = None
+            if all(queue_level.share is not None for queue_level in ready_queue):
+                drr_round = self.mlq_layout.drr_round or 10 * self.q
+                total_share = sum(queue_level.share for queue_level in ready_queue)
+                self.drr_quanta = [drr_round * queue_level.share / total_share for queue_level in ready_queue]
+                self.drr_deficits = [0.0] * len(ready_queue)
+                self.drr_turn = len(ready_queue) - 1 # the first selection moves the turn to level 0
+            # Level bitmaps (bit i = level i), so the highest level with work is a find-first-set instead of a scan over the levels
+            self.nonempty_levels = 0 # levels with queued processes, kept by _enqueue/_dequeue
+            self.event_levels = 0 # levels that got a new process since they were last checked for preemption
+            self.executing_since = 0 # start of the current EXECUTING segment (preemption hysteresis)
+            self._reset_dvfs()
+            self._reset_checkpoints()
+            system_state = SystemState.IDLE
+            current_process: Optional[Process] = None
+            outgoing_process: Optional[Process] = None # For CS_SAVE
+            # CS Tracking
+            cs_progress = 0
+            # Quantum Tracking
+            current_quantum_counter = 0
+            current_quantum_limit: Optional[int] = None # time slice of the current dispatch, None: runs until it's done (or preempted)
+            # Logging Pointers
+            segment_start_time = 0
+            next_arrival_idx = 0
+            completed_count = 0
+            # category name -> level (MLQ), compiled once per run
+            category_level: Dict[str, int] = {name: i for i, queue_level in enumerate(ready_queue) for name in queue_level.categories}
+        else: # the run goes on from its engine state
+            feedback, feedback_queues, category_level = resume.feedback, resume.feedback_queues, resume.category_level
+            system_state, current_process, outgoing_process = resume.system_state, resume.current_process, resume.outgoing_process
+            cs_progress, segment_start_time = resume.cs_progress, resume.segment_start_time
+            current_quantum_counter, current_quantum_limit = resume.current_quantum_counter, resume.current_quantum_limit
+            next_arrival_idx, completed_count, next_boost_time = resume.next_arrival_idx, resume.completed_count, resume.next_boost_time
+        total_data_items = len(self.input_data_list)
 
         while completed_count <= total_data_items:
-            # 1. Handle Arrivals (append to the first queue).
+            # 1. Handle Arrivals (NEW processes go to the job pool first).
             while next_arrival_idx < total_data_items:
                 proc = self.processes[next_arrival_idx]
                 if proc.arrival_time <= self.current_time:
-                    proc.state = ProcessState.READY
-                    # add to ready queue
-                    ready_queue[0].queue.append(proc)
-                    ready_queue[0].new_event_occurred = True
-                    proc.process_ready_queue_id = 0
+                    proc.process_ready_queue_id = category_level.get(proc.category_name, 0)
+                    self.job_pool.push(proc)
                     next_arrival_idx += 1
-                    self._add_log(ready_queue[0].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
+                    self._add_log(ready_queue[proc.process_ready_queue_id].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
                 else:
                     break
-            
+            # 2. Medium-term scheduling: swap area -> ready queue (behaves like an arrival).
+            for proc in self._medium_term_schedule():
+                proc.state = ProcessState.READY
+                self._enqueue(ready_queue, proc)
+                self.event_levels |= 1 << proc.process_ready_queue_id
+                self._add_log(ready_queue[proc.process_ready_queue_id].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_SWAPPED_IN.value)
+            # 3. Long-term scheduling: job pool -> ready queue.
+            for proc in self._long_term_schedule(ready_queue):
+                proc.state = ProcessState.READY
+                self._enqueue(ready_queue, proc)
+                self.event_levels |= 1 << proc.process_ready_queue_id
+                if self.lts is not None:
+                    self._add_log(ready_queue[proc.process_ready_queue_id].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ADMITTED.value)
+            # 4. MLFQ priority boost: O(levels), the queued processes learn their new level when they leave the queue.
+            if feedback_queues is not None and next_boost_time is not None and self.current_time >= next_boost_time:
+                feedback_queues.boost()
+                for proc in (current_process, outgoing_process): # not queued right now
+                    if proc is not None:
+                        proc.process_ready_queue_id = 0
+                        proc.level_epoch = feedback_queues.epoch
+                ## processes that are neither queued nor on the CPU (WAITING, SUSPENDED_READY) go to level 0 when they come back (_enqueue)
+                self.nonempty_levels = 1 if len(ready_queue[0].queue) > 0 else 0 # everything queued is at level 0 now
+                self.event_levels |= 1
+                next_boost_time += feedback.boost_interval
+                self.mlfq_boosts += 1
 
             if system_state == SystemState.CS_LOAD: 
-                # a new process just arrived at a queue with a higher level than the current process?
-                best_candidate_in_queue = None
-                for i, queue_level in enumerate(ready_queue):
-                    if queue_level.new_event_occurred and i < current_process.process_ready_queue_id:
-                        queue_level.new_event_occurred = False
-                        best_candidate_in_queue = None if len(queue_level.queue) == 0 else queue_level.queue[0] # since input data is already sorted based on at.
-                        if best_candidate_in_queue:
-                                break
-                
-                if best_candidate_in_queue and best_candidate_in_queue.process_ready_queue_id < current_process.process_ready_queue_id:
+                # a better process arrived (higher level, or better inside the same level)? abort the load.
+                if self._better_candidate_arrived(ready_queue, current_process, loading=True):
                     self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
                     segment_start_time = self.current_time
                     
                     current_process.state = ProcessState.READY
-                    ready_queue[current_process.process_ready_queue_id].queue.append(current_process)
+                    self._enqueue(ready_queue, current_process)
                     current_process = None
                     system_state = SystemState.IDLE
                     cs_progress = 0
@@ -907,41 +558,24 @@ class Scheduler:
                     system_state = SystemState.EXECUTING
                     current_process.state = ProcessState.RUNNING
                     current_quantum_counter = 0
+                    current_quantum_limit = self._time_slice(ready_queue[current_process.process_ready_queue_id], current_process)
                     cs_progress = 0
+                    self.executing_since = self.current_time
 
                     # First run metrics
                     if current_process.start_time == -1:
                         current_process.start_time = self.current_time
                         current_process.response_time = current_process.start_time - current_process.arrival_time
-                        # current_process.wait_time = current_process.response_time # preemptive WT≠RT
                     continue # no ticks!
                 cs_progress += TICK    
             elif system_state == SystemState.CS_SAVE:
                 if cs_progress >= self.half_cs:
-
                     if outgoing_process.state is ProcessState.TERMINATED:
                         outgoing_process.completion_time = self.current_time
                         outgoing_process.turnaround_time = outgoing_process.completion_time - outgoing_process.arrival_time
+                        self._release_process(outgoing_process)
                     elif outgoing_process.state is ProcessState.READY:
-                        # outgoing_process.process_ready_queue_id could be 1, 2, 3
-                        if outgoing_process.process_ready_queue_id >= len(ready_queue): # Create a new queue level
-                            if outgoing_process.process_ready_queue_id == 3: # is it the last level (FCFS)?
-                                ready_queue.append(
-                                    QueueLevel(
-                                        algo="FCFS",
-                                        q=None,
-                                        queue=[]
-                                    )
-                                )
-                            else: 
-                                ready_queue.append(
-                                    QueueLevel(
-                                        algo="RR",
-                                        q=self.q*(outgoing_process.process_ready_queue_id+1),
-                                        queue=[]
-                                    )
-                                )
-                        ready_queue[outgoing_process.process_ready_queue_id].queue.append(outgoing_process)
+                        self._enqueue(ready_queue, outgoing_process)
                         
                     # Save Complete
                     self._add_log(ready_queue[outgoing_process.process_ready_queue_id].algo, segment_start_time, self.current_time, outgoing_process.pid, "CS_SAVE")
@@ -953,283 +587,36 @@ class Scheduler:
                     continue # no ticks!
                 cs_progress += TICK
             elif system_state is SystemState.EXECUTING: # preemptive + non-preemptive execution
-                if ready_queue[current_process.process_ready_queue_id].algo == "FCFS": # non-preemptive
-                    pass
-                else: # FIFO: queue_level could be 0, 1, 2
-                    # a new process just arrived at a queue with a higher level than the current process?
-                    best_candidate_in_queue = None
-                    for i, queue_level in enumerate(ready_queue):
-                        if queue_level.new_event_occurred and i < current_process.process_ready_queue_id:
-                            best_candidate_in_queue = None if len(queue_level.queue) == 0 else queue_level.queue[0] # since input data is already sorted based on at.
-                            queue_level.new_event_occurred = False
-                            if best_candidate_in_queue:
-                                break
-                    if best_candidate_in_queue and best_candidate_in_queue.process_ready_queue_id < current_process.process_ready_queue_id:
-                        self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                        segment_start_time = self.current_time
-                        
-                        # Ready for CS_save?
-                        current_process.state = ProcessState.READY # append ready queue!
-                        outgoing_process = current_process
-                        current_process = None
-                        
-                        system_state = SystemState.CS_SAVE
-                        current_quantum_counter = 0
-                        cs_progress = 0
-                        continue # no ticks!
-                
-                if current_process.remaining_time <= 0: # terminated
-                    # Burst Complete
+                # lock acquire/release points of the running process (discrete events: fast-forward stops right at them)
+                if current_process.critical_sections and self._lock_events(ready_queue, current_process):
+                    # blocked on a held lock: WAITING until the lock is handed over, not back to the ready queue
                     self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
                     segment_start_time = self.current_time
-                    
-                    current_process.state = ProcessState.TERMINATED
-                    completed_count += 1
-                    
+
                     outgoing_process = current_process
                     current_process = None
-                    current_quantum_counter = 0
-                    
                     system_state = SystemState.CS_SAVE
+                    current_quantum_counter = 0
                     cs_progress = 0
                     continue # no ticks!
-                elif ready_queue[current_process.process_ready_queue_id].algo == "RR" and current_quantum_counter >= ready_queue[current_process.process_ready_queue_id].q:  # quantum time expired? Only Preemptive Queue levels.
-                    # Log quantum time expired
-                    self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
+                current_level = ready_queue[current_process.process_ready_queue_id]
+                if self._better_candidate_arrived(ready_queue, current_process, loading=False):
+                    self._add_log(current_level.algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
                     segment_start_time = self.current_time
                     
                     # Ready for CS_save?
-                    current_process.state = ProcessState.READY # append  to the next ready queue in CS_Save!
-                    current_process.process_ready_queue_id+=1 # here's the thing.
+                    current_process.state = ProcessState.READY # append ready queue in CS_Save!
                     outgoing_process = current_process
                     current_process = None
-                    system_state = SystemState.CS_SAVE
-                    cs_progress = 0
-                    current_quantum_counter = 0
-                    continue # no ticks!
-                current_process.remaining_time -= TICK
-                if ready_queue[current_process.process_ready_queue_id].algo == "RR":
-                    current_quantum_counter += TICK
-                               
-            elif system_state is SystemState.IDLE:
-                for queue_level in ready_queue: # Iterate through queues in order of priority
-                    candidate: Process = None if len(queue_level.queue) == 0 else queue_level.queue.pop(0) # since input data is already sorted based on at.
-                    if candidate:
-                        break
-                
-                if candidate:
-                    # Log IDLE time if we were waiting
-                    if self.current_time > segment_start_time: # avoid logging on 0 if a process arrived at 0 and system was idle(situations like: system is idle, but it switches into other states instantly, no ticks)
-                        self._add_log(ready_queue[candidate.process_ready_queue_id].algo, segment_start_time, self.current_time, None, "IDLE")
-                        segment_start_time = self.current_time
-                        
-                    
-                    current_process = candidate # Removed from queue
-                    system_state = SystemState.CS_LOAD
-                    cs_progress = 0
-                    ready_queue[current_process.process_ready_queue_id].new_event_occurred = False # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
-                    
-                    continue # no ticks!     
-            # Advance Time
-            
-            for queue_level in ready_queue:
-                for p in queue_level.queue:
-                    p.wait_time += TICK # add waiting time to all processes in all queues.
-                
-            self.current_time += TICK
-            # Safety break
-            ## Check if every queue list is empty
-            are_all_queues_empty = all(len(queue_level.queue) == 0 for queue_level in ready_queue)
-            if (system_state == SystemState.IDLE and 
-                are_all_queues_empty and 
-                next_arrival_idx >= total_data_items and 
-                current_process is None and
-                outgoing_process is None):
-                break
-
-
-    # ===== MLQ scheduling =====
-    def MLQ(self):     # Multi‑Level Queue 
-        # At most we have four queues, which they are generated only if needed(automatically).
-        ## First queue: REAL TIME,RR, q=self.q
-        ## Second queue: SYSTEM, SPN , q=self.q*2
-        ## Third queue: INTERACTIVE, FF RR, q=self.q*3
-        ## Fourth queue: FCFS
-        print(f"Running Algorithm: MLQ...")
-        # --- Initialization ---
-        self._reset_simulation_objects()
-        system_state = SystemState.IDLE
-        current_process: Optional[Process] = None
-        outgoing_process: Optional[Process] = None # For CS_SAVE
-        # CS Tracking
-        cs_progress = 0
-        # Quantum Tracking
-        current_quantum_counter = 0
-        # Logging Pointers
-        segment_start_time = 0
-        next_arrival_idx = 0
-        completed_count = 0
-        total_data_items = len(self.input_data_list)
-        
-        
-        # ready queues
-        ready_queue: List[QueueLevel] = [
-            QueueLevel(
-                q=self.q*1, # Preemptive logic
-                algo="RR",
-                queue=[]
-            ),
-            QueueLevel(
-                q=self.q*2, # Preemptive logic
-                algo="SPN",
-                queue=[]
-            ),
-            QueueLevel(
-                q=self.q*3, # Preemptive logic
-                algo="RR",
-                queue=[]
-            ),
-            QueueLevel(
-                q=None, # non-Preemptive logic
-                algo="FCFS",
-                queue=[]
-            )
-        ]
-
-        while completed_count <= total_data_items:
-            # 1. Handle Arrivals (append to the first queue).
-            while next_arrival_idx < total_data_items:
-                proc = self.processes[next_arrival_idx]
-                if proc.arrival_time <= self.current_time:
-                    proc.state = ProcessState.READY
-                    
-                    # add to ready queue
-                    if proc.category == ProcessCategory.REAL_TIME.value: # 0, RR
-                        ready_queue[0].queue.append(proc)
-                        ready_queue[0].new_event_occurred = True
-                        proc.process_ready_queue_id = 0
-                    elif proc.category == ProcessCategory.SYSTEM.value: # 1, SPN
-                        ready_queue[1].queue.append(proc)
-                        ready_queue[1].new_event_occurred = True
-                        proc.process_ready_queue_id = 1
-                    elif proc.category == ProcessCategory.INTERACTIVE.value: # 2, RR
-                        ready_queue[2].queue.append(proc)
-                        ready_queue[2].new_event_occurred = True
-                        proc.process_ready_queue_id = 2
-                    elif proc.category == ProcessCategory.BATCH.value: # 3, FCFS
-                        ready_queue[3].queue.append(proc)
-                        ready_queue[3].new_event_occurred = True
-                        proc.process_ready_queue_id = 3
-    
-                    next_arrival_idx += 1
-                    self._add_log(ready_queue[proc.process_ready_queue_id].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_ARRIVAL.value)
-                else:
-                    break
-            
-
-            if system_state == SystemState.CS_LOAD: 
-                # a new process just arrived at a queue with a higher level than the current process?
-                best_candidate_in_queue = None
-                for i, queue_level in enumerate(ready_queue):
-                    if queue_level.new_event_occurred and i < current_process.process_ready_queue_id:
-                        queue_level.new_event_occurred = False
-                        best_candidate_in_queue = None if len(queue_level.queue) == 0 else queue_level.queue[0] # since input data is already sorted based on at.
-                        if best_candidate_in_queue:
-                                break
-                
-                if best_candidate_in_queue and best_candidate_in_queue.process_ready_queue_id < current_process.process_ready_queue_id:
-                    self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                    segment_start_time = self.current_time
-                    
-                    current_process.state = ProcessState.READY
-                    ready_queue[current_process.process_ready_queue_id].queue.append(current_process)
-                    current_process = None
-                    system_state = SystemState.IDLE
-                    cs_progress = 0
-                    continue # no ticks!
-
-                if cs_progress >= self.half_cs:
-                    # Load Complete
-                    self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "CS_LOAD")
-                    segment_start_time = self.current_time
                     
-                    system_state = SystemState.EXECUTING
-                    current_process.state = ProcessState.RUNNING
+                    system_state = SystemState.CS_SAVE
                     current_quantum_counter = 0
                     cs_progress = 0
-
-                    # First run metrics
-                    if current_process.start_time == -1:
-                        current_process.start_time = self.current_time
-                        current_process.response_time = current_process.start_time - current_process.arrival_time
-                        # current_process.wait_time = current_process.response_time # preemptive WT≠RT
-                    continue # no ticks!
-                cs_progress += TICK    
-            elif system_state == SystemState.CS_SAVE:
-                if cs_progress >= self.half_cs:
-
-                    if outgoing_process.state is ProcessState.TERMINATED:
-                        outgoing_process.completion_time = self.current_time
-                        outgoing_process.turnaround_time = outgoing_process.completion_time - outgoing_process.arrival_time
-                    elif outgoing_process.state is ProcessState.READY:
-                        # outgoing_process.process_ready_queue_id could be 1, 2, 3
-                        if outgoing_process.process_ready_queue_id >= len(ready_queue): # Create a new queue level
-                            if outgoing_process.process_ready_queue_id == 3: # is it the last level (FCFS)?
-                                ready_queue.append(
-                                    QueueLevel(
-                                        algo="FCFS",
-                                        q=None,
-                                        queue=[]
-                                    )
-                                )
-                            else: 
-                                ready_queue.append(
-                                    QueueLevel(
-                                        algo="RR",
-                                        q=self.q*(outgoing_process.process_ready_queue_id+1),
-                                        queue=[]
-                                    )
-                                )
-                        ready_queue[outgoing_process.process_ready_queue_id].queue.append(outgoing_process)
-                        
-                    # Save Complete
-                    self._add_log(ready_queue[outgoing_process.process_ready_queue_id].algo, segment_start_time, self.current_time, outgoing_process.pid, "CS_SAVE")
-                    segment_start_time = self.current_time          
-                    outgoing_process = None
-                    cs_progress = 0
-                    
-                    system_state = SystemState.IDLE
                     continue # no ticks!
-                cs_progress += TICK
-            elif system_state is SystemState.EXECUTING: # preemptive + non-preemptive execution
-                if ready_queue[current_process.process_ready_queue_id].algo == "FCFS": # non-preemptive
-                    pass
-                else: # FIFO: queue_level could be 0, 1, 2
-                    # a new process just arrived at a queue with a higher level than the current process?
-                    best_candidate_in_queue = None
-                    for i, queue_level in enumerate(ready_queue):
-                        if queue_level.new_event_occurred and i < current_process.process_ready_queue_id:
-                            best_candidate_in_queue = None if len(queue_level.queue) == 0 else queue_level.queue[0] # since input data is already sorted based on at.
-                            queue_level.new_event_occurred = False
-                            if best_candidate_in_queue:
-                                break
-                    if best_candidate_in_queue and best_candidate_in_queue.process_ready_queue_id < current_process.process_ready_queue_id:
-                        self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
-                        segment_start_time = self.current_time
-                        
-                        # Ready for CS_save?
-                        current_process.state = ProcessState.READY # append ready queue!
-                        outgoing_process = current_process
-                        current_process = None
-                        
-                        system_state = SystemState.CS_SAVE
-                        current_quantum_counter = 0
-                        cs_progress = 0
-                        continue # no ticks!
                 
                 if current_process.remaining_time <= 0: # terminated
                     # Burst Complete
-                    self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
+                    self._add_log(current_level.algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
                     segment_start_time = self.current_time
                     
                     current_process.state = ProcessState.TERMINATED
@@ -1242,85 +629,792 @@ class Scheduler:
                     system_state = SystemState.CS_SAVE
                     cs_progress = 0
                     continue # no ticks!
-                elif ready_queue[current_process.process_ready_queue_id].algo == "RR" and current_quantum_counter >= ready_queue[current_process.process_ready_queue_id].q:  # quantum time expired? Only Preemptive Queue levels.
+                elif current_quantum_limit is not None and current_quantum_counter >= current_quantum_limit:  # quantum time expired? Only Preemptive Queue levels.
+                    if self.on_quantum_expiry is not None: # quantum sweep: the runs with a longer quantum part ways here (see sweep_quantum)
+                        self.on_quantum_expiry(EngineState.capture(locals()))
                     # Log quantum time expired
-                    self._add_log(ready_queue[current_process.process_ready_queue_id].algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
+                    self._add_log(current_level.algo, segment_start_time, self.current_time, current_process.pid, "EXECUTING")
                     segment_start_time = self.current_time
                     
                     # Ready for CS_save?
-                    current_process.state = ProcessState.READY # append  to the next ready queue in CS_Save!
-                    current_process.process_ready_queue_id+=1 # here's the thing.
+                    current_process.state = ProcessState.READY # append to the (next) ready queue in CS_Save!
+                    if feedback_queues is not None and current_process.process_ready_queue_id + 1 < len(ready_queue) and self._allotment_used_up(feedback, feedback_queues, current_process):
+                        current_process.process_ready_queue_id += 1 # here's the thing.
+                        feedback_queues.reset_level_time(current_process)
                     outgoing_process = current_process
                     current_process = None
                     system_state = SystemState.CS_SAVE
                     cs_progress = 0
                     current_quantum_counter = 0
                     continue # no ticks!
-                current_process.remaining_time -= TICK
-                if ready_queue[current_process.process_ready_queue_id].algo == "RR":
+                self._execute(current_process, TICK)
+                if self.drr_deficits is not None:
+                    self.drr_deficits[current_process.process_ready_queue_id] -= TICK
+                if not isinstance(current_level.queue, list):
+                    current_level.queue.charge(current_process, TICK) # CFS: vruntime, STRIDE: pass
+                if current_quantum_limit is not None:
                     current_quantum_counter += TICK
                                
-            elif system_state is SystemState.IDLE: # Iterate through queues in order of priority
-                candidate = None
-                if len(ready_queue[0].queue) != 0: # RR, 0, real-time
-                    candidate: Process | None = None if len(ready_queue[0].queue) == 0 else ready_queue[0].queue[0] # since input data is already sorted based on at.  
-                elif len(ready_queue[1].queue) != 0: # SPN, 0, system
-                    candidate: Process = None if len(ready_queue[1].queue) == 0 else min(ready_queue[1].queue, key=lambda p: p.remaining_time)
-                elif len(ready_queue[2].queue) != 0: # RR, 0, realtime
-                    candidate: Process | None = None if len(ready_queue[2].queue.queue) == 0 else ready_queue[2].queue.queue[0] # since input data is already sorted based on at.
-                elif len(ready_queue[3].queue) != 0: # FCFS, 3, batch
-                    candidate: Process | None = None if len(ready_queue[3].queue) == 0 else ready_queue[3].queue[0] # since input data is already sorted based on at.
-                    
+            elif system_state is SystemState.IDLE:
+                candidate: Process | None = self._select_candidate(ready_queue) # Iterate through queues in order of priority
                 
                 if candidate:
+                    self._dequeue(ready_queue, candidate) # remove the candidate from ready queue! (MLFQ: this also resolves its level after a boost)
                     # Log IDLE time if we were waiting
                     if self.current_time > segment_start_time: # avoid logging on 0 if a process arrived at 0 and system was idle(situations like: system is idle, but it switches into other states instantly, no ticks)
                         self._add_log(ready_queue[candidate.process_ready_queue_id].algo, segment_start_time, self.current_time, None, "IDLE")
                         segment_start_time = self.current_time
                         
-                    ready_queue[candidate.process_ready_queue_id].remov
+                    self.swap_protected.discard(candidate.pid)
                     current_process = candidate # Removed from queue
                     system_state = SystemState.CS_LOAD
                     cs_progress = 0
-                    ready_queue[current_process.process_ready_queue_id].new_event_occurred = False # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
+                    self.event_levels &= ~(1 << current_process.process_ready_queue_id) # Since the best candidate till now is already chosen and the time is gonna be frozen for one tick.
                     
                     continue # no ticks!     
             # Advance Time
-            
-            for queue_level in ready_queue:
-                for p in queue_level.queue:
-                    p.wait_time += TICK # add waiting time to all processes in all queues.
-                
-            self.current_time += TICK
+            ## wait_time isn't added to every queued process here, _dequeue adds the whole stay at once.
+            skipped = 0
+            if self.fast_forward:
+                ## The next ticks would only repeat this tick's progress (no arrival, no boost, no swap/admission work, no state change): do them at once.
+                skipped = self._quiet_ticks_ahead(ready_queue, system_state, current_process, cs_progress, current_quantum_counter, current_quantum_limit, next_arrival_idx, next_boost_time)
+                if skipped > 0:
+                    if system_state is SystemState.EXECUTING:
+                        self._execute(current_process, skipped)
+                        if self.drr_deficits is not None:
+                            self.drr_deficits[current_process.process_ready_queue_id] -= skipped
+                        if isinstance(current_level.queue, CFSRunQueue):
+                            for _ in range(skipped): # tick by tick, so float vruntime sums stay exactly the same
+                                current_level.queue.charge(current_process, TICK)
+                        elif not isinstance(current_level.queue, list): # the other queues only count (integer) ticks
+                            current_level.queue.charge(current_process, skipped)
+                        if current_quantum_limit is not None:
+                            current_quantum_counter += skipped
+                    elif system_state is not SystemState.IDLE: # CS_LOAD, CS_SAVE
+                        cs_progress += skipped
+            self.current_time += TICK + skipped
+            if self.dvfs is not None:
+                self._dvfs_advance(system_state is not SystemState.IDLE, TICK + skipped)
             # Safety break
             ## Check if every queue list is empty
-            are_all_queues_empty = all(len(queue_level.queue) == 0 for queue_level in ready_queue)
+            are_all_queues_empty = self.nonempty_levels == 0
             if (system_state == SystemState.IDLE and 
                 are_all_queues_empty and 
+                len(self.job_pool) == 0 and
+                not self._swap_activity() and
                 next_arrival_idx >= total_data_items and 
                 current_process is None and
                 outgoing_process is None):
                 break
+            # Checkpoint: the loop resumes right here, at the top of the next tick (see resume_checkpoint)
+            if self.checkpoint is not None and self._checkpoint_due():
+                self._write_checkpoint(EngineState.capture(locals()))
+
+
+    def _quiet_ticks_ahead(self, ready_queue: List[QueueLevel], system_state: SystemState, current_process: Optional[Process], cs_progress: float, quantum_counter: int, quantum_limit: Optional[int], next_arrival_idx: int, next_boost_time: Optional[int]) -> int:
+        """
+        How many of the following ticks can be skipped: the ones where the loop would only
+        repeat the current state's per-tick progress (checked against the same conditions the loop checks).
+        """
+        if len(self.job_pool) > 0 or self._swap_activity(): # admission stalls and swap transfers are per tick
+            return 0
+        ahead = math.inf
+        if next_arrival_idx < len(self.processes):
+            ahead = self.processes[next_arrival_idx].arrival_time - self.current_time - TICK
+        if next_boost_time is not None:
+            ahead = min(ahead, next_boost_time - self.current_time - TICK)
+        if system_state is SystemState.EXECUTING:
+            ahead = min(ahead, self._ticks_for_work(current_process, current_process.remaining_time)) # the tick that sees 0 left is not skipped
+            lock_point = self._next_lock_point(current_process)
+            if lock_point is not None: # same for the next acquire/release
+                ahead = min(ahead, self._ticks_for_work(current_process, lock_point - (current_process.burst_time - current_process.remaining_time)))
+            if quantum_limit is not None:
+                ahead = min(ahead, quantum_limit - quantum_counter)
+            if self.event_levels >> current_process.process_ready_queue_id & 1 and self.preemption and self.preemption.min_granularity is not None:
+                ahead = min(ahead, self.executing_since + self.preemption.min_granularity - self.current_time - TICK) # a deferred newcomer is re-checked then
+        elif system_state is not SystemState.IDLE: # CS_LOAD, CS_SAVE: until the half context switch is done
+            ahead = min(ahead, math.ceil(self.half_cs - cs_progress))
+        if system_state in (SystemState.EXECUTING, SystemState.CS_LOAD):
+            overtake_time = self._aging_overtake_time(ready_queue[current_process.process_ready_queue_id], current_process)
+            if overtake_time is not None: # ticked one by one from the tick before, so float rounding can't skip past it
+                ahead = min(ahead, math.floor(overtake_time) - self.current_time - TICK)
+        if self.dvfs is not None and (ahead != math.inf or system_state is not SystemState.IDLE): # governor samples and the end of a frequency transition
+            ahead = min(ahead, self._next_dvfs_event() - self.current_time - TICK)
+        if ahead == math.inf: # idle with nothing left to come: the loop ends on its own
+            return 0
+        return max(0, int(ahead))
+
+    # --- DVFS ---
+    def _reset_dvfs(self) -> None:
+        self.energy = 0.0
+        self.time_at_frequency: Dict[int, int] = {}
+        self.frequency_transitions = 0
+        if self.dvfs is None:
+            return
+        levels = self.dvfs.frequencies
+        self.max_frequency = levels[-1]
+        self.frequency = levels[0] if self.dvfs.governor == "POWERSAVE" else levels[-1] # ONDEMAND starts fast
+        self.target_frequency = self.frequency
+        self.transition_end: Optional[int] = None # stalled until then
+        self.sampling_period = self.dvfs.sampling_period if self.dvfs.sampling_period is not None else 10 * self.q
+        self.next_sample: Optional[int] = self.sampling_period if self.dvfs.governor == "ONDEMAND" else None
+        self.window_busy = 0
+
+    def _execute(self, proc: Process, ticks: int) -> None:
+        """`ticks` of EXECUTING: full speed without DVFS, otherwise f / f_max of a tick of work per tick (nothing while stalled)."""
+        if self.dvfs is None:
+            proc.remaining_time -= ticks
+            return
+        if self.transition_end is not None:
+            return
+        proc.work_credit += ticks * self.frequency
+        done = proc.work_credit // self.max_frequency # at most one tick of work per tick, so points in the burst are hit exactly
+        proc.work_credit -= done * self.max_frequency
+        proc.remaining_time -= done
+
+    def _ticks_for_work(self, proc: Process, work: int) -> float:
+        """Ticks of EXECUTING until `work` more ticks of work are done at the current frequency."""
+        if self.dvfs is None:
+            return work
+        if self.transition_end is not None:
+            return math.inf # bounded by the end of the transition
+        return max(0, -(-(work * self.max_frequency - proc.work_credit) // self.frequency))
+
+    def _next_dvfs_event(self) -> float:
+        return min(t for t in (self.transition_end, self.next_sample, math.inf) if t is not None)
+
+    def _dvfs_advance(self, busy: bool, ticks: int) -> None:
+        """Energy and governor bookkeeping for the ticks that just passed (the frequency was the same for all of them)."""
+        power = self.dvfs.idle_power
+        if busy:
+            power += (self.dvfs.max_power - self.dvfs.idle_power) * (self.frequency / self.max_frequency) ** 3
+            self.window_busy += ticks
+        self.energy += power * ticks
+        self.time_at_frequency[self.frequency] = self.time_at_frequency.get(self.frequency, 0) + ticks
+        if self.transition_end is not None and self.current_time >= self.transition_end:
+            self.frequency = self.target_frequency
+            self.transition_end = None
+        if self.next_sample is not None and self.current_time >= self.next_sample:
+            load = self.window_busy / self.sampling_period
+            self.window_busy = 0
+            self.next_sample += self.sampling_period
+            if load > self.dvfs.up_threshold:
+                target = self.max_frequency
+            else: # the lowest level that keeps the load under the threshold
+                needed = load * self.frequency / self.dvfs.up_threshold
+                target = next((f for f in self.dvfs.frequencies if f >= needed), self.max_frequency) # load == threshold can round just above f_max
+            if target != self.frequency and self.transition_end is None:
+                self.frequency_transitions += 1
+                if self.dvfs.transition_latency == 0:
+                    self.frequency = target
+                else:
+                    self.target_frequency = target
+                    self.transition_end = self.current_time + self.dvfs.transition_latency
+
+    # --- Level Policies ---
+    def _clock(self) -> int:
+        return self.current_time # a bound method rather than a lambda, so copies of the scheduler (_fork) keep their own clock
+
+    def _make_level_queue(self, algo: STSAlgo, rng: random.Random, q: Optional[int] = None):
+        if algo == "CFS":
+            return CFSRunQueue()
+        if algo == "STRIDE":
+            return StrideQueue()
+        if algo == "LOTTERY":
+            return LotteryQueue(rng)
+        if algo == "EDF":
+            return EDFQueue()
+        if algo == "HRRN":
+            return HRRNQueue(self._clock)
+        if algo == "FAIR_SHARE":
+            config = self.fair_share or FairShareConfig()
+            return FairShareQueue(self._clock, config.weights, config.half_life if config.half_life is not None else 10 * q)
+        if algo == "ARR":
+            config = self.adaptive_rr or AdaptiveRRConfig()
+            return AdaptiveRRQueue(
+                config.rule, q,
+                config.min_quantum if config.min_quantum is not None else q,
+                config.max_quantum if config.max_quantum is not None else 8 * q,
+                config.target_latency if config.target_latency is not None else 8 * q,
+                config.growth
+            )
+        if algo in ("PRIORITY", "PRIORITY_P"):
+            return PriorityQueue(self.priority.aging_interval if self.priority else None)
+        return [] # kept in arrival order
+
+    def _enqueue(self, ready_queue: List[QueueLevel], proc: Process) -> None:
+        proc.ready_since = self.current_time
+        proc.in_ready_queue = True
+        queue = ready_queue[proc.process_ready_queue_id].queue
+        if isinstance(queue, FeedbackLevel) and queue.queues.missed_boost(proc):
+            proc.process_ready_queue_id = 0
+            proc.level_epoch = queue.queues.epoch
+            queue = ready_queue[0].queue
+        queue.append(proc)
+        self.nonempty_levels |= 1 << proc.process_ready_queue_id
+
+    def _dequeue(self, ready_queue: List[QueueLevel], proc: Process) -> None:
+        queue = ready_queue[proc.process_ready_queue_id].queue
+        if isinstance(queue, PriorityQueue):
+            proc.aged_priority = queue.effective_priority(proc, self.current_time) # kept while it's loaded/running
+        queue.remove(proc)
+        proc.in_ready_queue = False
+        level = proc.process_ready_queue_id # MLFQ: the level that really held it (resolved by remove)
+        if len(ready_queue[level].queue) == 0:
+            self.nonempty_levels &= ~(1 << level)
+        proc.wait_time += self.current_time - proc.ready_since # the whole stay in the ready queue at once
+
+    def _worth_preempting(self, current_process: Process, newcomer: Process, loading: bool) -> bool:
+        """Preemption hysteresis (PreemptionConfig) for a shorter newcomer: is the gain worth a context switch?"""
+        config = self.preemption
+        if config is None or (config.gain_factor is None and config.min_granularity is None):
+            return True
+        if config.gain_factor is not None and current_process.remaining_time - newcomer.remaining_time > config.gain_factor * self.cs:
+            return True
+        # a process still being loaded hasn't run yet
+        return config.min_granularity is not None and not loading and self.current_time - self.executing_since >= config.min_granularity
+
+    # --- Locks ---
+    def _next_lock_point(self, proc: Process) -> Optional[int]:
+        """Executed time at which the process acquires or releases its next lock, None: no critical section left."""
+        if proc.section_index >= len(proc.critical_sections):
+            return None
+        section = proc.critical_sections[proc.section_index]
+        return section.offset + section.duration if proc.holding is not None else section.offset
+
+    def _lock_events(self, ready_queue: List[QueueLevel], proc: Process) -> bool:
+        """Handles the releases/acquires due at the executed time of the running process. True: it blocked on a held lock."""
+        while True:
+            point = self._next_lock_point(proc)
+            if point is None or proc.burst_time - proc.remaining_time != point:
+                return False
+            if proc.holding is not None:
+                self._release_lock(ready_queue, proc)
+                proc.section_index += 1
+            elif not self._acquire_lock(ready_queue, proc, proc.critical_sections[proc.section_index].resource):
+                return True
+
+    def _acquire_lock(self, ready_queue: List[QueueLevel], proc: Process, resource: str) -> bool:
+        stats = self.lock_stats.setdefault(resource, LockStats())
+        stats.acquisitions += 1
+        owner = self.lock_owner.get(resource)
+        if owner is None:
+            self.lock_owner[resource] = proc
+            proc.holding = resource
+            return True
+        stats.contended += 1
+        waiters = self.lock_waiters.setdefault(resource, deque())
+        waiters.append(proc)
+        proc.state = ProcessState.WAITING
+        proc.blocked_since = self.current_time
+        stats.max_waiters = max(stats.max_waiters, len(waiters))
+        if not stats.in_convoy and len(waiters) >= self.lock_config.convoy_threshold:
+            stats.convoys += 1
+            stats.in_convoy = True
+            self.convoy_since[resource] = self.current_time
+        if self.lock_config.priority_inheritance:
+            self._lend_priority(ready_queue, owner, proc)
+        self._add_log(ready_queue[proc.process_ready_queue_id].algo, start_time=self.current_time, end_time=self.current_time, pid=proc.pid, event_type=ProcessEvents.PROCESS_BLOCKED.value)
+        return False
+
+    def _release_lock(self, ready_queue: List[QueueLevel], proc: Process) -> None:
+        """The running process leaves its critical section: the lock goes to the first waiter (FIFO), which becomes READY."""
+        resource = proc.holding
+        proc.holding = None
+        if proc.inherited_from is not None:
+            self._restore_priority(proc)
+        waiters = self.lock_waiters.get(resource)
+        if not waiters:
+            del self.lock_owner[resource]
+            return
+        stats = self.lock_stats[resource]
+        heir = waiters.popleft()
+        if stats.in_convoy and len(waiters) < self.lock_config.convoy_threshold:
+            stats.in_convoy = False
+            self.convoy_time[resource] = self.convoy_time.get(resource, 0) + self.current_time - self.convoy_since.pop(resource)
+        self.lock_owner[resource] = heir
+        heir.holding = resource
+        waited = self.current_time - heir.blocked_since
+        heir.lock_wait_time += waited
+        stats.total_wait += waited
+        heir.state = ProcessState.READY
+        self._enqueue(ready_queue, heir)
+        self.event_levels |= 1 << heir.process_ready_queue_id # like an arrival
+        self._add_log(ready_queue[heir.process_ready_queue_id].algo, start_time=self.current_time, end_time=self.current_time, pid=heir.pid, event_type=ProcessEvents.PROCESS_UNBLOCKED.value)
+        if self.lock_config.priority_inheritance:
+            for waiter in waiters:
+                self._lend_priority(ready_queue, heir, waiter)
+
+    def _lend_priority(self, ready_queue: List[QueueLevel], owner: Process, waiter: Process) -> None:
+        """Priority inheritance: the owner runs with the waiter's priority (PRIORITY/PRIORITY_P) or level (MLQ) until it releases."""
+        if self.last_algorithm in ("PRIORITY", "PRIORITY_P"):
+            if waiter.priority <= owner.priority:
+                return
+            if owner.inherited_from is None:
+                owner.inherited_from = (owner.priority, owner.aged_priority, owner.process_ready_queue_id)
+            owner.priority = waiter.priority
+            owner.aged_priority = max(owner.aged_priority, waiter.priority)
+            if owner.in_ready_queue: # re-keyed in place, its ready_since (aging) is kept
+                queue = ready_queue[owner.process_ready_queue_id].queue
+                queue.remove(owner)
+                queue.append(owner)
+                self.event_levels |= 1 << owner.process_ready_queue_id
+        elif self.last_algorithm == "MLQ":
+            level = waiter.process_ready_queue_id
+            if level >= owner.process_ready_queue_id:
+                return
+            if owner.inherited_from is None:
+                owner.inherited_from = (owner.priority, owner.aged_priority, owner.process_ready_queue_id)
+            if owner.in_ready_queue: # moved up in place, its ready_since is kept
+                old_level = owner.process_ready_queue_id
+                ready_queue[old_level].queue.remove(owner)
+                if len(ready_queue[old_level].queue) == 0:
+                    self.nonempty_levels &= ~(1 << old_level)
+                owner.process_ready_queue_id = level
+                ready_queue[level].queue.append(owner)
+                self.nonempty_levels |= 1 << level
+                self.event_levels |= 1 << level
+            else: # loading, saving or swapped out: it lands on the new level next time it's queued
+                owner.process_ready_queue_id = level
+
+    def _restore_priority(self, proc: Process) -> None:
+        """End of priority inheritance (the process is running and just released its lock)."""
+        proc.priority, proc.aged_priority, proc.process_ready_queue_id = proc.inherited_from
+        proc.inherited_from = None
+        self.event_levels |= self.nonempty_levels # whatever it kept waiting may preempt it now
+
+    def _aging_overtake_time(self, queue_level: QueueLevel, current_process: Process) -> Optional[float]:
+        """PRIORITY_P with aging: when the best waiter's aged priority reaches the one the current process was dispatched with (None: no aging, no waiter)."""
+        if queue_level.algo != "PRIORITY_P" or queue_level.queue.aging_interval is None:
+            return None
+        best = queue_level.queue.peek()
+        if best is None:
+            return None
+        return best.ready_since + (current_process.aged_priority - best.priority) * queue_level.queue.aging_interval
+
+    def _take_event(self, level: int) -> bool:
+        """Did the level get a new process since the last check? Clears the flag."""
+        bit = 1 << level
+        if self.event_levels & bit:
+            self.event_levels &= ~bit
+            return True
+        return False
+
+    def _current_wait(self, proc: Process) -> int:
+        """wait_time including the ongoing stay in the ready queue."""
+        return proc.wait_time + (self.current_time - proc.ready_since if proc.state is ProcessState.READY else 0)
+
+    def _time_slice(self, queue_level: QueueLevel, proc: Process) -> Optional[int]:
+        """How long the process may run in this dispatch (None: until it's done or preempted)."""
+        if self.drr_deficits is not None and queue_level.algo != "FCFS":
+            # DRR: never beyond the level's deficit (FCFS isn't interrupted, its level goes into debt instead)
+            level_slice = self._level_time_slice(queue_level, proc)
+            deficit_slice = max(TICK, math.ceil(self.drr_deficits[proc.process_ready_queue_id]))
+            return deficit_slice if level_slice is None else min(level_slice, deficit_slice)
+        return self._level_time_slice(queue_level, proc)
+
+    def _level_time_slice(self, queue_level: QueueLevel, proc: Process) -> Optional[int]:
+        if isinstance(queue_level.queue, FeedbackLevel) and queue_level.q is not None:
+            allotment = self.mlfq_config.levels[queue_level.queue.level].allotment
+            if allotment is not None: # never beyond what's left of the allotment
+                return min(queue_level.q, max(TICK, allotment - queue_level.queue.queues.level_time_used(proc)))
+        if queue_level.algo in ("RR", "SRTF", "STRIDE", "LOTTERY", "FAIR_SHARE"):
+            return queue_level.q
+        if queue_level.algo == "CFS":
+            return queue_level.queue.time_slice(proc, self.cfs_target_latency, self.cfs_min_granularity)
+        if queue_level.algo == "ARR":
+            return queue_level.queue.time_slice(proc)
+        return None
+
+    def _best_in_level(self, queue_level: QueueLevel) -> Optional[Process]:
+        """The process the level's algorithm would pick next (without removing it)."""
+        if len(queue_level.queue) == 0:
+            return None
+        if queue_level.algo in ("SPN", "SRTF"):
+            return min(queue_level.queue, key=lambda p: p.remaining_time)
+        if not isinstance(queue_level.queue, list):
+            return queue_level.queue.peek() # CFS: smallest vruntime, STRIDE: smallest pass, LOTTERY: the drawn ticket, EDF: earliest deadline, PRIORITY: highest aged priority, HRRN: highest response ratio
+        return queue_level.queue[0] # FCFS, RR: since the queue is kept in arrival order.
+
+    @staticmethod
+    def _allotment_used_up(feedback: MLFQConfig, feedback_queues: FeedbackQueues, proc: Process) -> bool:
+        """MLFQ demotion rule: every expired slice (no allotments), or once the time at this level reaches the allotment."""
+        allotment = feedback.levels[proc.process_ready_queue_id].allotment
+        return allotment is None or feedback_queues.level_time_used(proc) >= allotment
+
+    def _select_candidate(self, ready_queue: List[QueueLevel]) -> Optional[Process]:
+        if self.drr_deficits is not None:
+            return self._select_candidate_drr(ready_queue)
+        if self.nonempty_levels == 0:
+            return None
+        return self._best_in_level(ready_queue[lowest_set_bit(self.nonempty_levels)]) # the highest priority level with work
+
+    def _select_candidate_drr(self, ready_queue: List[QueueLevel]) -> Optional[Process]:
+        """
+        Deficit round robin between the levels: the level whose turn it is keeps the CPU while its deficit is positive,
+        then the turn moves on and the next non-empty level gets its quantum (share of the round) added.
+        An empty level loses its deficit, a level in debt (FCFS overran) skips turns until it's paid back.
+        """
+        if self.nonempty_levels == 0:
+            return None
+        deficits = self.drr_deficits
+        while True:
+            turn_has_work = self.nonempty_levels >> self.drr_turn & 1
+            if turn_has_work and deficits[self.drr_turn] > 0:
+                return self._best_in_level(ready_queue[self.drr_turn])
+            if not turn_has_work:
+                deficits[self.drr_turn] = min(0.0, deficits[self.drr_turn]) # no credit is saved, debt stays
+            self.drr_turn = (self.drr_turn + 1) % len(ready_queue)
+            if self.nonempty_levels >> self.drr_turn & 1:
+                deficits[self.drr_turn] += self.drr_quanta[self.drr_turn]
+
+    def _better_candidate_arrived(self, ready_queue: List[QueueLevel], current_process: Process, loading: bool) -> bool:
+        """
+        Should the current process (being loaded, or executing) give the CPU away?
+        1. a new process arrived at a queue with a higher level than the current process (FCFS levels aren't preempted while executing)
+        2. the current level's own rule: SPN (only while loading)/SRTF -> shorter remaining time, HRRN (only while loading) -> higher response ratio,
+           EDF -> earlier deadline, PRIORITY_P (PRIORITY only while loading) -> higher effective priority (PRIORITY_P: aged waiters too)
+        """
+        current_level_id = current_process.process_ready_queue_id
+        current_level = ready_queue[current_level_id]
+        if self.drr_deficits is None and (loading or current_level.algo != "FCFS"): # DRR levels are peers, no preemption between them
+            higher_levels = (1 << current_level_id) - 1
+            hits = self.event_levels & self.nonempty_levels & higher_levels
+            if hits:
+                # the first (highest) level with a new process preempts, the events below it stay for the next check
+                self.event_levels &= ~((1 << (lowest_set_bit(hits) + 1)) - 1)
+                return True
+            self.event_levels &= ~higher_levels
+        
+        if current_level.algo == "CFS":
+            # wakeup preemption: the newcomer is behind the current process by more than the minimum granularity
+            if self._take_event(current_level_id):
+                best_candidate_in_queue = self._best_in_level(current_level)
+                if best_candidate_in_queue and best_candidate_in_queue.vruntime + self.cfs_min_granularity < current_process.vruntime:
+                    return True
+        elif current_level.algo == "EDF":
+            if self._take_event(current_level_id):
+                best_candidate_in_queue = self._best_in_level(current_level)
+                if best_candidate_in_queue and EDFQueue.deadline_of(best_candidate_in_queue) < EDFQueue.deadline_of(current_process):
+                    return True
+        elif current_level.algo == "PRIORITY_P" or (loading and current_level.algo == "PRIORITY"):
+            # PRIORITY_P with aging: a waiter also overtakes just by waiting, so it's checked on every tick (see _aging_overtake_time)
+            if self._take_event(current_level_id) or (current_level.algo == "PRIORITY_P" and current_level.queue.aging_interval is not None):
+                best_candidate_in_queue = self._best_in_level(current_level)
+                if best_candidate_in_queue:
+                    queue = current_level.queue
+                    # the current process keeps the priority it was dispatched with (it doesn't age further while loaded or running)
+                    if queue.effective_priority(best_candidate_in_queue, self.current_time) > current_process.aged_priority:
+                        return True
+        elif current_level.algo == "SRTF" or (loading and current_level.algo == "SPN"):
+            if self._take_event(current_level_id): # that means a new process just arrived. let's check the event!
+                best_candidate_in_queue = self._best_in_level(current_level)
+                if best_candidate_in_queue and best_candidate_in_queue.remaining_time < current_process.remaining_time:
+                    if self._worth_preempting(current_process, best_candidate_in_queue, loading):
+                        return True
+                    if self.preemption.min_granularity is not None:
+                        self.event_levels |= 1 << current_level_id # deferred: check again on the next tick, until the gain is gone or the granularity is reached
+        elif loading and current_level.algo == "HRRN":
+            # Only on arrivals: re-checking every tick lets two loads abort each other forever (their ratios keep overtaking each other).
+            if self._take_event(current_level_id):
+                best_candidate_in_queue = self._best_in_level(current_level)
+                if best_candidate_in_queue and self._current_wait(best_candidate_in_queue)/best_candidate_in_queue.burst_time > (current_process.wait_time)/current_process.burst_time:
+                    return True
+        return False
+
+
+    # --- Long-Term Scheduler ---
+    def _long_term_schedule(self, ready_queue: List[QueueLevel]) -> List[Process]:
+        """
+        Admits processes from the job pool (in the LTS algorithm's order) while the head of the pool fits:
+        free memory >= its memory size, and the degree of multiprogramming is below the limit.
+        Admission is strictly in order, a head that doesn't fit blocks the ones behind it (admission_stalls counts the blocked ticks).
+        Without a LTS config every arrived process is admitted immediately.
+        With a medium-term scheduler, swapped-out processes come back before new ones are admitted, and a head
+        blocked by memory makes room by swapping READY processes out. The memory they free is kept for the head:
+        nothing swaps in until the head is admitted.
+        """
+        admitted: List[Process] = []
+        while len(self.job_pool) > 0:
+            proc = self.job_pool.peek()
+            if self.mts is not None and not self.memory_promised_to_pool and (self.suspended or self.swap_ins_in_flight > 0): # suspended processes come back first
+                self._count_stall(None)
+                break
+            blocked_by = self._reserve_memory(proc)
+            if blocked_by is not None:
+                self._count_stall(blocked_by)
+                if self.mts is not None and blocked_by != "DEGREE":
+                    self._swap_out_for(proc, blocked_by, ready_queue)
+                break
+            self.job_pool.pop()
+            self.memory_promised_to_pool = False
+            proc.admission_time = self.current_time
+            admitted.append(proc)
+        return admitted
+
+    def _reserve_memory(self, proc: Process) -> Optional[str]:
+        """
+        Takes memory (and a multiprogramming slot) for the process.
+        Returns None on success, otherwise what blocked it: "DEGREE", "MEMORY", "FRAGMENTED" (enough free memory, but no free block
+        is large enough) or "ROUNDING" (buddy: the free memory covers the size, but not the size rounded up to a power of two).
+        """
+        if self.lts is not None:
+            if self.lts.max_multiprogramming is not None and self.resident_count >= self.lts.max_multiprogramming:
+                return "DEGREE"
+            if self.lts.memory_capacity is not None and self.memory_in_use + proc.memory_size > self.lts.memory_capacity:
+                return "MEMORY"
+            if self.allocator is not None:
+                address = self.allocator.allocate(proc.pid, proc.memory_size)
+                if address is None:
+                    return "FRAGMENTED" if self.allocator.free_memory >= self.allocator.block_size(proc.memory_size) else "ROUNDING"
+                proc.memory_address = address
+        self.memory_in_use += proc.memory_size
+        self.resident_count += 1
+        self.peak_memory_in_use = max(self.peak_memory_in_use, self.memory_in_use)
+        self._sample_fragmentation()
+        return None
+
+    def _count_stall(self, blocked_by: Optional[str]) -> None:
+        if self.last_stall_time != self.current_time: # the loop can visit the same tick more than once (no ticks!)
+            self.last_stall_time = self.current_time
+            self.admission_stalls += 1
+            if blocked_by == "FRAGMENTED":
+                self.fragmentation_stalls += 1
+            elif blocked_by == "ROUNDING":
+                self.rounding_stalls += 1
+
+    def _release_process(self, proc: Process) -> None:
+        """A terminated (or swapped-out) process gives its memory (and its multiprogramming slot) back."""
+        self.memory_in_use -= proc.memory_size
+        self.resident_count -= 1
+        if self.allocator is not None:
+            self.allocator.free(proc.pid)
+            proc.memory_address = -1
+            self._sample_fragmentation()
+
+
+    # --- Medium-Term Scheduler ---
+    ## READY processes can be suspended to the swap area (SUSPENDED_READY) to make room for the job pool head.
+    ## One swap device moves one process at a time, every transfer takes mts.swap_cost ticks:
+    ### - swap-out: the process leaves its ready queue immediately, its memory is free once the transfer is done.
+    ### - swap-in: memory is taken when the transfer starts, the process is READY again once it is done.
+    def _medium_term_schedule(self) -> List[Process]:
+        """Advances the swap device and starts swap-ins. Returns the processes that are back in memory (READY)."""
+        resumed: List[Process] = []
+        if self.mts is None:
+            return resumed
+        # 1. Swap device: finish the current transfer(s), start the next one
+        while self.swap_transfer is not None and self.swap_busy_until <= self.current_time:
+            direction, proc = self.swap_transfer
+            if direction == "OUT":
+                self.memory_being_freed -= proc.memory_size
+                self._release_process(proc)
+                self.suspended.append(proc)
+            else: # IN
+                self.swap_ins_in_flight -= 1
+                self.swap_protected.add(proc.pid) # not a victim again before it runs
+                proc.suspended_time += self.current_time - proc.suspend_start_time
+                resumed.append(proc)
+            self.swap_transfer = None
+            self._start_next_swap_transfer()
+        # 2. Swap-in: suspended processes come back in FIFO order as soon as they fit (and the memory isn't kept for the job pool head)
+        while self.suspended and not self.memory_promised_to_pool and self._reserve_memory(self.suspended[0]) is None:
+            proc = self.suspended.pop(0)
+            self.swap_ins += 1
+            self.swap_ins_in_flight += 1
+            self._queue_swap_transfer("IN", proc)
+        return resumed
+
+    def _queue_swap_transfer(self, direction: str, proc: Process) -> None:
+        self.swap_device_queue.append((direction, proc))
+        if self.swap_transfer is None:
+            self._start_next_swap_transfer()
+
+    def _start_next_swap_transfer(self) -> None:
+        if self.swap_device_queue:
+            self.swap_transfer = self.swap_device_queue.pop(0)
+            self.swap_busy_until = self.current_time + self.mts.swap_cost
+            self.swap_device_busy_time += self.mts.swap_cost
+
+    def _swap_out_for(self, incoming: Process, blocked_by: str, ready_queue: List[QueueLevel]) -> None:
+        """
+        Suspends READY processes (chosen by the victim policy) until the incoming process would fit.
+        Nothing more is suspended while the swap-outs in flight already free enough memory, or, when the memory is there
+        but no block fits (FRAGMENTED, ROUNDING), until they are done and show whether a block fits now.
+        """
+        needed = self.memory_in_use - self.memory_being_freed + incoming.memory_size - self.lts.memory_capacity
+        if self.memory_being_freed > 0 and (blocked_by != "MEMORY" or needed <= 0):
+            return
+        victims = []
+        victim_level: Dict[int, int] = {} # pid -> level (process_ready_queue_id can be stale after a MLFQ boost)
+        for level, queue_level in enumerate(ready_queue):
+            for p in queue_level.queue:
+                if p.pid not in self.swap_protected and p.memory_size > 0:
+                    victims.append(p)
+                    victim_level[p.pid] = level
+        if needed > sum(p.memory_size for p in victims):
+            return # swapping everyone out still wouldn't be enough
+        victim_policy = self.mts.victim
+        if victim_policy == "LARGEST":
+            victims.sort(key=lambda p: (-p.memory_size, p.pid))
+        elif victim_policy == "LONGEST_REMAINING":
+            victims.sort(key=lambda p: (-p.remaining_time, p.pid))
+        elif victim_policy == "LOWEST_PRIORITY": # the lowest ready queue level first, then the largest
+            victims.sort(key=lambda p: (-victim_level[p.pid], -p.memory_size, p.pid))
+        # needed <= 0: the memory is there but no block fits, one victim at a time
+        self.memory_promised_to_pool = len(victims) > 0
+        for victim in victims:
+            self._dequeue(ready_queue, victim)
+            victim.state = ProcessState.SUSPENDED_READY
+            victim.swap_count += 1
+            victim.suspend_start_time = self.current_time
+            self.memory_being_freed += victim.memory_size
+            self.swap_outs += 1
+            self._queue_swap_transfer("OUT", victim)
+            needed -= victim.memory_size
+            if needed <= 0:
+                break
+
+    def _swap_activity(self) -> bool:
+        return self.mts is not None and (self.swap_transfer is not None or len(self.suspended) > 0)
+
+    def _sample_fragmentation(self) -> None:
+        if self.allocator is not None:
+            self.peak_external_fragmentation = max(self.peak_external_fragmentation, self.allocator.external_fragmentation())
+            if isinstance(self.allocator, BuddyAllocator):
+                self.peak_internal_fragmentation = max(self.peak_internal_fragmentation, self.allocator.internal_fragmentation())
 
 
     # --- Helper Methods ---
     def _reset_simulation_objects(self) -> None:
         """Recreates process objects and time for a fresh run."""
-        # Reset the self.processes, all of them are already sorted based on at
-        self.processes: List[Process] = []
-        if self.mode is SchedulerMode.STANDARD:
-            for i, (at, cbt) in enumerate(self.input_data_list):
-                self.processes.append(Process(pid=i, arrival_time=at, burst_time=cbt))
-        elif self.mode is SchedulerMode.MLQ: 
-            for i, (at, cbt, cat) in enumerate(self.input_data_list):
-                self.processes.append(Process(pid=i, arrival_time=at, burst_time=cbt, category=cat))
-        # reset time
+        # Reset the self.processes, all of them are already sorted based on at (copies of the decoded input, see _process_templates)
+        self.processes: List[Process] = [template.clone() for template in self._process_templates()]
+        # reset the long-term scheduler
+        self.job_pool = JobPool(algo=self.lts.algo if self.lts else "FCFS")
+        self.memory_in_use = 0
+        self.peak_memory_in_use = 0
+        self.resident_count = 0
+        self.admission_stalls = 0
+        self.fragmentation_stalls = 0 # stalls where the free memory was enough, but not contiguous
+        self.rounding_stalls = 0 # buddy: stalls where the free memory was enough for the size, but not for its power of two
+        self.last_stall_time = -1
+        self.allocator: Optional[MemoryAllocator] = None
+        if self.lts is not None and self.lts.allocator is not None:
+            self.allocator = make_allocator(self.lts.allocator, self.lts.memory_capacity)
+        self.peak_external_fragmentation = 0.0
+        self.peak_internal_fragmentation = 0 # buddy only: rounded-up sizes
+        # reset the medium-term scheduler
+        self.suspended: List[Process] = [] # swapped out, waiting to come back (FIFO)
+        self.swap_device_queue: List[tuple] = [] # ("OUT" | "IN", process)
+        self.swap_transfer: Optional[tuple] = None # transfer in progress
+        self.swap_busy_until = 0
+        self.swap_device_busy_time = 0
+        self.swap_ins_in_flight = 0
+        self.swap_protected: set = set() # swapped in, but not dispatched yet
+        self.memory_being_freed = 0
+        self.memory_promised_to_pool = False # the job pool head had READY processes swapped out for it: swap-ins wait until it's admitted
+        self.swap_outs = 0
+        self.swap_ins = 0
+        # reset the locks
+        self.lock_owner: Dict[str, Process] = {}
+        self.lock_waiters: Dict[str, deque] = {} # resource -> WAITING processes (FIFO)
+        self.lock_stats: Dict[str, LockStats] = {}
+        self.convoy_since: Dict[str, int] = {}
+        self.convoy_time: Dict[str, int] = {} # resource -> ticks spent as a convoy
+        # reset time and logs
         self.current_time = 0
+        self.logs = []
+
+
+    def _process_templates(self) -> List[Process]:
+        """The input decoded into processes that never run (category, deadline, group, critical sections, memory), built once per scheduler."""
+        if self.process_templates is None:
+            self.process_templates = []
+            for i, item in enumerate(self.input_data_list):
+                at, cbt = item[0], item[1]
+                category_name = item[2] if self.mode is SchedulerMode.MLQ else None
+                category = self.mlq_layout.base_category(category_name) if category_name is not None else None # aliases use their built-in category
+                deadline = item[3] if len(item) >= 4 else None # optional 4th column
+                group = item[4] if len(item) == 5 else None # optional 5th column
+                critical_sections = list(self.critical_sections[i]) if self.critical_sections is not None else []
+                memory_size = self.memory_sizes[i] if self.memory_sizes is not None else 0
+                self.process_templates.append(Process(pid=i, arrival_time=at, burst_time=cbt, category=category, category_name=category_name, deadline=deadline, group=group, critical_sections=critical_sections, memory_size=memory_size, priority=BASE_PRIORITY[category]))
+        return self.process_templates
+
+    def _processes_by_category(self) -> Dict[str, List[Process]]:
+        """Input category name -> its processes (empty for STANDARD input)."""
+        groups: Dict[str, List[Process]] = {}
+        for p in self.processes:
+            if p.category_name is not None:
+                groups.setdefault(p.category_name, []).append(p)
+        return groups
+
+    def _has_deadlines(self) -> bool:
+        return any(len(item) >= 4 and item[3] is not None for item in self.input_data_list)
 
+    def _has_groups(self) -> bool:
+        return any(len(item) == 5 for item in self.input_data_list)
+
+    def _cpu_time_by_pid(self) -> Dict[int, int]:
+        busy_by_pid: Dict[int, int] = {}
+        for log in self.logs:
+            if log.event_type == "EXECUTING":
+                busy_by_pid[log.pid] = busy_by_pid.get(log.pid, 0) + log.end_time - log.start_time
+        return busy_by_pid
+
+    def _group_shares(self) -> Tuple[Dict[str, float], Optional[float]]:
+        """
+        CPU share per group (None: '-') and Jain's index of share / weight over the groups.
+        Over the whole run: a group that runs out of work gets less than its share, which lowers the index.
+        """
+        if not self._has_groups():
+            return {}, None
+        busy_by_pid = self._cpu_time_by_pid()
+        total_busy = sum(busy_by_pid.values())
+        shares: Dict[str, float] = {}
+        for p in self.processes:
+            name = p.group if p.group is not None else "-"
+            shares[name] = shares.get(name, 0.0) + (busy_by_pid.get(p.pid, 0) / total_busy if total_busy > 0 else 0.0)
+        weights = self.fair_share.weights if self.fair_share else {}
+        return shares, jain_index([share / weights.get(name, 1) for name, share in shares.items()])
 
     def _add_log(self, algo: STSAlgo, start_time: float, end_time: float, pid: Optional[int], event_type: Union[SystemState,ProcessEvents]):
         self.logs.append(SimulationLog(algo, start_time, end_time, pid, event_type))
 
+    def summarize(self) -> SimulationSummary:
+        """Aggregated metrics of the last run (in ticks), used to compare algorithms on the same input."""
+        n = len(self.processes)
+        makespan = max(p.completion_time for p in self.processes)
+        busy_time = sum(log.end_time - log.start_time for log in self.logs if log.event_type == "EXECUTING")
+        context_switches = sum(1 for log in self.logs if log.event_type == "CS_LOAD")
+        cs_time = sum(log.end_time - log.start_time for log in self.logs if log.event_type in ("CS_LOAD", "CS_SAVE"))
+        lateness = [p.completion_time - p.deadline for p in self.processes if p.deadline is not None]
+        group_shares, group_fairness = self._group_shares()
+        return SimulationSummary(
+            algorithm=self.last_algorithm,
+            n=n,
+            makespan=makespan,
+            avg_turnaround_time=sum(p.turnaround_time for p in self.processes) / n,
+            avg_wait_time=sum(p.wait_time for p in self.processes) / n,
+            avg_response_time=sum(p.response_time for p in self.processes) / n,
+            throughput=n / makespan if makespan > 0 else 0.0,
+            cpu_utilization=busy_time / makespan if makespan > 0 else 0.0,
+            context_switches=context_switches,
+            cs_overhead=cs_time / makespan if makespan > 0 else 0.0,
+            p95_response_time=percentile([p.response_time for p in self.processes], 95),
+            p95_response_time_per_category={name: percentile([p.response_time for p in group], 95) for name, group in self._processes_by_category().items()},
+            with_deadline=len(lateness),
+            deadline_misses=sum(1 for late in lateness if late > 0),
+            max_tardiness=max([0] + lateness),
+            cpu_share_per_group=group_shares,
+            group_fairness=group_fairness,
+            avg_lock_wait_time=sum(p.lock_wait_time for p in self.processes) / n,
+            lock_convoys=sum(stats.convoys for stats in self.lock_stats.values()),
+            energy=self.energy if self.dvfs is not None else None,
+            avg_frequency=sum(f * t for f, t in self.time_at_frequency.items()) / sum(self.time_at_frequency.values()) if self.time_at_frequency else None,
+        )
+
     def generate_gantt_and_metrics(self):
         """
         Generates:
@@ -1337,7 +1431,7 @@ class Scheduler:
         def fmt(t, descaling: bool = False) -> str:
             val = t
             if descaling:
-                val = t / TIME_SCALE
+                val = t / self.time_scale
             return f"{val:.0f}" if val.is_integer() else f"{val:.2f}"
         
         # ==========================
@@ -1353,13 +1447,13 @@ class Scheduler:
 
         for p in sorted_processes:
             # Scale internal ticks back to user time units
-            at = p.arrival_time / TIME_SCALE
-            bt = p.burst_time / TIME_SCALE
-            ct = p.completion_time / TIME_SCALE
+            at = p.arrival_time / self.time_scale
+            bt = p.burst_time / self.time_scale
+            ct = p.completion_time / self.time_scale
             
-            tat = p.turnaround_time / TIME_SCALE
-            wt = p.wait_time / TIME_SCALE
-            rt = p.response_time / TIME_SCALE
+            tat = p.turnaround_time / self.time_scale
+            wt = p.wait_time / self.time_scale
+            rt = p.response_time / self.time_scale
 
             
             sum_tat += tat
@@ -1378,6 +1472,79 @@ class Scheduler:
             # Calculate the average TAT, WT, RT
             print("-" * 65)
             print(f"AVG  : {'-':<8} {'-':<8} {'-':<8} {average_TAT:<8} {average_WT:<8} {average_RT:<8}")
+            # what the context switches cost next to what got done (see PreemptionConfig)
+            summary = self.summarize()
+            print(f"Context switches: {summary.context_switches}, CS overhead {summary.cs_overhead:.2%}, CPU utilization {summary.cpu_utilization:.2%}, throughput {summary.throughput * self.time_scale:.4f} processes/time unit")
+
+        categories = self._processes_by_category()
+        if categories and n > 0:
+            # per category tail latency and CPU share (the cost of strict priority, or what DRR shares buy)
+            busy_by_pid = self._cpu_time_by_pid()
+            total_busy = sum(busy_by_pid.values())
+            if self.last_algorithm == "MLQ" and self.drr_deficits is not None:
+                print(f"MLQ inter-level scheduling: deficit round robin, shares {[level.share for level in self.mlq_layout.levels]}")
+            print(f"{'CATEGORY':<12} {'N':<6} {'AVG RT':<8} {'P95 RT':<8} {'P99 RT':<8} {'P95 TAT':<8} {'CPU SHARE':<9}")
+            for name, group in sorted(categories.items(), key=lambda item: self.mlq_layout.category_level[item[0]]):
+                response_times = [p.response_time for p in group]
+                turnaround_times = [p.turnaround_time for p in group]
+                cpu_share = sum(busy_by_pid.get(p.pid, 0) for p in group) / total_busy if total_busy > 0 else 0.0
+                print(f"{name:<12} {len(group):<6} {fmt(sum(response_times) / len(group), True):<8} {fmt(percentile(response_times, 95), True):<8} {fmt(percentile(response_times, 99), True):<8} {fmt(percentile(turnaround_times, 95), True):<8} {cpu_share:<9.2%}")
+
+        if self._has_groups() and n > 0:
+            # per group (user/tenant) CPU share and tail latency, Jain's index of share / weight over the groups
+            group_shares, group_fairness = self._group_shares()
+            weights = self.fair_share.weights if self.fair_share else {}
+            print(f"{'GROUP':<12} {'N':<6} {'WEIGHT':<7} {'CPU SHARE':<10} {'AVG RT':<8} {'P50 RT':<8} {'P95 RT':<8} {'P99 RT':<8} {'P95 TAT':<8}")
+            by_group: Dict[str, List[Process]] = {}
+            for p in sorted_processes:
+                by_group.setdefault(p.group if p.group is not None else "-", []).append(p)
+            for name, group in by_group.items():
+                response_times = [p.response_time for p in group]
+                turnaround_times = [p.turnaround_time for p in group]
+                print(f"{name:<12} {len(group):<6} {weights.get(name, 1):<7g} {group_shares[name]:<10.2%} {fmt(sum(response_times) / len(group), True):<8} {fmt(percentile(response_times, 50), True):<8} {fmt(percentile(response_times, 95), True):<8} {fmt(percentile(response_times, 99), True):<8} {fmt(percentile(turnaround_times, 95), True):<8}")
+            print(f"Group fairness (Jain's index of share / weight): {group_fairness:.4f}")
+
+        if self.last_algorithm == "MLFQ" and self.mlfq_config.boost_interval is not None:
+            print(f"MLFQ: {len(self.mlfq_config.levels)} levels, {self.mlfq_boosts} priority boosts (every {fmt(self.mlfq_config.boost_interval, True)})")
+
+        deadline_processes = [p for p in sorted_processes if p.deadline is not None]
+        if deadline_processes:
+            # lateness = completion - deadline (negative: finished early), tardiness = max(0, lateness)
+            lateness = [p.completion_time - p.deadline for p in deadline_processes]
+            misses = [p.pid for p in deadline_processes if p.completion_time > p.deadline]
+            print(f"Deadlines: missed {len(misses)}/{len(deadline_processes)} {misses if misses else ''}")
+            print(f"  lateness min {fmt(min(lateness), True)}, p50 {fmt(percentile(lateness, 50), True)}, p95 {fmt(percentile(lateness, 95), True)}, max {fmt(max(lateness), True)}, max tardiness {fmt(max(0, max(lateness)), True)}")
+
+        if self.dvfs is not None and n > 0:
+            # throughput vs energy: the same run at other frequencies/governors changes both
+            elapsed = sum(self.time_at_frequency.values())
+            residency = ", ".join(f"{f}: {t / elapsed:.1%}" for f, t in sorted(self.time_at_frequency.items())) if elapsed else "-"
+            print(f"DVFS({self.dvfs.governor}): energy {self.energy / self.time_scale:.2f} (power x time unit), avg power {self.energy / elapsed if elapsed else 0:.3f}, {self.frequency_transitions} frequency transitions, residency {{{residency}}}")
+
+        if self.lock_stats and n > 0:
+            # lock contention: how long processes sat WAITING, and whether the waiters piled up (convoys)
+            print(f"Locks (priority inheritance {'on' if self.lock_config.priority_inheritance else 'off'}, convoy from {self.lock_config.convoy_threshold} waiters):")
+            print(f"{'RESOURCE':<12} {'ACQUIRED':<9} {'CONTENDED':<10} {'AVG WAIT':<9} {'TOTAL WAIT':<11} {'MAX WAITERS':<12} {'CONVOYS':<8} {'CONVOY TIME':<11}")
+            for resource, stats in sorted(self.lock_stats.items()):
+                avg_wait = fmt(stats.total_wait / stats.contended, True) if stats.contended else "0"
+                print(f"{resource:<12} {stats.acquisitions:<9} {stats.contended:<10} {avg_wait:<9} {fmt(stats.total_wait, True):<11} {stats.max_waiters:<12} {stats.convoys:<8} {fmt(self.convoy_time.get(resource, 0), True):<11}")
+            blocked = [p for p in sorted_processes if p.lock_wait_time > 0]
+            print(f"  lock wait: avg {fmt(sum(p.lock_wait_time for p in sorted_processes) / n, True)} per process, {len(blocked)} processes blocked at least once")
+
+        if self.lts is not None and n > 0:
+            # Admission control: time spent in the job pool (arrival -> admission)
+            avg_admission_delay = fmt(sum(p.admission_time - p.arrival_time for p in sorted_processes) / self.time_scale / n)
+            print(f"LTS({self.lts.algo}): avg admission delay {avg_admission_delay}, admission stalls {self.admission_stalls}, peak memory {self.peak_memory_in_use}/{self.lts.memory_capacity if self.lts.memory_capacity is not None else '-'}, degree limit {self.lts.max_multiprogramming if self.lts.max_multiprogramming is not None else '-'}")
+            if self.allocator is not None:
+                internal = f", peak internal fragmentation {self.peak_internal_fragmentation}, stalls caused by rounding up {self.rounding_stalls}" if isinstance(self.allocator, BuddyAllocator) else ""
+                print(f"Allocator({self.lts.allocator}): stalls caused by fragmentation {self.fragmentation_stalls}, peak external fragmentation {self.peak_external_fragmentation:.2%}{internal}")
+        if self.mts is not None and n > 0:
+            makespan = max(p.completion_time for p in sorted_processes)
+            swapped = [p for p in sorted_processes if p.swap_count > 0]
+            avg_suspended_time = fmt(sum(p.suspended_time for p in swapped) / self.time_scale / len(swapped)) if swapped else "0"
+            throughput = n / (makespan / self.time_scale) if makespan > 0 else 0.0
+            swap_utilization = self.swap_device_busy_time / makespan if makespan > 0 else 0.0
+            print(f"MTS({self.mts.victim}): swap-outs {self.swap_outs}, swap-ins {self.swap_ins}, avg suspended time {avg_suspended_time}, swap device utilization {swap_utilization:.2%}, throughput {throughput:.4f} processes/time unit")
 
 
         # ==========================
@@ -1441,21 +1608,25 @@ class Scheduler:
         # 3. Blender
         # ==========================
 #        BlenderCode.blackboard_reset()
-        # BlenderCode.generate_gantt_and_metrics_table_blender(self.logs, self.processes, input_quantum_time, input_cs_time, input_algorithm, TIME_SCALE)
+        # BlenderCode.generate_gantt_and_metrics_table_blender(self.logs, self.processes, input_quantum_time, input_cs_time, input_algorithm, self.time_scale)
         
         
 
-input_list: InputList = [[0, 1], [0, 8], [3, 1], [20, 11]] 
-input_quantum_time: float = 1
-input_cs_time: float = 4
-input_algorithm: STSAlgo = "MLFQ"
-
-## Input Validation
-scheduler_mode: SchedulerMode = validate_input_and_determine_scheduler_mode(data_list=input_list, q=input_quantum_time, cs=input_cs_time)
-(data_list_scaled, q_scaled, cs_scaled, TIME_SCALE) = scale_input_time(data_list=input_list, q=input_quantum_time, cs=input_cs_time, scheduler_mode=scheduler_mode, max_precision=4)
+if __name__ == "__main__": # Blender runs the text block as __main__ as well
+    input_list: InputList = [[0, 1], [0, 8], [3, 1], [20, 11]] 
+    input_quantum_time: float = 1
+    input_cs_time: float = 4
+    input_algorithm: STSAlgo = "MLFQ"
+    # Long-term scheduler (optional): job pool with a memory budget and/or a degree of multiprogramming
+    input_lts: LTSConfig | None = None # e.g. LTSConfig(algo="SJF", memory_capacity=4096, max_multiprogramming=2, allocator="BEST_FIT")
+    input_memory_sizes: List[int] | None = None # one entry per process (same order as input_list), e.g. [1024, 512, 2048, 256]
+    input_mts: MTSConfig | None = None # needs input_lts.memory_capacity, e.g. MTSConfig(victim="LARGEST", swap_cost=2) (swap_cost in ticks)
 
+    ## Input Validation
+    scheduler_mode: SchedulerMode = validate_input_and_determine_scheduler_mode(data_list=input_list, q=input_quantum_time, cs=input_cs_time)
+    (data_list_scaled, q_scaled, cs_scaled, TIME_SCALE) = scale_input_time(data_list=input_list, q=input_quantum_time, cs=input_cs_time, scheduler_mode=scheduler_mode, max_precision=4)
 
-# Scheduling
-scheduler = Scheduler(data_list_scaled, cs_scaled, q_scaled, scheduler_mode)
-scheduler.run(input_algorithm)
 
+    # Scheduling
+    scheduler = Scheduler(data_list_scaled, cs_scaled, q_scaled, scheduler_mode, lts=input_lts, memory_sizes=input_memory_sizes, mts=input_mts, time_scale=TIME_SCALE)
+    scheduler.run(input_algorithm)
@@ -0,0 +1,207 @@
+import heapq
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+from definitions import AllocStrategy
+from structures import OrderedIndex
+
+# Contiguous memory model used by the long-term scheduler.
+## Every admitted process gets one contiguous block [address, address + size), which is given back when it terminates.
+## The free blocks are indexed so that allocation and release stay O(log n) even with 10^5 resident processes:
+### - FIRST_FIT / NEXT_FIT: free blocks ordered by address, each subtree knows its largest block -> leftmost block that fits.
+### - BEST_FIT: free blocks ordered by (size, address) -> the smallest block that fits.
+### - BUDDY: one free list per power-of-two order, buddies are merged back on release.
+
+
+# --- Allocators ---
+class MemoryAllocator(ABC):
+    """Base class: capacity bookkeeping and fragmentation metrics, the strategy lives in the subclasses."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"Memory capacity must be positive. Got: {capacity}")
+        self.capacity = capacity
+        self.used = 0
+        self.blocks: Dict[int, Tuple[int, int]] = {} # pid -> (address, reserved size)
+
+    @property
+    def free_memory(self) -> int:
+        return self.capacity - self.used
+
+    @abstractmethod
+    def largest_free_block(self) -> int:
+        ...
+
+    def external_fragmentation(self) -> float:
+        """1 - largest free block / free memory: 0 means all free memory is one block."""
+        free = self.free_memory
+        if free <= 0:
+            return 0.0
+        return 1 - self.largest_free_block() / free
+
+    def block_size(self, size: int) -> int:
+        """Memory a request of `size` really takes."""
+        return size
+
+    @abstractmethod
+    def allocate(self, pid: int, size: int) -> Optional[int]:
+        """Returns the block address, or None if no free block is large enough."""
+
+    @abstractmethod
+    def free(self, pid: int) -> None:
+        ...
+
+
+class ContiguousAllocator(MemoryAllocator):
+    """Variable-size partitions with FIRST_FIT, BEST_FIT or NEXT_FIT placement, neighbours are coalesced on release."""
+
+    def __init__(self, capacity: int, strategy: AllocStrategy) -> None:
+        super().__init__(capacity)
+        if strategy not in ("FIRST_FIT", "BEST_FIT", "NEXT_FIT"):
+            raise ValueError(f"Unknown contiguous allocation strategy: {strategy}")
+        self.strategy = strategy
+        self.by_address = OrderedIndex() # address -> size
+        self.by_size = OrderedIndex() # (size, address) -> size
+        self.next_fit_cursor = 0
+        self._add_free_block(0, capacity)
+
+    def _add_free_block(self, address: int, size: int) -> None:
+        self.by_address.insert(address, size)
+        self.by_size.insert((size, address), size)
+
+    def _remove_free_block(self, address: int, size: int) -> None:
+        self.by_address.remove(address)
+        self.by_size.remove((size, address))
+
+    def largest_free_block(self) -> int:
+        return self.by_address.max_size()
+
+    def _find_block(self, size: int) -> Optional[Tuple[int, int]]:
+        if self.strategy == "BEST_FIT":
+            node = self.by_size.ceiling((size, -1))
+            return None if node is None else (node.key[1], node.size)
+        if self.strategy == "NEXT_FIT":
+            node = self.by_address.leftmost_fit(size, low_key=self.next_fit_cursor)
+            if node is None: # wrap around
+                node = self.by_address.leftmost_fit(size)
+        else: # FIRST_FIT
+            node = self.by_address.leftmost_fit(size)
+        return None if node is None else (node.key, node.size)
+
+    def allocate(self, pid: int, size: int) -> Optional[int]:
+        if size == 0:
+            self.blocks[pid] = (-1, 0)
+            return -1
+        block = self._find_block(size)
+        if block is None:
+            return None
+        address, block_size = block
+        self._remove_free_block(address, block_size)
+        if block_size > size: # split, the rest stays free
+            self._add_free_block(address + size, block_size - size)
+        self.blocks[pid] = (address, size)
+        self.used += size
+        self.next_fit_cursor = address + size
+        return address
+
+    def free(self, pid: int) -> None:
+        address, size = self.blocks.pop(pid)
+        if size == 0:
+            return
+        self.used -= size
+        # coalesce with the free neighbours
+        before = self.by_address.predecessor(address)
+        if before is not None and before.key + before.size == address:
+            self._remove_free_block(before.key, before.size)
+            address, size = before.key, before.size + size
+        after = self.by_address.successor(address)
+        if after is not None and address + size == after.key:
+            self._remove_free_block(after.key, after.size)
+            size += after.size
+        self._add_free_block(address, size)
+
+
+class BuddyAllocator(MemoryAllocator):
+    """
+    Binary buddy system: blocks are powers of two, a free block and its buddy (address ^ size) are merged on release.
+    The capacity is rounded down to a power of two, requests are rounded up (internal fragmentation).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self.max_order = capacity.bit_length() - 1
+        self.capacity = 1 << self.max_order
+        self.free_lists: List[List[int]] = [[] for _ in range(self.max_order + 1)] # order -> heap of addresses (lazy deletion)
+        self.free_sets: List[set] = [set() for _ in range(self.max_order + 1)] # order -> addresses that are really free
+        self.requested_sizes: Dict[int, int] = {} # pid -> requested size
+        self.requested = 0 # sum of the requested sizes (used - requested = internal fragmentation)
+        self._push(0, self.max_order)
+
+    def _push(self, address: int, order: int) -> None:
+        self.free_sets[order].add(address)
+        heapq.heappush(self.free_lists[order], address)
+
+    def _pop(self, order: int) -> Optional[int]:
+        heap = self.free_lists[order]
+        while heap:
+            address = heapq.heappop(heap)
+            if address in self.free_sets[order]:
+                self.free_sets[order].remove(address)
+                return address
+        return None
+
+    def largest_free_block(self) -> int:
+        for order in range(self.max_order, -1, -1):
+            if self.free_sets[order]:
+                return 1 << order
+        return 0
+
+    def internal_fragmentation(self) -> int:
+        return self.used - self.requested
+
+    def block_size(self, size: int) -> int:
+        return 1 << max(0, (size - 1).bit_length()) if size > 0 else 0
+
+    def allocate(self, pid: int, size: int) -> Optional[int]:
+        if size == 0:
+            self.blocks[pid] = (-1, 0)
+            return -1
+        order = max(0, (size - 1).bit_length())
+        if order > self.max_order:
+            return None
+        # smallest order with a free block, then split it down
+        available = order
+        while available <= self.max_order and not self.free_sets[available]:
+            available += 1
+        if available > self.max_order:
+            return None
+        address = self._pop(available)
+        while available > order:
+            available -= 1
+            self._push(address + (1 << available), available) # the upper half is the buddy
+        self.blocks[pid] = (address, 1 << order)
+        self.requested_sizes[pid] = size
+        self.used += 1 << order
+        self.requested += size
+        return address
+
+    def free(self, pid: int) -> None:
+        address, block_size = self.blocks.pop(pid)
+        if block_size == 0:
+            return
+        self.used -= block_size
+        self.requested -= self.requested_sizes.pop(pid)
+        order = block_size.bit_length() - 1
+        while order < self.max_order:
+            buddy = address ^ (1 << order)
+            if buddy not in self.free_sets[order]:
+                break
+            self.free_sets[order].remove(buddy) # its heap entry is skipped lazily
+            address = min(address, buddy)
+            order += 1
+        self._push(address, order)
+
+
+def make_allocator(strategy: AllocStrategy, capacity: int) -> MemoryAllocator:
+    if strategy == "BUDDY":
+        return BuddyAllocator(capacity)
+    return ContiguousAllocator(capacity, strategy)
@@ -0,0 +1,594 @@
+import heapq
+from abc import ABC, abstractmethod
+import itertools
+import math
+import random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from definitions import Process, CFS_WEIGHTS, CFS_NICE_0_WEIGHT, PROPORTIONAL_SHARE_TICKETS, STRIDE1
+from structures import OrderedIndex, FenwickTree, RunningMedian
+
+# Ready queues that need more than a plain list.
+## A QueueLevel whose algorithm needs one of these gets it instead of a list (see Scheduler._make_level_queue).
+## They all behave like the list for the shared tick loop: append, remove, len, iteration,
+## plus peek() for the next pick and charge() for every tick the picked process runs.
+
+
+class CFSRunQueue:
+    """
+    CFS run queue: processes ordered by (vruntime, arrival order) in a balanced tree.
+    The leftmost process is picked next, insertion and removal are O(log n).
+    """
+
+    def __init__(self) -> None:
+        self.tree = OrderedIndex()
+        self.keys = {} # pid -> key in the tree
+        self.seq = itertools.count() # tie-breaker: first come first served
+        self.total_weight = 0
+        self.min_vruntime = 0.0 # never decreases, new processes start here
+
+    @staticmethod
+    def weight_of(p: Process) -> int:
+        return CFS_WEIGHTS[p.category]
+
+    def append(self, p: Process) -> None:
+        # a process that (re)joins must not be far behind the others, or it would own the CPU for a long time
+        p.vruntime = max(p.vruntime, self.min_vruntime)
+        key = (p.vruntime, next(self.seq))
+        self.tree.insert(key, value=p)
+        self.keys[p.pid] = key
+        self.total_weight += self.weight_of(p)
+
+    def remove(self, p: Process) -> None:
+        self.tree.remove(self.keys.pop(p.pid))
+        self.total_weight -= self.weight_of(p)
+        # min_vruntime follows the smallest vruntime among the leaving process (about to run) and the queue
+        leftmost = self.tree.first()
+        smallest = p.vruntime if leftmost is None else min(p.vruntime, leftmost.value.vruntime)
+        self.min_vruntime = max(self.min_vruntime, smallest)
+
+    def peek(self) -> Optional[Process]:
+        leftmost = self.tree.first()
+        return None if leftmost is None else leftmost.value
+
+    def time_slice(self, p: Process, target_latency: int, min_granularity: int) -> int:
+        """Share of the target latency in proportion to the weight (p itself is running, so not in the tree)."""
+        weight = self.weight_of(p)
+        share = target_latency * weight // (self.total_weight + weight)
+        return max(min_granularity, share)
+
+    def charge(self, p: Process, ticks: int) -> None:
+        """Running for `ticks` costs less vruntime the heavier the process is."""
+        p.vruntime += ticks * CFS_NICE_0_WEIGHT / CFS_WEIGHTS[p.category]
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def __iter__(self) -> Iterator[Process]:
+        for node in self.tree:
+            yield node.value
+
+
+class HeapQueue(ABC):
+    """
+    Min-heap on _key(p), ties in arrival order (O(log n) append and pick).
+    Removed entries stay in the heap and are skipped lazily. A key must not change while its process is queued.
+    """
+
+    def __init__(self) -> None:
+        self.heap: List[Tuple[Any, int, Process]] = [] # (key, seq, process)
+        self.entries: Dict[int, int] = {} # pid -> seq of its valid heap entry
+        self.seq = itertools.count() # tie-breaker: first come first served
+
+    @abstractmethod
+    def _key(self, p: Process) -> Any:
+        ...
+
+    def append(self, p: Process) -> None:
+        seq = next(self.seq)
+        self.entries[p.pid] = seq
+        heapq.heappush(self.heap, (self._key(p), seq, p))
+
+    def remove(self, p: Process) -> None:
+        del self.entries[p.pid]
+        self._drop_stale()
+
+    def _drop_stale(self) -> None:
+        while self.heap and self.entries.get(self.heap[0][2].pid) != self.heap[0][1]:
+            heapq.heappop(self.heap)
+
+    def peek(self) -> Optional[Process]:
+        self._drop_stale()
+        return self.heap[0][2] if self.heap else None
+
+    def charge(self, p: Process, ticks: int) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Process]:
+        for _, seq, p in self.heap:
+            if self.entries.get(p.pid) == seq:
+                yield p
+
+
+class StrideQueue(HeapQueue):
+    """Stride scheduling: every tick a process runs, its pass grows by its stride (STRIDE1 / tickets). The smallest pass runs next."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.global_pass = 0 # pass of the last picked process, newcomers start here
+
+    @staticmethod
+    def stride_of(p: Process) -> int:
+        return STRIDE1 // PROPORTIONAL_SHARE_TICKETS[p.category]
+
+    def _key(self, p: Process) -> int:
+        return p.stride_pass
+
+    def append(self, p: Process) -> None:
+        p.stride_pass = max(p.stride_pass, self.global_pass) # no credit for the time it wasn't runnable
+        super().append(p)
+
+    def remove(self, p: Process) -> None:
+        if self.heap and self.heap[0][2] is p:
+            self.global_pass = max(self.global_pass, p.stride_pass)
+        super().remove(p)
+
+    def charge(self, p: Process, ticks: int) -> None:
+        p.stride_pass += ticks * self.stride_of(p)
+
+
+class PriorityQueue(HeapQueue):
+    """
+    Static priority with optional aging: the highest effective priority runs next, ties in arrival order.
+    With aging, effective priority = priority + (now - ready_since) / aging_interval. Comparing two queued processes
+    at the same `now`, the `now` term cancels out, so the heap key (ready_since - priority * aging_interval) never has
+    to be updated while a process waits: aging costs nothing per tick and the pick stays O(log n).
+    """
+
+    def __init__(self, aging_interval: Optional[int]) -> None:
+        super().__init__()
+        self.aging_interval = aging_interval
+
+    def _key(self, p: Process) -> float:
+        if self.aging_interval is None:
+            return -p.priority
+        return p.ready_since - p.priority * self.aging_interval
+
+    def effective_priority(self, p: Process, now: int) -> float:
+        """Priority of a queued process at `now`."""
+        if self.aging_interval is None:
+            return p.priority
+        return p.priority + (now - p.ready_since) / self.aging_interval
+
+
+class EDFQueue(HeapQueue):
+    """Earliest Deadline First: the earliest absolute deadline runs next, processes without a deadline come last (FCFS among them)."""
+
+    @staticmethod
+    def deadline_of(p: Process) -> float:
+        return p.deadline if p.deadline is not None else math.inf
+
+    def _key(self, p: Process) -> float:
+        return self.deadline_of(p)
+
+
+class HRRNQueue:
+    """
+    Highest Response Ratio Next as a kinetic tournament.
+    While a process waits, its ratio (wait + burst) / burst orders the same as (now + offset) / burst, with the constant
+    offset = wait_time - ready_since: a line in `now`. The tree keeps the winner of every match together with the
+    time its loser overtakes it (certificate). Moving the clock only replays the matches whose certificate expired,
+    so a pick, an insertion and a removal cost O(log n) plus O(log n) per leader change, instead of a scan of the queue.
+    Ties go to the process that was queued first, like a scan in arrival order.
+    """
+
+    def __init__(self, clock: Callable[[], int]) -> None:
+        self.clock = clock # current simulation time
+        self.now = 0 # the time the tree is valid at
+        self.seq = itertools.count() # tie-breaker: first come first served
+        self.slot_of: Dict[int, int] = {} # pid -> slot
+        self._build(64, [])
+
+    def _build(self, size: int, processes: List[Tuple[Process, int, int]]) -> None:
+        """(Re)creates the tree with `size` leaves, filled with (process, offset, seq)."""
+        self.size = size
+        self.process_in: List[Optional[Process]] = [None] * size # slot -> process
+        self.offset = [0] * size # slot -> wait_time - ready_since
+        self.order = [0] * size # slot -> seq
+        self.free_slots = list(range(size - 1, len(processes) - 1, -1))
+        self.winner = [-1] * (2 * size) # node -> slot of the leader of its subtree, -1: empty
+        self.fail = [math.inf] * (2 * size) # node -> time the loser of its match overtakes the winner
+        self.min_fail = [math.inf] * (2 * size) # node -> earliest fail in its subtree
+        for slot, (p, offset, seq) in enumerate(processes):
+            self.slot_of[p.pid] = slot
+            self.process_in[slot], self.offset[slot], self.order[slot] = p, offset, seq
+            self.winner[size + slot] = slot
+        for node in range(size - 1, 0, -1):
+            self._match(node)
+
+    def _beats(self, a: int, b: int) -> bool:
+        """Does slot a lead slot b at self.now?"""
+        lhs = (self.now + self.offset[a]) * self.process_in[b].burst_time
+        rhs = (self.now + self.offset[b]) * self.process_in[a].burst_time
+        return lhs > rhs or (lhs == rhs and self.order[a] < self.order[b])
+
+    def _overtake_time(self, winner: int, loser: int) -> float:
+        """First tick at which the loser leads. Only a shorter burst (steeper line) can catch up."""
+        winner_burst, loser_burst = self.process_in[winner].burst_time, self.process_in[loser].burst_time
+        slope = winner_burst - loser_burst
+        if slope <= 0:
+            return math.inf
+        gap = self.offset[loser] * winner_burst - self.offset[winner] * loser_burst # the loser leads when slope * t + gap > 0 (>= 0 if it came first)
+        if self.order[loser] < self.order[winner]:
+            return -(gap // slope)
+        return -gap // slope + 1
+
+    def _match(self, node: int) -> None:
+        a, b = self.winner[2 * node], self.winner[2 * node + 1]
+        if a < 0 or b < 0:
+            self.winner[node], self.fail[node] = max(a, b), math.inf
+        else:
+            if not self._beats(a, b):
+                a, b = b, a
+            self.winner[node], self.fail[node] = a, self._overtake_time(a, b)
+        self.min_fail[node] = min(self.fail[node], self.min_fail[2 * node], self.min_fail[2 * node + 1])
+
+    def _replay(self, node: int) -> None:
+        """Re-plays the matches with an expired certificate under node (children first)."""
+        if node >= self.size or self.min_fail[node] > self.now:
+            return
+        self._replay(2 * node)
+        self._replay(2 * node + 1)
+        self._match(node)
+
+    def _advance(self) -> None:
+        self.now = max(self.now, self.clock())
+        self._replay(1)
+
+    def _update_path(self, slot: int) -> None:
+        node = (self.size + slot) // 2
+        while node > 0:
+            self._match(node)
+            node //= 2
+
+    def append(self, p: Process) -> None:
+        self._advance()
+        if not self.free_slots: # double the capacity
+            self._build(self.size * 2, [(q, self.offset[slot], self.order[slot]) for slot, q in enumerate(self.process_in)])
+        slot = self.free_slots.pop()
+        self.slot_of[p.pid] = slot
+        self.process_in[slot] = p
+        self.offset[slot] = p.wait_time - p.ready_since
+        self.order[slot] = next(self.seq)
+        self.winner[self.size + slot] = slot
+        self._update_path(slot)
+
+    def remove(self, p: Process) -> None:
+        self._advance()
+        slot = self.slot_of.pop(p.pid)
+        self.process_in[slot] = None
+        self.winner[self.size + slot] = -1
+        self.free_slots.append(slot)
+        self._update_path(slot)
+
+    def peek(self) -> Optional[Process]:
+        self._advance()
+        leader = self.winner[1]
+        return self.process_in[leader] if leader >= 0 else None
+
+    def charge(self, p: Process, ticks: int) -> None:
+        pass # the ratio only depends on waiting
+
+    def __len__(self) -> int:
+        return len(self.slot_of)
+
+    def __iter__(self) -> Iterator[Process]:
+        for p in self.process_in:
+            if p is not None:
+                yield p
+
+
+class FairShareQueue:
+    """
+    Two-level fair share: the group with the least decayed CPU usage per weight runs next, its members take turns (FIFO).
+    Usage decays by half every `half_life` ticks. It is only updated at segment boundaries: the ticks of the running
+    process are collected by charge() and folded into its group's counter (decayed to that moment) by the next queue
+    operation, a pick compares the counters decayed to now. A pick is O(groups with ready members).
+    """
+
+    def __init__(self, clock: Callable[[], int], weights: Dict[str, float], half_life: int) -> None:
+        self.clock = clock # current simulation time
+        self.weights = weights
+        self.half_life = half_life
+        self.members: Dict[Optional[str], Dict[int, Process]] = {} # group -> its ready processes in arrival order (only non-empty groups)
+        self.usage: Dict[Optional[str], float] = {} # group -> decayed CPU usage at usage_time
+        self.usage_time: Dict[Optional[str], int] = {}
+        self.count = 0
+        self.running: Optional[Process] = None # process whose ticks are not folded yet
+        self.running_ticks = 0
+
+    def weight_of(self, group: Optional[str]) -> float:
+        return self.weights.get(group, 1) if group is not None else 1
+
+    def decayed_usage(self, group: Optional[str], now: int) -> float:
+        if group not in self.usage:
+            return 0.0
+        return self.usage[group] * 0.5 ** ((now - self.usage_time[group]) / self.half_life)
+
+    def _settle(self) -> None:
+        """Folds the collected ticks of the last segment into its group's usage."""
+        if self.running is None:
+            return
+        group, now = self.running.group, self.clock()
+        self.usage[group] = self.decayed_usage(group, now) + self.running_ticks
+        self.usage_time[group] = now
+        self.running, self.running_ticks = None, 0
+
+    def append(self, p: Process) -> None:
+        self._settle()
+        self.members.setdefault(p.group, {})[p.pid] = p
+        self.count += 1
+
+    def remove(self, p: Process) -> None:
+        self._settle()
+        group = self.members[p.group]
+        del group[p.pid]
+        if not group:
+            del self.members[p.group]
+        self.count -= 1
+
+    def peek(self) -> Optional[Process]:
+        self._settle()
+        if not self.members:
+            return None
+        now = self.clock()
+        best_group = min(self.members, key=lambda group: self.decayed_usage(group, now) / self.weight_of(group)) # ties: the group that became ready first
+        return next(iter(self.members[best_group].values()))
+
+    def charge(self, p: Process, ticks: int) -> None:
+        if self.running is not p:
+            self._settle()
+            self.running = p
+        self.running_ticks += ticks
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Process]:
+        for group in list(self.members.values()):
+            yield from list(group.values())
+
+
+class AdaptiveRRQueue:
+    """
+    Round Robin whose quantum is recomputed for every dispatch (see AdaptiveRRConfig).
+    The statistics the rules need are kept up to date on append/remove (the remaining time of a queued process
+    doesn't change): a running sum for MEAN, a two-heap running median for MEDIAN, the count for TARGET_LATENCY,
+    and the next quantum of every process for GROWING. Computing a quantum never scans the queue.
+    """
+
+    def __init__(self, rule: str, q: int, min_quantum: int, max_quantum: int, target_latency: int, growth: float) -> None:
+        self.rule = rule
+        self.q = q
+        self.min_quantum = min_quantum
+        self.max_quantum = max_quantum
+        self.target_latency = target_latency
+        self.growth = growth
+        self.fifo: Dict[int, Process] = {} # pid -> process, in arrival order
+        self.total_remaining = 0 # MEAN
+        self.remaining = RunningMedian() # MEDIAN
+        self.next_quantum: Dict[int, int] = {} # GROWING: pid -> its next quantum
+        self.granted: Dict[int, Tuple[int, int]] = {} # GROWING: pid -> (quantum of the last dispatch, ticks used of it)
+
+    def append(self, p: Process) -> None:
+        self.fifo[p.pid] = p
+        self.total_remaining += p.remaining_time
+        if self.rule == "MEDIAN":
+            self.remaining.add(p.pid, p.remaining_time)
+        granted = self.granted.pop(p.pid, None)
+        if granted is not None and granted[1] >= granted[0]: # used its whole quantum: a longer one next time
+            self.next_quantum[p.pid] = min(self.max_quantum, math.ceil(granted[0] * self.growth))
+
+    def remove(self, p: Process) -> None:
+        del self.fifo[p.pid]
+        self.total_remaining -= p.remaining_time
+        if self.rule == "MEDIAN":
+            self.remaining.remove(p.pid)
+
+    def peek(self) -> Optional[Process]:
+        return next(iter(self.fifo.values()), None)
+
+    def time_slice(self, p: Process) -> int:
+        """Quantum of the dispatch of p (already removed from the queue), between min_quantum and max_quantum."""
+        if self.rule == "MEAN":
+            quantum = (self.total_remaining + p.remaining_time) / (len(self.fifo) + 1)
+        elif self.rule == "MEDIAN":
+            self.remaining.add(p.pid, p.remaining_time)
+            quantum = self.remaining.median()
+            self.remaining.remove(p.pid)
+        elif self.rule == "TARGET_LATENCY":
+            quantum = self.target_latency / (len(self.fifo) + 1)
+        else: # GROWING
+            quantum = self.next_quantum.get(p.pid, self.q)
+        quantum = max(self.min_quantum, min(self.max_quantum, math.ceil(quantum)))
+        if self.rule == "GROWING":
+            self.granted[p.pid] = (quantum, 0)
+        return quantum
+
+    def charge(self, p: Process, ticks: int) -> None:
+        if p.pid in self.granted:
+            quantum, used = self.granted[p.pid]
+            self.granted[p.pid] = (quantum, used + ticks)
+
+    def __len__(self) -> int:
+        return len(self.fifo)
+
+    def __iter__(self) -> Iterator[Process]:
+        return iter(list(self.fifo.values()))
+
+
+class LotteryQueue:
+    """
+    Lottery scheduling: the next process is drawn with probability tickets / total tickets.
+    Every process owns a slot in a Fenwick tree weighted by its tickets, so a draw is O(log n).
+    The draw is kept until the queue changes, so peek() and the following remove() agree.
+    """
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+        self.tickets = FenwickTree(64)
+        self.slot_of: Dict[int, int] = {} # pid -> slot
+        self.process_in: List[Optional[Process]] = [None] * 64 # slot -> process
+        self.free_slots: List[int] = list(range(63, -1, -1))
+        self.winner: Optional[Process] = None
+
+    def append(self, p: Process) -> None:
+        if not self.free_slots: # double the capacity
+            old_size = self.tickets.size
+            self.tickets.grow(old_size * 2)
+            self.process_in.extend([None] * old_size)
+            self.free_slots = list(range(old_size * 2 - 1, old_size - 1, -1))
+        slot = self.free_slots.pop()
+        self.slot_of[p.pid] = slot
+        self.process_in[slot] = p
+        self.tickets.set(slot, PROPORTIONAL_SHARE_TICKETS[p.category])
+        self.winner = None
+
+    def remove(self, p: Process) -> None:
+        slot = self.slot_of.pop(p.pid)
+        self.process_in[slot] = None
+        self.tickets.set(slot, 0)
+        self.free_slots.append(slot)
+        self.winner = None
+
+    def peek(self) -> Optional[Process]:
+        if self.winner is None and self.tickets.total > 0:
+            self.winner = self.process_in[self.tickets.find(self.rng.randrange(self.tickets.total))]
+        return self.winner
+
+    def charge(self, p: Process, ticks: int) -> None:
+        pass # lotteries have no memory
+
+    def __len__(self) -> int:
+        return len(self.slot_of)
+
+    def __iter__(self) -> Iterator[Process]:
+        for p in self.process_in:
+            if p is not None:
+                yield p
+
+
+class _Group:
+    """Union-find node: the links appended to a level while it owned this group. Only a root knows its level."""
+    __slots__ = ("parent", "level")
+
+    def __init__(self, level: int) -> None:
+        self.parent: Optional[_Group] = None
+        self.level = level
+
+
+class _Link:
+    __slots__ = ("prev", "next", "process", "group")
+
+    def __init__(self, process: Optional[Process], group: Optional[_Group]) -> None:
+        self.prev: _Link = self
+        self.next: _Link = self
+        self.process = process
+        self.group = group
+
+
+class FeedbackQueues:
+    """
+    The levels of one MLFQ: doubly linked FIFO lists that can be spliced in O(1).
+    A priority boost moves every level to the end of level 0 in O(levels): the lists are spliced, and the group of
+    the spliced level is attached under level 0's group (union-find), so the level of a queued process is resolved
+    lazily when it leaves the queue instead of rewriting every process.
+    Allotment bookkeeping (time used at the current level) is reset lazily the same way, through a boost epoch.
+    """
+
+    def __init__(self, n_levels: int) -> None:
+        self.links: Dict[int, _Link] = {} # pid -> its link, shared by all the levels
+        self.levels = [FeedbackLevel(self, level) for level in range(n_levels)]
+        self.epoch = 0 # number of boosts so far
+
+    def _find(self, group: _Group) -> _Group:
+        root = group
+        while root.parent is not None:
+            root = root.parent
+        while group is not root: # path compression
+            group.parent, group = root, group.parent
+        return root
+
+    def boost(self) -> None:
+        top = self.levels[0]
+        for level in self.levels[1:]:
+            if level.count > 0:
+                first, last = level.sentinel.next, level.sentinel.prev
+                tail = top.sentinel.prev
+                tail.next, first.prev = first, tail
+                last.next, top.sentinel.prev = top.sentinel, last
+                level.sentinel.next = level.sentinel.prev = level.sentinel
+                top.count += level.count
+                level.count = 0
+            level.group.parent = top.group
+            level.group = _Group(level.level)
+        self.epoch += 1
+
+    def level_time_used(self, p: Process) -> int:
+        """Time the process has run at its current level since it got there (or since the last boost)."""
+        return p.level_time_used if p.boost_epoch == self.epoch else 0
+
+    def reset_level_time(self, p: Process) -> None:
+        p.level_time_used = 0
+        p.boost_epoch = self.epoch
+
+    def missed_boost(self, p: Process) -> bool:
+        """Was the process off the queues and off the CPU (WAITING, swapped out) during a boost? Then it belongs to level 0."""
+        return p.level_epoch != self.epoch
+
+
+class FeedbackLevel:
+    """One MLFQ level (FIFO), see FeedbackQueues."""
+
+    def __init__(self, queues: FeedbackQueues, level: int) -> None:
+        self.queues = queues
+        self.level = level
+        self.sentinel = _Link(None, None)
+        self.group = _Group(level)
+        self.count = 0
+
+    def append(self, p: Process) -> None:
+        link = _Link(p, self.group)
+        tail = self.sentinel.prev
+        link.prev, link.next = tail, self.sentinel
+        tail.next = self.sentinel.prev = link
+        self.queues.links[p.pid] = link
+        self.count += 1
+
+    def remove(self, p: Process) -> None:
+        """Removes the process from whichever level holds it now, and updates its process_ready_queue_id."""
+        link = self.queues.links.pop(p.pid)
+        owner = self.queues.levels[self.queues._find(link.group).level]
+        link.prev.next, link.next.prev = link.next, link.prev
+        owner.count -= 1
+        p.process_ready_queue_id = owner.level
+        p.level_epoch = self.queues.epoch
+
+    def peek(self) -> Optional[Process]:
+        return self.sentinel.next.process
+
+    def charge(self, p: Process, ticks: int) -> None:
+        if p.boost_epoch != self.queues.epoch:
+            self.queues.reset_level_time(p)
+        p.level_time_used += ticks
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Process]:
+        link = self.sentinel.next
+        while link is not self.sentinel:
+            yield link.process
+            link = link.next
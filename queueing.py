@@ -0,0 +1,176 @@
+import math
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from definitions import (
+    InputList, InputListScaled, SimulationSummary, WorkloadFit, QueueingEstimate,
+    validate_input_and_determine_scheduler_mode, scale_input_time
+)
+
+# Queueing-theory estimates of the mean waiting, response and turnaround times, without simulating.
+## The workload is read as a single-server queue: arrival rate and burst moments are fitted from the input, then
+## the closed-form results give the steady-state means (first order only: a short run, bursty arrivals or rho close to 1 all
+## move the simulation away from them, compare_with_simulation shows by how much).
+### - M/M/1: Poisson arrivals, exponential bursts, FCFS.
+### - M/G/1 (Pollaczek-Khinchine): Poisson arrivals, any burst distribution, FCFS. Wq = lambda E[S^2] / (2 (1 - rho)).
+### - M/G/1-SRPT (Schrage-Miller): shortest remaining processing time first, per job size over the empirical distribution.
+### - M/G/1-PS: processor sharing (RR with q -> 0, see fluid.py). E[T] = E[S] / (1 - rho), whatever the burst distribution.
+## Context switches are folded into the service time: cs per dispatch (FCFS, SRPT) or an overhead factor cs/q (PS).
+
+
+def fit_workload(data_list: InputListScaled, cs: float = 0.0, overhead: float = 0.0) -> WorkloadFit:
+    """
+    Arrival rate and service moments of the (scaled) input. The service time of a process is burst * (1 + overhead) + cs.
+    The arrival rate is measured over the span of the arrivals: (n - 1) / (last - first).
+    """
+    n = len(data_list)
+    arrivals = sorted(item[0] for item in data_list)
+    services = [item[1] * (1 + overhead) + cs for item in data_list]
+    span = arrivals[-1] - arrivals[0]
+    gaps = [b - a for a, b in zip(arrivals, arrivals[1:])]
+    mean_gap = span / len(gaps) if gaps else 0.0
+    if mean_gap > 0:
+        gap_variance = sum((gap - mean_gap) ** 2 for gap in gaps) / len(gaps)
+        interarrival_scv = gap_variance / mean_gap ** 2
+    else:
+        interarrival_scv = 0.0
+    return WorkloadFit(
+        n=n,
+        arrival_rate=1 / mean_gap if mean_gap > 0 else math.inf, # all at once: a batch, not a queue
+        interarrival_scv=interarrival_scv,
+        mean_service=sum(services) / n,
+        second_moment_service=sum(s * s for s in services) / n,
+        service_sizes=services,
+    )
+
+
+def _unstable(model: str) -> QueueingEstimate:
+    return QueueingEstimate(model=model, avg_wait_time=math.inf, avg_response_time=math.inf, avg_turnaround_time=math.inf)
+
+
+def mm1(fit: WorkloadFit) -> QueueingEstimate:
+    rho = fit.utilization
+    if rho >= 1:
+        return _unstable("M/M/1")
+    wait = rho * fit.mean_service / (1 - rho)
+    return QueueingEstimate(model="M/M/1", avg_wait_time=wait, avg_response_time=wait, avg_turnaround_time=wait + fit.mean_service)
+
+
+def mg1(fit: WorkloadFit) -> QueueingEstimate:
+    """Pollaczek-Khinchine mean value formula (FCFS)."""
+    rho = fit.utilization
+    if rho >= 1:
+        return _unstable("M/G/1")
+    wait = fit.arrival_rate * fit.second_moment_service / (2 * (1 - rho))
+    return QueueingEstimate(model="M/G/1", avg_wait_time=wait, avg_response_time=wait, avg_turnaround_time=wait + fit.mean_service)
+
+
+def mg1_srpt(fit: WorkloadFit) -> QueueingEstimate:
+    """
+    Schrage-Miller, for a job of size x:
+    E[T(x)] = lambda (int_0^x t^2 dF(t) + x^2 (1 - F(x))) / (2 (1 - rho(x))^2) + int_0^x dt / (1 - rho(t)),   rho(x) = lambda int_0^x t dF(t).
+    The first term is the wait before the first dispatch, the second the residence time (preempted by shorter jobs only).
+    Jobs of the same size count as shorter in the wait (FCFS between equals) and not in the residence.
+    O(m log m) over the m distinct service sizes.
+    """
+    if fit.utilization >= 1:
+        return _unstable("M/G/1-SRPT")
+    lam = fit.arrival_rate
+    counts = Counter(fit.service_sizes)
+    n = fit.n
+    turnaround = response = 0.0
+    cumulative_p = cumulative_load = cumulative_m2 = 0.0 # over the sizes <= x
+    residence = 0.0 # int_0^x dt / (1 - rho(t)), rho(t) from the sizes < t
+    previous = 0.0
+    for x in sorted(counts):
+        p = counts[x] / n
+        residence += (x - previous) / (1 - lam * cumulative_load)
+        cumulative_p += p
+        cumulative_load += x * p
+        cumulative_m2 += x * x * p
+        rho_x = lam * cumulative_load
+        wait_x = lam * (cumulative_m2 + x * x * max(0.0, 1 - cumulative_p)) / (2 * (1 - rho_x) ** 2)
+        response += p * wait_x
+        turnaround += p * (wait_x + residence)
+        previous = x
+    return QueueingEstimate(model="M/G/1-SRPT", avg_wait_time=turnaround - fit.mean_service, avg_response_time=response, avg_turnaround_time=turnaround)
+
+
+def mg1_ps(fit: WorkloadFit) -> QueueingEstimate:
+    """Processor sharing: insensitive to the burst distribution, every process is served from its arrival."""
+    rho = fit.utilization
+    if rho >= 1:
+        return _unstable("M/G/1-PS")
+    turnaround = fit.mean_service / (1 - rho)
+    return QueueingEstimate(model="M/G/1-PS", avg_wait_time=turnaround - fit.mean_service, avg_response_time=None, avg_turnaround_time=turnaround)
+
+
+def estimate(data_list: InputListScaled, cs: float = 0.0, q: Optional[float] = None) -> List[QueueingEstimate]:
+    """All four estimates (ticks). PS uses the overhead factor cs/q when q is given."""
+    fit = fit_workload(data_list, cs=cs)
+    ps_fit = fit_workload(data_list, overhead=cs / q) if q else fit_workload(data_list)
+    return [mm1(fit), mg1(fit), mg1_srpt(fit), mg1_ps(ps_fit)]
+
+
+def relative_error(predicted: Optional[float], actual: float) -> Optional[float]:
+    if predicted is None:
+        return None
+    if math.isinf(predicted):
+        return math.inf
+    return (predicted - actual) / actual if actual != 0 else (0.0 if predicted == 0 else math.inf)
+
+
+def compare_with_simulation(input_list: InputList, q: float, cs: float, **scheduler_options) -> List[Tuple[QueueingEstimate, SimulationSummary]]:
+    """
+    Predicts, then simulates the matching algorithm on the same input (M/M/1 and M/G/1: FCFS, M/G/1-SRPT: SRTF, M/G/1-PS: RR)
+    and prints the relative error of every mean. scheduler_options are passed to the Scheduler.
+    """
+    from main import Scheduler # only needed for the comparison, the estimates themselves never simulate
+
+    scheduler_mode = validate_input_and_determine_scheduler_mode(data_list=input_list, q=q, cs=cs)
+    (data_list_scaled, q_scaled, cs_scaled, time_scale) = scale_input_time(data_list=input_list, q=q, cs=cs, scheduler_mode=scheduler_mode, max_precision=4)
+    fit = fit_workload(data_list_scaled, cs=cs_scaled)
+    scheduler = Scheduler(data_list_scaled, cs_scaled, q_scaled, scheduler_mode, time_scale=time_scale, **scheduler_options)
+
+    simulated = {}
+    for algo in ("FCFS", "SRTF", "RR"):
+        scheduler.all_algorithms[algo]()
+        simulated[algo] = scheduler.summarize()
+    matched = dict(zip(("M/M/1", "M/G/1", "M/G/1-SRPT", "M/G/1-PS"), ("FCFS", "FCFS", "SRTF", "RR")))
+    results = [(prediction, simulated[matched[prediction.model]]) for prediction in estimate(data_list_scaled, cs_scaled, q_scaled)]
+
+    def fmt(t: Optional[float]) -> str:
+        if t is None:
+            return "n/a"
+        return "inf" if math.isinf(t) else f"{t / time_scale:.2f}"
+
+    def fmt_error(e: Optional[float]) -> str:
+        return "n/a" if e is None else f"{e:+.1%}"
+
+    print(f"\n{'='*30} QUEUEING ESTIMATES {'='*30}")
+    print(f"n={fit.n}, lambda={fit.arrival_rate * time_scale:.4f}/time unit, E[S]={fit.mean_service / time_scale:.2f}, rho={fit.utilization:.3f}, "
+          f"burst SCV={fit.service_scv:.2f}, interarrival SCV={fit.interarrival_scv:.2f} (1: Poisson)")
+    print(f"{'MODEL':<11} {'SIM':<5} {'WT':<9} {'SIM WT':<9} {'ERR':<8} {'RT':<9} {'SIM RT':<9} {'ERR':<8} {'TAT':<9} {'SIM TAT':<9} {'ERR':<8}")
+    print("-" * 102)
+    for prediction, summary in results:
+        errors = [fmt_error(relative_error(p, a)) for p, a in (
+            (prediction.avg_wait_time, summary.avg_wait_time),
+            (prediction.avg_response_time, summary.avg_response_time),
+            (prediction.avg_turnaround_time, summary.avg_turnaround_time),
+        )]
+        print(f"{prediction.model:<11} {str(summary.algorithm):<5} "
+              f"{fmt(prediction.avg_wait_time):<9} {fmt(summary.avg_wait_time):<9} {errors[0]:<8} "
+              f"{fmt(prediction.avg_response_time):<9} {fmt(summary.avg_response_time):<9} {errors[1]:<8} "
+              f"{fmt(prediction.avg_turnaround_time):<9} {fmt(summary.avg_turnaround_time):<9} {errors[2]:<8}")
+    return results
+
+
+if __name__ == "__main__":
+    import random
+    rng = random.Random(11)
+    workload: InputList = []
+    arrival = 0
+    for _ in range(3000):
+        arrival += round(rng.expovariate(1 / 12)) # ~Poisson arrivals
+        workload.append([arrival, max(1, round(rng.expovariate(1 / 9)))]) # ~exponential bursts, rho ~0.75
+    compare_with_simulation(workload, q=1, cs=0)
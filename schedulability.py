@@ -0,0 +1,78 @@
+import math
+from typing import List, Optional, Set
+from definitions import (
+    InputListScaled, PeriodicTask, SchedulabilityReport, ProcessCategory, MLQLayout
+)
+
+# Rate-monotonic schedulability analysis for periodic REAL_TIME task sets (fixed priorities, shorter period = higher priority).
+## Runs before (or instead of) the simulation: the verdict only depends on C, T and D, not on the length of the run.
+### - Liu-Layland: U <= n(2^(1/n) - 1) is sufficient for implicit deadlines (O(n)).
+### - Response-time analysis: R = C + sum over higher priority tasks of ceil(R/T_j) * C_j, iterated to a fixed point. Exact (pseudo-polynomial).
+## Context switches are not part of C, add them to the wcet if they should count.
+
+
+def liu_layland_bound(n: int) -> float:
+    return n * (2 ** (1 / n) - 1) if n > 0 else 1.0
+
+
+def rate_monotonic_order(tasks: List[PeriodicTask]) -> List[int]:
+    """Task indices from the highest to the lowest priority (shorter period first, ties by input order)."""
+    return sorted(range(len(tasks)), key=lambda i: (tasks[i].period, i))
+
+
+def response_time(task: PeriodicTask, higher_priority: List[PeriodicTask]) -> Optional[int]:
+    """Worst-case response time of the task (released together with all higher priority tasks), None if it exceeds the deadline."""
+    r = task.wcet + sum(t.wcet for t in higher_priority)
+    while r <= task.deadline:
+        interference = sum(math.ceil(r / t.period) * t.wcet for t in higher_priority)
+        next_r = task.wcet + interference
+        if next_r == r:
+            return r
+        r = next_r
+    return None
+
+
+def rate_monotonic_test(tasks: List[PeriodicTask]) -> SchedulabilityReport:
+    n = len(tasks)
+    utilization = sum(t.wcet / t.period for t in tasks)
+    bound = liu_layland_bound(n)
+    implicit = all(t.deadline == t.period for t in tasks)
+    passes_bound = implicit and utilization <= bound
+    response_times: List[Optional[int]] = [None] * n
+    if utilization <= 1: # otherwise the lowest priority task can never keep up
+        order = rate_monotonic_order(tasks)
+        for rank, i in enumerate(order):
+            response_times[i] = response_time(tasks[i], [tasks[j] for j in order[:rank]])
+    return SchedulabilityReport(
+        utilization=utilization,
+        liu_layland_bound=bound,
+        passes_utilization_bound=passes_bound,
+        response_times=response_times,
+        schedulable=all(r is not None for r in response_times) and n > 0,
+    )
+
+
+def real_time_categories(layout: Optional[MLQLayout] = None) -> Set[str]:
+    """
+    Category names that run as REAL_TIME: without a layout only REAL_TIME itself, with one every category served by
+    a level that serves REAL_TIME or an alias of it (they share the level, so they interfere with each other).
+    """
+    if layout is None:
+        return {ProcessCategory.REAL_TIME.name}
+    levels = {i for name, i in layout.category_level.items() if layout.base_category(name) is ProcessCategory.REAL_TIME}
+    return {name for name, i in layout.category_level.items() if i in levels}
+
+
+def periodic_tasks_from_input(data_list: InputListScaled, layout: Optional[MLQLayout] = None) -> List[PeriodicTask]:
+    """
+    REAL_TIME processes with a deadline (4th column) read as periodic tasks:
+    C = burst time, T = D = deadline - arrival time (the process is the first job of the task).
+    The categories are resolved through the MLQ layout, if any (see real_time_categories).
+    """
+    real_time = real_time_categories(layout)
+    tasks: List[PeriodicTask] = []
+    for pid, item in enumerate(data_list):
+        if len(item) >= 4 and item[2] in real_time and item[3] is not None:
+            relative_deadline = item[3] - item[0]
+            tasks.append(PeriodicTask(wcet=item[1], period=relative_deadline, pid=pid))
+    return tasks
@@ -0,0 +1,280 @@
+import heapq
+import itertools
+import random
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Indexed structures shared by the memory model and the ready-queue policies.
+
+
+class _Node:
+    __slots__ = ("key", "size", "value", "prio", "left", "right", "max_size")
+
+    def __init__(self, key: Any, size: int, value: Any, prio: float) -> None:
+        self.key = key
+        self.size = size
+        self.value = value # payload (e.g. the process)
+        self.prio = prio
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        self.max_size = size # largest size in this subtree
+
+
+def _update(node: _Node) -> None:
+    m = node.size
+    if node.left is not None and node.left.max_size > m:
+        m = node.left.max_size
+    if node.right is not None and node.right.max_size > m:
+        m = node.right.max_size
+    node.max_size = m
+
+
+def _split(node: Optional[_Node], key: Any, inclusive: bool) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Splits into (keys < key, keys >= key), or (keys <= key, keys > key) if inclusive."""
+    if node is None:
+        return None, None
+    goes_left = node.key <= key if inclusive else node.key < key
+    if goes_left:
+        left, right = _split(node.right, key, inclusive)
+        node.right = left
+        _update(node)
+        return node, right
+    left, right = _split(node.left, key, inclusive)
+    node.left = right
+    _update(node)
+    return left, node
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    """Every key in a is smaller than every key in b."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+class OrderedIndex:
+    """
+    A treap (randomized balanced search tree): key -> size, O(log n) expected per operation.
+    Besides the usual ordered queries, it answers "the leftmost entry with size >= s" using the subtree maximum.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self.root: Optional[_Node] = None
+        self.count = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[_Node]:
+        """In key order."""
+        stack: List[_Node] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def insert(self, key: Any, size: int = 0, value: Any = None) -> None:
+        left, right = _split(self.root, key, inclusive=False)
+        self.root = _merge(_merge(left, _Node(key, size, value, self._rng.random())), right)
+        self.count += 1
+
+    def remove(self, key: Any) -> None:
+        left, right = _split(self.root, key, inclusive=False)
+        middle, right = _split(right, key, inclusive=True)
+        if middle is None:
+            raise KeyError(key)
+        self.root = _merge(left, right)
+        self.count -= 1
+
+    def max_size(self) -> int:
+        return 0 if self.root is None else self.root.max_size
+
+    def first(self) -> Optional[_Node]:
+        """Entry with the smallest key."""
+        node = self.root
+        if node is None:
+            return None
+        while node.left is not None:
+            node = node.left
+        return node
+
+    def ceiling(self, key: Any) -> Optional[_Node]:
+        """Entry with the smallest key >= key."""
+        node, best = self.root, None
+        while node is not None:
+            if node.key >= key:
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def predecessor(self, key: Any) -> Optional[_Node]:
+        """Entry with the largest key < key."""
+        node, best = self.root, None
+        while node is not None:
+            if node.key < key:
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def successor(self, key: Any) -> Optional[_Node]:
+        """Entry with the smallest key > key."""
+        node, best = self.root, None
+        while node is not None:
+            if node.key > key:
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def leftmost_fit(self, min_size: int, low_key: Any = None) -> Optional[_Node]:
+        """Entry with the smallest key (>= low_key, if given) whose size is >= min_size."""
+        return self._leftmost_fit(self.root, min_size, low_key)
+
+    def _leftmost_fit(self, node: Optional[_Node], min_size: int, low_key: Any) -> Optional[_Node]:
+        while node is not None and node.max_size >= min_size:
+            if low_key is not None and node.key < low_key: # everything on the left is out of range
+                node = node.right
+                continue
+            found = self._leftmost_fit(node.left, min_size, low_key)
+            if found is not None:
+                return found
+            if node.size >= min_size:
+                return node
+            node = node.right
+        return None
+
+
+class FenwickTree:
+    """
+    Binary indexed tree over slot weights: point update and prefix sums in O(log n),
+    and find(r) = the slot where the running sum passes r (a weighted draw in O(log n)).
+    """
+
+    def __init__(self, size: int = 1) -> None:
+        self.size = max(1, size)
+        self.tree = [0] * (self.size + 1)
+        self.weights = [0] * self.size
+        self.total = 0
+
+    def grow(self, size: int) -> None:
+        """Rebuilds with room for `size` slots (O(size)), keeping the weights."""
+        weights = self.weights + [0] * (size - self.size)
+        self.size = size
+        self.tree = [0] * (size + 1)
+        for i, w in enumerate(weights): # O(n) build
+            j = i + 1
+            self.tree[j] += w
+            parent = j + (j & -j)
+            if parent <= size:
+                self.tree[parent] += self.tree[j]
+        self.weights = weights
+
+    def set(self, slot: int, weight: int) -> None:
+        delta = weight - self.weights[slot]
+        self.weights[slot] = weight
+        self.total += delta
+        i = slot + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, r: int) -> int:
+        """Smallest slot whose prefix sum (inclusive) is > r, for 0 <= r < total."""
+        position = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self.tree[nxt] <= r:
+                position = nxt
+                r -= self.tree[nxt]
+            step >>= 1
+        return position # 0-based slot
+
+
+class RunningMedian:
+    """
+    Median of a changing multiset of (id, value): a max-heap of the lower half and a min-heap of the upper half.
+    Removed entries stay in their heap and are skipped lazily, so add, remove and median are O(log n).
+    """
+
+    def __init__(self) -> None:
+        self.low: List[Tuple[float, int, int]] = [] # (-value, token, id), max-heap of the lower half
+        self.high: List[Tuple[float, int, int]] = [] # (value, token, id)
+        self.entry_of: Dict[int, Tuple[bool, int]] = {} # id -> (in the lower half?, token of its valid entry)
+        self.low_count = 0
+        self.high_count = 0
+        self.tokens = itertools.count()
+
+    def __len__(self) -> int:
+        return self.low_count + self.high_count
+
+    def _prune(self, heap: List[Tuple[float, int, int]], in_low: bool) -> None:
+        while heap and self.entry_of.get(heap[0][2]) != (in_low, heap[0][1]):
+            heapq.heappop(heap)
+
+    def _push(self, id: int, value: float, in_low: bool) -> None:
+        token = next(self.tokens)
+        self.entry_of[id] = (in_low, token)
+        if in_low:
+            heapq.heappush(self.low, (-value, token, id))
+            self.low_count += 1
+        else:
+            heapq.heappush(self.high, (value, token, id))
+            self.high_count += 1
+
+    def _rebalance(self) -> None:
+        """The lower half holds the extra element when the count is odd."""
+        while self.low_count > self.high_count + 1:
+            self._prune(self.low, True)
+            value, _, id = heapq.heappop(self.low)
+            self.low_count -= 1
+            self._push(id, -value, False)
+        while self.high_count > self.low_count:
+            self._prune(self.high, False)
+            value, _, id = heapq.heappop(self.high)
+            self.high_count -= 1
+            self._push(id, value, True)
+        self._prune(self.low, True)
+        self._prune(self.high, False)
+
+    def add(self, id: int, value: float) -> None:
+        self._prune(self.low, True)
+        self._push(id, value, not self.low or value <= -self.low[0][0])
+        self._rebalance()
+
+    def remove(self, id: int) -> None:
+        in_low, _ = self.entry_of.pop(id)
+        if in_low:
+            self.low_count -= 1
+        else:
+            self.high_count -= 1
+        self._rebalance()
+
+    def median(self) -> Optional[float]:
+        if len(self) == 0:
+            return None
+        if self.low_count > self.high_count:
+            return -self.low[0][0]
+        return (-self.low[0][0] + self.high[0][0]) / 2
+
+
+def lowest_set_bit(bits: int) -> int:
+    """Index of the lowest set bit (find-first-set) of a non-zero bitmap, O(1) for bitmaps of a few machine words."""
+    return (bits & -bits).bit_length() - 1
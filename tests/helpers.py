@@ -0,0 +1,25 @@
+import random
+
+# Shared by the test modules, imported explicitly: from helpers import workload, result
+
+CATEGORIES = ["BATCH", "INTERACTIVE", "SYSTEM", "REAL_TIME"]
+GROUPS = ["alice", "bob", "carol"]
+
+
+def workload(seed, n=30, max_arrival=100, max_burst=25, mlq=False):
+    """Random input of n processes (STANDARD, or MLQ with a category, no deadline and a group)."""
+    rng = random.Random(seed)
+    data = []
+    for _ in range(n):
+        item = [rng.randint(0, max_arrival), rng.randint(1, max_burst)]
+        if mlq: # category, no deadline, group
+            item += [rng.choice(CATEGORIES), None, rng.choice(GROUPS)]
+        data.append(item)
+    return data
+
+
+def result(scheduler):
+    """Everything a run produces: summary, per-process times and logs, to compare two runs."""
+    processes = [(p.pid, p.completion_time, p.wait_time, p.response_time) for p in scheduler.processes]
+    logs = [(log.start_time, log.end_time, log.pid, str(log.event_type)) for log in scheduler.logs]
+    return scheduler.summarize(), processes, logs
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from batched import simulate_batch
+from definitions import SchedulerMode
+from main import Scheduler
+
+
+def workloads(seed, count=60):
+    rng = random.Random(seed)
+    batch = []
+    for _ in range(count):
+        arrival = 0
+        workload = []
+        for _ in range(rng.randint(1, 25)):
+            arrival += rng.randint(0, 8)
+            workload.append((arrival, rng.randint(1, 12)))
+        rng.shuffle(workload) # unsorted input, as the Scheduler accepts it
+        batch.append(workload)
+    return batch
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "RR"])
+@pytest.mark.parametrize("q, cs", [(1, 0), (3, 1), (4, 3), (20, 2)])
+def test_matches_scheduler(algorithm, q, cs):
+    batch = workloads(q * 10 + cs)
+    for workload, summary in zip(batch, simulate_batch(batch, q, cs, algorithm)):
+        scheduler = Scheduler([list(item) for item in workload], cs, q, SchedulerMode.STANDARD)
+        scheduler.all_algorithms[algorithm]()
+        assert summary == scheduler.summarize()
+
+
+def test_rejects_other_algorithms():
+    with pytest.raises(ValueError):
+        simulate_batch([[(0, 1)]], 2, 0, "SRTF")
+    with pytest.raises(ValueError):
+        simulate_batch([[]], 2, 0, "RR")
@@ -0,0 +1,66 @@
+import random
+import shutil
+
+import pytest
+
+from helpers import result, workload
+from definitions import CheckpointConfig, CriticalSection, LTSConfig, SchedulerMode
+from main import Scheduler
+
+ALGORITHMS = ["FCFS", "SRTF", "RR", "MLFQ", "CFS", "LOTTERY", "FAIR_SHARE"]
+
+
+def run_with_snapshot(monkeypatch, scheduler, algorithm, snapshot, at=2):
+    """Runs to the end and keeps a copy of the files of the `at`-th checkpoint (mid-run)."""
+    write = Scheduler._write_checkpoint
+
+    def write_and_copy(self, state):
+        write(self, state)
+        if self.checkpoints_written == at:
+            shutil.copy(self.checkpoint.path, snapshot)
+            shutil.copy(self.checkpoint.path + ".logs", snapshot + ".logs")
+    with monkeypatch.context() as patch:
+        patch.setattr(Scheduler, "_write_checkpoint", write_and_copy)
+        scheduler.all_algorithms[algorithm]()
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_resume_matches_uninterrupted_run(tmp_path, monkeypatch, algorithm):
+    data = workload(1, n=25, max_arrival=60, max_burst=15)
+    reference = Scheduler([list(x) for x in data], 1, 3, SchedulerMode.STANDARD)
+    reference.all_algorithms[algorithm]()
+
+    path, snapshot = str(tmp_path / "run.ckpt"), str(tmp_path / "mid.ckpt")
+    checkpointed = Scheduler([list(x) for x in data], 1, 3, SchedulerMode.STANDARD, checkpoint=CheckpointConfig(path, interval=10))
+    run_with_snapshot(monkeypatch, checkpointed, algorithm, snapshot)
+    assert checkpointed.checkpoints_written > 2
+    assert result(checkpointed) == result(reference)
+    # from the last checkpoint and from one in the middle of the run
+    assert result(Scheduler.resume_checkpoint(path)) == result(reference)
+    assert result(Scheduler.resume_checkpoint(snapshot)) == result(reference)
+
+
+def test_resume_twice_with_locks_and_memory(tmp_path, monkeypatch):
+    data = workload(2, n=20, max_arrival=60, max_burst=15)
+    options = dict(
+        critical_sections=[[CriticalSection("a", 0, 1)] for _ in data],
+        lts=LTSConfig(memory_capacity=128, allocator="BUDDY"),
+        memory_sizes=[random.Random(i).randint(1, 60) for i in range(len(data))],
+    )
+    reference = Scheduler([list(x) for x in data], 2, 2, SchedulerMode.STANDARD, **options)
+    reference.RR()
+
+    path, snapshot = str(tmp_path / "run.ckpt"), str(tmp_path / "mid.ckpt")
+    checkpointed = Scheduler([list(x) for x in data], 2, 2, SchedulerMode.STANDARD, checkpoint=CheckpointConfig(path, interval=7), **options)
+    run_with_snapshot(monkeypatch, checkpointed, "RR", snapshot, at=3)
+    # back to the middle of the run: the resumed run writes checkpoints of its own, which resume to the same result again
+    shutil.copy(snapshot, path)
+    shutil.copy(snapshot + ".logs", path + ".logs")
+    assert result(Scheduler.resume_checkpoint(path)) == result(reference)
+    assert result(Scheduler.resume_checkpoint(path)) == result(reference)
+
+
+def test_checkpoint_rejected_for_sweeps(tmp_path):
+    scheduler = Scheduler(workload(3, n=25, max_arrival=60, max_burst=15), 1, 3, SchedulerMode.STANDARD, checkpoint=CheckpointConfig(str(tmp_path / "run.ckpt"), interval=10))
+    with pytest.raises(ValueError):
+        scheduler.sweep_quantum([2, 4])
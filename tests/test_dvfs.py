@@ -0,0 +1,49 @@
+import pytest
+
+from definitions import DVFSConfig, SchedulerMode
+from main import Scheduler
+
+WORKLOAD = [(10, 3), (13, 7), (1, 10), (11, 9)]
+
+
+def run(dvfs, algorithm="FCFS", workload=WORKLOAD, cs=4, q=4):
+    scheduler = Scheduler([list(item) for item in workload], cs, q, SchedulerMode.STANDARD, dvfs=dvfs)
+    scheduler.all_algorithms[algorithm]()
+    return scheduler
+
+
+def test_ondemand_load_at_threshold():
+    # 0.8 * 3 / 0.8 rounds to 3.0000000000000004, above the top level
+    scheduler = run(DVFSConfig([1, 2, 3], "ONDEMAND", sampling_period=5))
+    assert all(p.remaining_time == 0 for p in scheduler.processes)
+    assert set(scheduler.time_at_frequency) <= {1, 2, 3}
+
+
+def test_performance_matches_no_dvfs():
+    plain = run(None).summarize()
+    fast = run(DVFSConfig([1, 2, 3], "PERFORMANCE")).summarize()
+    assert fast.makespan == plain.makespan
+    assert fast.avg_turnaround_time == plain.avg_turnaround_time
+    assert fast.avg_frequency == 3
+    assert plain.energy is None and fast.energy > 0
+
+
+def test_powersave_is_slower_and_cheaper_per_tick():
+    fast = run(DVFSConfig([1, 2, 4], "PERFORMANCE"))
+    slow = run(DVFSConfig([1, 2, 4], "POWERSAVE"))
+    assert slow.summarize().avg_frequency == 1
+    assert slow.summarize().makespan > fast.summarize().makespan
+    assert slow.frequency_transitions == 0
+    # the work itself is done at a lower power (cubic model)
+    assert slow.energy / slow.summarize().makespan < fast.energy / fast.summarize().makespan
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "RR", "SRTF"])
+@pytest.mark.parametrize("latency", [0, 3])
+def test_ondemand_completes(algorithm, latency):
+    workload = [(i * 7, 1 + (i * 5) % 11) for i in range(20)]
+    scheduler = run(DVFSConfig([1, 2, 3, 4], "ONDEMAND", transition_latency=latency, sampling_period=6), algorithm, workload)
+    summary = scheduler.summarize()
+    assert all(p.remaining_time == 0 for p in scheduler.processes)
+    assert 1 <= summary.avg_frequency <= 4
+    assert sum(scheduler.time_at_frequency.values()) == scheduler.current_time # every tick at some level
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from helpers import result, workload
+from definitions import (
+    AdaptiveRRConfig, CriticalSection, DVFSConfig, FairShareConfig, LTSConfig, MLFQConfig, MLFQLevel,
+    MLQLayout, MLQLevelSpec, MTSConfig, PriorityConfig, SchedulerMode
+)
+from main import Scheduler
+
+
+def assert_same_as_tick_by_tick(data, cs, q, mode, algorithm, **options):
+    runs = []
+    for fast_forward in (True, False):
+        scheduler = Scheduler([list(x) for x in data], cs, q, mode, fast_forward=fast_forward, **options)
+        scheduler.all_algorithms[algorithm]()
+        runs.append(result(scheduler))
+    assert runs[0] == runs[1]
+
+
+STANDARD = ["FCFS", "SPN", "HRRN", "RR", "ARR", "SRTF", "MLFQ", "CFS", "STRIDE", "LOTTERY", "PRIORITY", "PRIORITY_P"]
+MLQ = ["MLQ", "CFS", "STRIDE", "LOTTERY", "PRIORITY_P", "FAIR_SHARE"]
+
+
+@pytest.mark.parametrize("algorithm", STANDARD)
+@pytest.mark.parametrize("cs", [0, 1, 3])
+def test_standard(algorithm, cs):
+    assert_same_as_tick_by_tick(workload(cs), cs, 4, SchedulerMode.STANDARD, algorithm)
+
+
+@pytest.mark.parametrize("algorithm", MLQ)
+def test_mlq(algorithm):
+    assert_same_as_tick_by_tick(workload(7, mlq=True), 1, 3, SchedulerMode.MLQ, algorithm, fair_share=FairShareConfig(weights={"alice": 2}))
+
+
+@pytest.mark.parametrize("algorithm", ["PRIORITY", "PRIORITY_P"])
+def test_priority_aging(algorithm):
+    assert_same_as_tick_by_tick(workload(12, mlq=True), 1, 3, SchedulerMode.MLQ, algorithm, priority=PriorityConfig(aging_interval=3))
+
+
+def test_mlq_deficit_round_robin():
+    layout = MLQLayout(levels=[
+        MLQLevelSpec("RR", ["REAL_TIME", "SYSTEM"], q=3, share=3),
+        MLQLevelSpec("ARR", ["INTERACTIVE"], q=2, share=2),
+        MLQLevelSpec("FAIR_SHARE", ["BATCH"], q=5, share=1),
+    ], drr_round=7)
+    assert_same_as_tick_by_tick(workload(8, mlq=True), 1, 3, SchedulerMode.MLQ, "MLQ", mlq=layout)
+
+
+@pytest.mark.parametrize("mlfq", [
+    MLFQConfig(boost_interval=40),
+    MLFQConfig(levels=[MLFQLevel("RR", 2, allotment=5), MLFQLevel("RR", 4, allotment=12), MLFQLevel("FCFS")], boost_interval=30),
+])
+def test_mlfq(mlfq):
+    assert_same_as_tick_by_tick(workload(9), 1, 3, SchedulerMode.STANDARD, "MLFQ", mlfq=mlfq)
+
+
+@pytest.mark.parametrize("rule", ["MEAN", "MEDIAN", "TARGET_LATENCY", "GROWING"])
+def test_adaptive_rr(rule):
+    assert_same_as_tick_by_tick(workload(10), 1, 2, SchedulerMode.STANDARD, "ARR", adaptive_rr=AdaptiveRRConfig(rule=rule))
+
+
+@pytest.mark.parametrize("algorithm", ["RR", "SRTF", "CFS"])
+def test_locks_memory_and_dvfs(algorithm):
+    data = workload(11)
+    rng = random.Random(11)
+    assert_same_as_tick_by_tick(
+        data, 2, 3, SchedulerMode.STANDARD, algorithm,
+        critical_sections=[[CriticalSection(rng.choice("ab"), 0, min(3, item[1]))] for item in data],
+        lts=LTSConfig(memory_capacity=128, allocator="BUDDY"),
+        mts=MTSConfig(),
+        memory_sizes=[rng.randint(1, 60) for _ in data],
+        dvfs=DVFSConfig([1, 2, 4], transition_latency=2, sampling_period=9),
+    )
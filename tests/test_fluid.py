@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from definitions import SchedulerMode
+from fluid import processor_sharing, processor_sharing_summary
+from main import Scheduler
+
+
+@pytest.mark.parametrize("data, overhead, expected", [
+    ([(0, 4), (0, 2)], 0.0, [6, 4]), # both at 1/2 until P1 is done at 4, P0 then runs alone
+    ([(0, 4), (2, 2)], 0.0, [6, 6]), # P0 has 2 left when P1 arrives, they finish together
+    ([(0, 4), (0, 2)], 0.5, [8, 6]), # shared: 1/3 each until 6, alone: no overhead
+])
+def test_processor_sharing(data, overhead, expected):
+    assert processor_sharing(data, overhead) == pytest.approx(expected)
+
+
+def test_lone_process_has_no_overhead():
+    assert processor_sharing([(3, 5)], overhead=2.0) == [8]
+    assert processor_sharing([(0, 2), (5, 3)], overhead=2.0) == [2, 8] # never shares the CPU either
+
+
+def test_negative_overhead():
+    with pytest.raises(ValueError):
+        processor_sharing([(0, 1)], overhead=-0.1)
+
+
+def test_rr_with_a_unit_quantum_is_close_to_ps():
+    rng = random.Random(1)
+    data = []
+    arrival = 0
+    for _ in range(200):
+        arrival += rng.randint(0, 24)
+        data.append((arrival, rng.randint(1, 20)))
+    scheduler = Scheduler([list(item) for item in data], 0, 1, SchedulerMode.STANDARD, verbose=False)
+    scheduler.RR()
+    ps = processor_sharing_summary(data)
+    assert scheduler.summarize().avg_turnaround_time == pytest.approx(ps.avg_turnaround_time, rel=0.1)
@@ -0,0 +1,37 @@
+from definitions import CriticalSection, LockConfig, SchedulerMode
+from main import Scheduler
+
+
+def run(data, algorithm, critical_sections, locks):
+    mode = SchedulerMode.MLQ if len(data[0]) > 2 else SchedulerMode.STANDARD
+    scheduler = Scheduler([list(x) for x in data], 0, 2, mode, critical_sections=critical_sections, locks=locks)
+    scheduler.all_algorithms[algorithm]()
+    return scheduler
+
+
+def lock_events(scheduler):
+    return [(log.start_time, log.pid, log.event_type) for log in scheduler.logs if log.event_type in ("PROCESS_BLOCKED", "PROCESS_UNBLOCKED")]
+
+
+def test_lock_is_handed_over_in_fifo_order():
+    # pid 0 is preempted inside its section, 1 and 2 block on it and get it in that order
+    scheduler = run([[0, 6], [0, 6], [0, 6]], "RR", [[CriticalSection("a", 0, 5)]] * 3, LockConfig(convoy_threshold=2))
+    assert lock_events(scheduler) == [(2, 1, "PROCESS_BLOCKED"), (2, 2, "PROCESS_BLOCKED"), (5, 1, "PROCESS_UNBLOCKED"), (11, 2, "PROCESS_UNBLOCKED")]
+    stats = scheduler.lock_stats["a"]
+    assert (stats.acquisitions, stats.contended, stats.max_waiters, stats.total_wait) == (3, 2, 2, 12)
+    assert stats.convoys == 1 # two waiters from 2 until the first hand-over
+
+
+def test_convoy_needs_the_threshold():
+    scheduler = run([[0, 6], [0, 6], [0, 6]], "RR", [[CriticalSection("a", 0, 5)]] * 3, LockConfig(convoy_threshold=3))
+    assert scheduler.lock_stats["a"].convoys == 0
+
+
+def test_priority_inheritance():
+    # BATCH holds the lock SYSTEM needs, INTERACTIVE arrives in between: without inheritance it runs first (inversion)
+    data = [[0, 10, "BATCH"], [2, 5, "SYSTEM"], [3, 50, "INTERACTIVE"]]
+    sections = [[CriticalSection("m", 0, 6)], [CriticalSection("m", 0, 2)], []]
+    inverted = run(data, "PRIORITY_P", sections, LockConfig())
+    inherited = run(data, "PRIORITY_P", sections, LockConfig(priority_inheritance=True))
+    assert [p.completion_time for p in inverted.processes] == [65, 61, 53]
+    assert [p.completion_time for p in inherited.processes] == [65, 11, 61]
@@ -0,0 +1,57 @@
+import pytest
+
+from definitions import LTSConfig, MTSConfig, SchedulerMode
+from main import Scheduler
+from memory import MemoryAllocator
+
+
+def run(allocator, sizes, data, algorithm="FCFS"):
+    scheduler = Scheduler([list(x) for x in data], 0, 2, SchedulerMode.STANDARD, lts=LTSConfig(memory_capacity=128, allocator=allocator), memory_sizes=sizes)
+    scheduler.all_algorithms[algorithm]()
+    return scheduler
+
+
+def test_buddy_rounding_is_not_fragmentation():
+    # 65 takes a 128 block: 40 more fit in the capacity, but not once rounded up, and no block is split
+    scheduler = run("BUDDY", [65, 40], [[0, 10], [1, 5]])
+    assert scheduler.admission_stalls > 0
+    assert scheduler.rounding_stalls == scheduler.admission_stalls
+    assert scheduler.fragmentation_stalls == 0
+
+
+def test_buddy_fragmentation():
+    # 32 | 32 | 32 | 32, the short first and third leave first (SPN): 64 free in two blocks that aren't buddies
+    data = [[0, 3], [0, 30], [0, 3], [0, 30], [1, 5]]
+    scheduler = run("BUDDY", [32, 32, 32, 32, 64], data, "SPN")
+    assert scheduler.fragmentation_stalls > 0
+    assert scheduler.rounding_stalls == 0
+
+
+def run_with_swapping(sizes, data, capacity):
+    scheduler = Scheduler([list(x) for x in data], 0, 2, SchedulerMode.STANDARD, lts=LTSConfig(memory_capacity=capacity), mts=MTSConfig(swap_cost=5), memory_sizes=sizes)
+    scheduler.FCFS()
+    return scheduler
+
+
+def test_no_swap_out_while_the_one_in_flight_is_enough():
+    # the head (60) needs 50 more: one 50 is enough, nothing else goes while its swap-out is in flight
+    scheduler = run_with_swapping([50, 10, 10, 50, 60], [[0, 10]] * 5, 130)
+    assert scheduler.swap_outs == 1
+    assert scheduler.processes[4].admission_time == 5
+
+
+def test_swapped_out_memory_is_kept_for_the_head():
+    # pid 1 is swapped out for pid 2: pid 2 gets the memory when the swap-out is done, pid 1 comes back after it
+    scheduler = run_with_swapping([40, 40, 50], [[0, 100], [0, 10], [1, 10]], 100)
+    assert scheduler.swap_outs == 1
+    assert scheduler.processes[2].admission_time == 6
+    assert scheduler.processes[2].completion_time < scheduler.processes[1].completion_time
+
+
+def test_allocator_without_its_strategy_cannot_be_created():
+    class NoStrategy(MemoryAllocator):
+        def largest_free_block(self):
+            return self.free_memory
+
+    with pytest.raises(TypeError):
+        NoStrategy(128)
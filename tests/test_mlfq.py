@@ -0,0 +1,22 @@
+import pytest
+
+from definitions import CriticalSection, MLFQConfig, MLFQLevel, SchedulerMode
+from main import Scheduler
+
+
+def first_slice_after_unblock(boost_interval):
+    # P0 takes the lock early and keeps it while it sinks to the FCFS level; P1 blocks on it at level 1 (q=4)
+    scheduler = Scheduler(
+        [[0, 20], [0, 10]], 0, 2, SchedulerMode.STANDARD,
+        mlfq=MLFQConfig(levels=[MLFQLevel("RR", 2), MLFQLevel("RR", 4), MLFQLevel("FCFS")], boost_interval=boost_interval),
+        critical_sections=[[CriticalSection("a", 1, 19)], [CriticalSection("a", 4, 1)]],
+    )
+    scheduler.MLFQ()
+    unblocked = next(log.start_time for log in scheduler.logs if log.pid == 1 and log.event_type == "PROCESS_UNBLOCKED")
+    return next(log.end_time - log.start_time for log in scheduler.logs if log.pid == 1 and log.event_type == "EXECUTING" and log.start_time >= unblocked)
+
+
+@pytest.mark.parametrize("boost_interval, expected", [(None, 4), (15, 2)])
+def test_boost_reaches_lock_waiters(boost_interval, expected):
+    # the boost at 15 happens while P1 is WAITING: it comes back at level 0 (q=2), not at its old level
+    assert first_slice_after_unblock(boost_interval) == expected
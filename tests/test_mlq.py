@@ -0,0 +1,51 @@
+import pytest
+
+from benchmark import compare_algorithms
+from definitions import MLQLayout, MLQLevelSpec, ProcessCategory, SchedulerMode
+from main import Scheduler
+
+
+def run(data, layout):
+    scheduler = Scheduler([list(x) for x in data], 0, 2, SchedulerMode.MLQ, mlq=layout)
+    scheduler.MLQ()
+    return scheduler
+
+
+def executing(scheduler):
+    return [(log.start_time, log.end_time, log.pid) for log in scheduler.logs if log.event_type == "EXECUTING"]
+
+
+def test_unknown_level_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        MLQLayout(levels=[MLQLevelSpec("RRR", ["BATCH"], q=2)])
+
+
+def test_alias_runs_at_its_level():
+    # SHELL is served by the top level: it preempts BATCH on arrival, with the built-in category it points to
+    layout = MLQLayout(levels=[
+        MLQLevelSpec("RR", ["INTERACTIVE", "SHELL"], q=4),
+        MLQLevelSpec("RR", ["BATCH"], q=100),
+    ], aliases={"SHELL": "INTERACTIVE"})
+    scheduler = run([[0, 20, "BATCH"], [5, 3, "SHELL"]], layout)
+    assert executing(scheduler) == [(0, 5, 0), (5, 8, 1), (8, 23, 0)]
+    assert scheduler.processes[1].category is ProcessCategory.INTERACTIVE
+
+
+def test_deficit_round_robin_shares():
+    # shares 3:1 of an 8-tick round: BATCH isn't starved by the higher level
+    layout = MLQLayout(levels=[
+        MLQLevelSpec("RR", ["SYSTEM"], q=4, share=3),
+        MLQLevelSpec("RR", ["BATCH"], q=4, share=1),
+    ], drr_round=8)
+    busy = {}
+    for start, end, pid in executing(run([[0, 500, "SYSTEM"], [0, 500, "BATCH"]], layout)):
+        if start < 400:
+            busy[pid] = busy.get(pid, 0) + min(end, 400) - start
+    assert busy == {0: 300, 1: 100}
+
+
+def test_compare_rejects_algorithms_without_categories(capsys):
+    # checked up front: nothing runs when one of the algorithms can't use the categories
+    with pytest.raises(ValueError):
+        compare_algorithms([[0, 3, "BATCH"], [1, 2, "INTERACTIVE"]], q=2, cs=0, algorithms=["MLQ", "FCFS"])
+    assert "Running Algorithm" not in capsys.readouterr().out
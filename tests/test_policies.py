@@ -0,0 +1,90 @@
+import pytest
+
+from definitions import AdaptiveRRConfig, CFS_WEIGHTS, FairShareConfig, PROPORTIONAL_SHARE_TICKETS, PreemptionConfig, PriorityConfig, ProcessCategory, SchedulerMode
+from main import Scheduler
+from policies import HeapQueue
+
+
+def run(data, algorithm, cs=0, q=2, **options):
+    mode = SchedulerMode.MLQ if len(data[0]) > 2 else SchedulerMode.STANDARD
+    scheduler = Scheduler([list(x) for x in data], cs, q, mode, **options)
+    scheduler.all_algorithms[algorithm]()
+    return scheduler
+
+
+def executing(scheduler):
+    return [(log.start_time, log.end_time, log.pid) for log in scheduler.logs if log.event_type == "EXECUTING"]
+
+
+def cpu_time(scheduler, until):
+    """pid -> EXECUTING ticks before `until`."""
+    busy = {}
+    for start, end, pid in executing(scheduler):
+        if min(end, until) > start:
+            busy[pid] = busy.get(pid, 0) + min(end, until) - start
+    return busy
+
+
+def test_cfs_share_follows_the_weights():
+    busy = cpu_time(run([[0, 1000, "BATCH"], [0, 1000, "SYSTEM"]], "CFS", q=4), 400)
+    weight_ratio = CFS_WEIGHTS[ProcessCategory.SYSTEM] / CFS_WEIGHTS[ProcessCategory.BATCH]
+    assert abs(busy[1] / busy[0] - weight_ratio) < 0.1 * weight_ratio
+
+
+def test_stride_follows_the_tickets_exactly():
+    # BATCH 100 tickets, SYSTEM 300: 1 tick in 4 for BATCH
+    assert cpu_time(run([[0, 1000, "BATCH"], [0, 1000, "SYSTEM"]], "STRIDE"), 400) == {0: 100, 1: 300}
+
+
+def test_lottery_follows_the_tickets_on_average():
+    busy = cpu_time(run([[0, 3000, "BATCH"], [0, 3000, "SYSTEM"]], "LOTTERY"), 2000)
+    ticket_ratio = PROPORTIONAL_SHARE_TICKETS[ProcessCategory.SYSTEM] / PROPORTIONAL_SHARE_TICKETS[ProcessCategory.BATCH]
+    assert abs(busy[1] / busy[0] - ticket_ratio) < 0.15 * ticket_ratio
+
+
+def test_heap_queue_needs_a_key():
+    with pytest.raises(TypeError):
+        HeapQueue()
+
+
+def test_edf_preempts_for_an_earlier_deadline():
+    # deadline 15 < 100: the newcomer preempts, deadline 150 > 100: it waits
+    assert executing(run([[0, 20, "BATCH", 100], [5, 5, "BATCH", 15]], "EDF")) == [(0, 5, 0), (5, 10, 1), (10, 25, 0)]
+    assert executing(run([[0, 20, "BATCH", 100], [5, 5, "BATCH", 150]], "EDF")) == [(0, 20, 0), (20, 25, 1)]
+
+
+def test_aging_overtakes_a_higher_priority():
+    # SYSTEM (64) and BATCH (0) wait while INTERACTIVE runs: BATCH has waited 70 ticks more, 0 + 80/1 > 64 + 10/1
+    data = [[0, 80, "INTERACTIVE"], [0, 5, "BATCH"], [70, 5, "SYSTEM"]]
+    scheduler = run(data, "PRIORITY", priority=PriorityConfig(aging_interval=1))
+    assert [pid for _, _, pid in executing(scheduler)] == [0, 1, 2]
+    assert [pid for _, _, pid in executing(run(data, "PRIORITY"))] == [0, 2, 1] # no aging: SYSTEM first
+
+
+def test_aging_preempts_without_an_arrival():
+    # INTERACTIVE (32) preempts BATCH at 1, BATCH waits from 1 and passes 32 at 34: nothing arrives then
+    scheduler = run([[0, 100, "BATCH"], [1, 100, "INTERACTIVE"]], "PRIORITY_P", priority=PriorityConfig(aging_interval=1))
+    assert executing(scheduler)[:3] == [(0, 1, 0), (1, 34, 1), (34, 36, 0)]
+
+
+def test_hysteresis_defers_a_small_gain():
+    # at 2 the running process has 11 left: a gain of 3 isn't worth 2 * cs, a gain of 8 is
+    preemption = PreemptionConfig(gain_factor=2)
+    assert executing(run([[0, 12], [2, 8]], "SRTF", cs=2, q=100, preemption=preemption)) == [(1, 13, 0), (15, 23, 1)]
+    assert executing(run([[0, 12], [2, 3]], "SRTF", cs=2, q=100, preemption=preemption))[:2] == [(1, 2, 0), (4, 7, 1)]
+    assert executing(run([[0, 12], [2, 8]], "SRTF", cs=2, q=100))[:2] == [(1, 2, 0), (4, 12, 1)] # without hysteresis
+
+
+def test_arr_quantum_tracks_the_median():
+    # median of the remaining bursts: 10 of (30, 10, 2), 10 of (20, 10, 2), then 2 of (20, 2), and at most 8q = 16
+    slices = [end - start for start, end, _ in executing(run([[0, 30], [0, 10], [0, 2]], "ARR", q=2))]
+    assert slices == [10, 10, 2, 16, 4]
+    assert executing(run([[0, 30], [0, 10], [0, 2]], "ARR", q=2, adaptive_rr=AdaptiveRRConfig(max_quantum=6)))[0] == (0, 6, 0)
+
+
+def test_fair_share_splits_by_group_not_by_process():
+    # alice has one process, bob three: equal weights give alice half the CPU, weight 3 gives her three quarters
+    data = [[0, 500, "BATCH", None, "alice"]] + [[0, 500, "BATCH", None, "bob"]] * 3
+    assert cpu_time(run(data, "FAIR_SHARE"), 400)[0] == 200
+    alice = cpu_time(run(data, "FAIR_SHARE", fair_share=FairShareConfig(weights={"alice": 3})), 400)[0]
+    assert abs(alice - 300) <= 15
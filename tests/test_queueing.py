@@ -0,0 +1,42 @@
+import math
+
+import pytest
+
+from queueing import estimate, fit_workload, mg1, mg1_ps, mg1_srpt, mm1, relative_error
+
+
+def test_hand_computed_fit():
+    # three unit bursts 10 ticks apart: lambda = 0.1, E[S] = E[S^2] = 1, rho = 0.1
+    fit = fit_workload([(0, 1), (10, 1), (20, 1)])
+    assert fit.arrival_rate == pytest.approx(0.1)
+    assert fit.utilization == pytest.approx(0.1)
+    assert mm1(fit).avg_wait_time == pytest.approx(1 / 9) # rho E[S] / (1 - rho)
+    assert mg1(fit).avg_wait_time == pytest.approx(1 / 18) # lambda E[S^2] / (2 (1 - rho))
+    assert mg1(fit).avg_turnaround_time == pytest.approx(1 + 1 / 18)
+
+
+@pytest.mark.parametrize("data", [
+    [(0, 10), (5, 10), (10, 10)], # rho = 2
+    [(0, 5), (5, 5)], # rho = 1
+    [(0, 3)], # a single process: infinite arrival rate
+])
+def test_unstable_models(data):
+    fit = fit_workload(data)
+    assert fit.utilization >= 1
+    for model in (mm1, mg1, mg1_srpt, mg1_ps):
+        prediction = model(fit)
+        assert prediction.avg_wait_time == prediction.avg_turnaround_time == math.inf
+
+
+def test_srpt_beats_ps_and_fcfs():
+    data = [(t, size) for t, size in zip(range(0, 200, 10), [1, 12, 2, 3, 9, 1, 4, 15, 2, 1] * 2)] # rho = 0.5
+    _, fcfs, srpt, ps = estimate(data) # FCFS: Pollaczek-Khinchine
+    assert srpt.avg_turnaround_time <= ps.avg_turnaround_time
+    assert srpt.avg_turnaround_time <= fcfs.avg_turnaround_time
+
+
+def test_no_response_time_for_ps():
+    ps = estimate([(0, 1), (10, 1), (20, 1)])[3]
+    assert ps.avg_response_time is None
+    assert relative_error(ps.avg_response_time, 5.0) is None
+    assert relative_error(ps.avg_turnaround_time, ps.avg_turnaround_time) == 0
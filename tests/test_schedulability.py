@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+from definitions import MLQLayout, MLQLevelSpec, PeriodicTask, SchedulerMode
+from main import Scheduler
+from schedulability import liu_layland_bound, periodic_tasks_from_input, rate_monotonic_order, rate_monotonic_test, response_time
+
+
+def test_liu_layland_bound():
+    assert liu_layland_bound(1) == 1
+    assert liu_layland_bound(3) == pytest.approx(0.7798, abs=1e-4)
+    assert liu_layland_bound(10 ** 6) == pytest.approx(math.log(2), abs=1e-6)
+
+
+def test_over_the_bound_but_schedulable():
+    # U = 1/4 + 2/6 + 3/12 = 0.83 > 0.78, exact analysis: R = 1, 3, 10 within 4, 6, 12
+    tasks = [PeriodicTask(3, 12), PeriodicTask(1, 4), PeriodicTask(2, 6)]
+    assert rate_monotonic_order(tasks) == [1, 2, 0]
+    assert response_time(tasks[0], [tasks[1], tasks[2]]) == 10
+    report = rate_monotonic_test(tasks)
+    assert not report.passes_utilization_bound
+    assert report.response_times == [10, 1, 3]
+    assert report.schedulable
+
+
+def test_unschedulable():
+    # U = 1, but (5, 10) sees (4, 8) twice before it's done: R = 13 > 10
+    report = rate_monotonic_test([PeriodicTask(4, 8), PeriodicTask(5, 10)])
+    assert report.response_times == [4, None]
+    assert not report.schedulable
+    assert rate_monotonic_test([PeriodicTask(3, 4), PeriodicTask(3, 6)]).response_times == [None, None] # U > 1: not analysed
+
+
+def test_periodic_tasks_from_input():
+    # no deadline or not REAL_TIME: not a periodic task
+    data = [[0, 2, "REAL_TIME", 10], [0, 2, "REAL_TIME", None], [0, 2, "BATCH", 10], [5, 3, "REAL_TIME"]]
+    assert periodic_tasks_from_input(data) == [PeriodicTask(2, 10, pid=0)]
+    assert periodic_tasks_from_input([[0, 2], [1, 3]]) == []
+    with pytest.raises(ValueError): # the deadline must come after the arrival
+        periodic_tasks_from_input([[4, 2, "REAL_TIME", 4]])
+
+
+def test_aliases_of_real_time_are_checked():
+    # (C=4, T=8) alone is schedulable, the alias (C=5, T=10) misses its deadline next to it
+    layout = MLQLayout(levels=[
+        MLQLevelSpec("EDF", ["REAL_TIME", "CONTROL"]),
+        MLQLevelSpec("FCFS", ["BATCH"]),
+    ], aliases={"CONTROL": "REAL_TIME"})
+    data = [[0, 4, "REAL_TIME", 8], [0, 5, "CONTROL", 10], [0, 50, "BATCH", None]]
+    report = Scheduler(data, 0, 2, SchedulerMode.MLQ, mlq=layout).real_time_schedulability()
+    assert report.response_times == [4, None]
+    assert not report.schedulable
@@ -0,0 +1,35 @@
+import pytest
+
+from helpers import workload
+from definitions import DVFSConfig, MLFQConfig, SchedulerMode
+from main import Scheduler
+
+
+def independent_run(data, cs, q, mode, algorithm, **options):
+    scheduler = Scheduler([list(x) for x in data], cs, q, mode, **options)
+    scheduler.all_algorithms[algorithm]()
+    return scheduler
+
+
+@pytest.mark.parametrize("algorithm", ["RR", "MLFQ"])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_sweep_quantum_matches_independent_runs(algorithm, seed):
+    data = workload(seed, max_arrival=80, max_burst=15)
+    quanta = [4, 1, 7, 2, 4, 30]
+    sweep = Scheduler([list(x) for x in data], 1, 3, SchedulerMode.STANDARD).sweep_quantum(quanta, algorithm)
+    assert [q for q, _ in sweep] == quanta
+    for q, summary in sweep:
+        assert summary == independent_run(data, 1, q, SchedulerMode.STANDARD, algorithm).summarize(), q
+
+
+@pytest.mark.parametrize("options", [
+    dict(mlfq=MLFQConfig(boost_interval=25)),
+    dict(dvfs=DVFSConfig([1, 2, 4], sampling_period=8)),
+    dict(dvfs=DVFSConfig([1, 2, 4])), # sampling period from q: no shared prefix
+])
+def test_sweep_quantum_with_options(options):
+    data = workload(4, max_arrival=80, max_burst=15)
+    algorithm = "MLFQ" if "mlfq" in options else "RR"
+    sweep = Scheduler([list(x) for x in data], 2, 3, SchedulerMode.STANDARD, **options).sweep_quantum([1, 3, 5], algorithm)
+    for q, summary in sweep:
+        assert summary == independent_run(data, 2, q, SchedulerMode.STANDARD, algorithm, **options).summarize(), q
@@ -0,0 +1,31 @@
+from definitions import SchedulerMode
+from main import Scheduler
+from tuner import mlfq_topologies, sweep_quantum, tune_mlfq
+
+WORKLOAD = [[0, 9], [1, 2], [2, 14], [4, 1], [7, 3], [9, 6], [12, 2], [15, 11], [18, 1], [21, 4]]
+
+
+def test_tune_mlfq_ranks_every_candidate(capsys):
+    results = tune_mlfq(WORKLOAD, q=2, cs=2, report=False)
+    assert capsys.readouterr().out == ""
+    assert len(results) == len(mlfq_topologies(2))
+    keys = [(summary.p95_response_time, summary.avg_turnaround_time) for _, summary in results]
+    assert keys == sorted(keys)
+
+    # the fast-forwarded, reused scheduler ranks the winner with the summary of a plain run
+    best, summary = results[0]
+    plain = Scheduler(WORKLOAD, 2, 2, SchedulerMode.STANDARD, mlfq=best, fast_forward=False, verbose=False)
+    plain.MLFQ()
+    assert plain.summarize() == summary
+
+
+def test_tune_mlfq_keeps_given_candidates():
+    candidates = mlfq_topologies(2, max_levels=2)
+    results = tune_mlfq(WORKLOAD, q=2, cs=2, candidates=candidates, report=False)
+    assert sorted(map(id, (config for config, _ in results))) == sorted(map(id, candidates))
+
+
+def test_sweep_quantum_report_is_optional(capsys):
+    results = sweep_quantum(WORKLOAD, quanta=[1, 2, 4], cs=2, report=False)
+    assert capsys.readouterr().out == ""
+    assert [q for q, _ in results] == [1, 2, 4]
@@ -0,0 +1,106 @@
+import time
+from typing import List, Optional, Tuple
+
+from definitions import (
+    InputList, MLFQConfig, MLFQLevel, STSAlgo, SimulationSummary,
+    validate_input_and_determine_scheduler_mode, scale_input_time
+)
+from main import Scheduler
+
+# Searches MLFQ topologies (level count, per-level algorithm and quantum, boost) against a target workload.
+## Every candidate is simulated with the fast-forwarding engine on the same scaled input, the best shape is the one
+## with the lowest p95 response time (ties: lower average turnaround time).
+## Usage: tune_mlfq(workload, q, cs) from your own script, or python tuner.py (random workload).
+## sweep_quantum(workload, quanta, cs) runs RR/MLFQ once per quantum, forking the runs where they stop being identical.
+
+
+def mlfq_topologies(q: int, max_levels: int = 5) -> List[MLFQConfig]:
+    """
+    Default search space (quanta in ticks): 2..max_levels levels, top quantum q/2, q, 2q or 4q,
+    growing x1 or x2 per level, bottom level FCFS or RR, no boost or a boost every 50 top quanta.
+    """
+    candidates: List[MLFQConfig] = []
+    for base in sorted({max(1, q // 2), q, 2 * q, 4 * q}):
+        for growth in (1, 2):
+            for n_levels in range(2, max_levels + 1):
+                for bottom in ("FCFS", "RR"):
+                    levels = [MLFQLevel("RR", base * growth ** i) for i in range(n_levels - 1)]
+                    levels.append(MLFQLevel("FCFS") if bottom == "FCFS" else MLFQLevel("RR", base * growth ** (n_levels - 1)))
+                    for boost_interval in (None, 50 * base):
+                        candidates.append(MLFQConfig(levels=levels, boost_interval=boost_interval))
+    return candidates
+
+
+def describe_topology(config: MLFQConfig, time_scale: int = 1) -> str:
+    levels = " > ".join(f"RR({level.q / time_scale:g})" if level.algo == "RR" else "FCFS" for level in config.levels)
+    boost = f", boost every {config.boost_interval / time_scale:g}" if config.boost_interval is not None else ""
+    return levels + boost
+
+
+def tune_mlfq(input_list: InputList, q: float, cs: float, candidates: Optional[List[MLFQConfig]] = None, top: int = 5, report: bool = True, **scheduler_options) -> List[Tuple[MLFQConfig, SimulationSummary]]:
+    """
+    Runs MLFQ with every candidate topology (quanta in ticks, None: mlfq_topologies) on the same input.
+    Returns (topology, summary) for all of them, best first, and prints the top ones if report.
+    scheduler_options are passed to the Scheduler (lts, mts, ...).
+    """
+    scheduler_mode = validate_input_and_determine_scheduler_mode(data_list=input_list, q=q, cs=cs)
+    (data_list_scaled, q_scaled, cs_scaled, time_scale) = scale_input_time(data_list=input_list, q=q, cs=cs, scheduler_mode=scheduler_mode, max_precision=4, verbose=report)
+    scheduler = Scheduler(data_list_scaled, cs_scaled, q_scaled, scheduler_mode, time_scale=time_scale, fast_forward=True, verbose=report, **scheduler_options)
+    if candidates is None:
+        candidates = mlfq_topologies(q_scaled)
+
+    started = time.perf_counter()
+    results: List[Tuple[MLFQConfig, SimulationSummary]] = []
+    for config in candidates:
+        scheduler.mlfq = config
+        scheduler.MLFQ()
+        results.append((config, scheduler.summarize()))
+    elapsed = time.perf_counter() - started
+    results.sort(key=lambda result: (result[1].p95_response_time, result[1].avg_turnaround_time))
+    if not report:
+        return results
+
+    print(f"\n{'='*30} MLFQ TOPOLOGY SEARCH ({len(candidates)} candidates, {elapsed:.2f}s) {'='*30}")
+    print(f"{'P95 RT':<9} {'AVG RT':<9} {'AVG TAT':<9} {'CS':<7} TOPOLOGY")
+    print("-" * 80)
+    for config, summary in results[:top]:
+        print(f"{summary.p95_response_time / time_scale:<9g} {summary.avg_response_time / time_scale:<9.2f} {summary.avg_turnaround_time / time_scale:<9.2f} {summary.context_switches:<7} {describe_topology(config, time_scale)}")
+    return results
+
+
+def sweep_quantum(input_list: InputList, quanta: List[float], cs: float, algorithm: STSAlgo = "RR", report: bool = True, **scheduler_options) -> List[Tuple[float, SimulationSummary]]:
+    """
+    Runs RR (or MLFQ with the default topology) once per quantum, sharing the prefix the runs have in common
+    (see Scheduler.sweep_quantum). Returns (quantum, summary) in the order of quanta, times in the summary are in ticks,
+    and prints them as a table if report.
+    """
+    finest = max(quanta, key=lambda q: len(f"{q:g}".partition(".")[2])) # scales every quantum to whole ticks
+    scheduler_mode = validate_input_and_determine_scheduler_mode(data_list=input_list, q=finest, cs=cs)
+    (data_list_scaled, q_scaled, cs_scaled, time_scale) = scale_input_time(data_list=input_list, q=finest, cs=cs, scheduler_mode=scheduler_mode, max_precision=4, verbose=report)
+    scheduler = Scheduler(data_list_scaled, cs_scaled, q_scaled, scheduler_mode, time_scale=time_scale, verbose=report, **scheduler_options)
+
+    started = time.perf_counter()
+    swept = scheduler.sweep_quantum([int(round(q * time_scale)) for q in quanta], algorithm)
+    elapsed = time.perf_counter() - started
+    results = [(q, summary) for q, (_, summary) in zip(quanta, swept)]
+    if not report:
+        return results
+
+    print(f"\n{'='*30} {algorithm} QUANTUM SWEEP ({len(quanta)} quanta, {elapsed:.2f}s) {'='*30}")
+    print(f"{'Q':<7} {'P95 RT':<9} {'AVG RT':<9} {'AVG TAT':<9} {'CS':<7} {'CS OVH':<8}")
+    print("-" * 52)
+    for q, summary in results:
+        print(f"{q:<7g} {summary.p95_response_time / time_scale:<9g} {summary.avg_response_time / time_scale:<9.2f} {summary.avg_turnaround_time / time_scale:<9.2f} {summary.context_switches:<7} {summary.cs_overhead:<8.2%}")
+    return results
+
+
+if __name__ == "__main__":
+    import random
+    rng = random.Random(7)
+    workload: InputList = []
+    arrival = 0
+    for _ in range(300):
+        arrival += rng.randint(0, 24)
+        workload.append([arrival, rng.randint(1, 3) if rng.random() < 0.8 else rng.randint(20, 60)]) # mostly interactive, some CPU-bound bursts
+    tune_mlfq(workload, q=4, cs=1)
+    sweep_quantum(workload, quanta=[2, 4, 8, 16, 32, 64], cs=1)